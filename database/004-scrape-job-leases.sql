@@ -0,0 +1,13 @@
+-- Migration: Scrape job leases
+-- Run this on the foreclosure-leads-db Supabase instance, then re-run
+-- schema-scraping.sql to pick up the lease-aware claim functions.
+
+-- Lease columns: workers renew them via heartbeat, the scheduler reaps expired ones
+ALTER TABLE scrape_jobs
+  ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMPTZ,
+  ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMPTZ;
+
+-- Index for the stale-job reaper
+CREATE INDEX IF NOT EXISTS idx_scrape_jobs_lease
+  ON scrape_jobs(lease_expires_at)
+  WHERE status = 'running';
@@ -0,0 +1,7 @@
+-- Migration: Staggered scrape jobs
+-- Run this on the foreclosure-leads-db Supabase instance, then re-run
+-- schema-scraping.sql so the claim functions honour scheduled_for.
+
+-- Jobs are not claimable before scheduled_for (used by the nationwide fan-out)
+ALTER TABLE scrape_jobs
+  ADD COLUMN IF NOT EXISTS scheduled_for TIMESTAMPTZ;
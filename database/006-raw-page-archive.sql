@@ -0,0 +1,26 @@
+-- Migration: Compressed raw-page archive
+-- Run this on the foreclosure-leads-db Supabase instance
+
+-- Page bodies, zstd-compressed and stored once per distinct SHA-256
+CREATE TABLE IF NOT EXISTS raw_page_blobs (
+    content_sha256 TEXT PRIMARY KEY,
+    compression TEXT NOT NULL DEFAULT 'zstd',
+    size_bytes INTEGER NOT NULL,
+    compressed_bytes INTEGER NOT NULL,
+    storage TEXT NOT NULL CHECK (storage IN ('db', 'segment')),
+    data BYTEA,
+    segment TEXT,
+    segment_offset BIGINT,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Each fetch links its job to the archived body
+ALTER TABLE raw_scraped_data
+  ADD COLUMN IF NOT EXISTS content_sha256 TEXT REFERENCES raw_page_blobs(content_sha256),
+  ADD COLUMN IF NOT EXISTS content_type TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_raw_data_source
+  ON raw_scraped_data(source_id, created_at);
+
+CREATE INDEX IF NOT EXISTS idx_raw_data_job
+  ON raw_scraped_data(job_id);
@@ -0,0 +1,13 @@
+-- Migration: Page fingerprints for conditional re-fetch
+-- Run this on the foreclosure-leads-db Supabase instance
+
+-- ETag / Last-Modified / normalized content hash from each URL's last successful scrape
+CREATE TABLE IF NOT EXISTS page_fingerprints (
+    url TEXT PRIMARY KEY,
+    source TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT,
+    checked_at TIMESTAMPTZ DEFAULT NOW(),
+    changed_at TIMESTAMPTZ DEFAULT NOW()
+);
@@ -0,0 +1,23 @@
+-- Migration: Per-phase scrape job timings
+-- Run this on the foreclosure-leads-db Supabase instance, then re-run
+-- schema-scraping.sql so get_next_scrape_jobs returns queue_wait_seconds.
+
+-- Seconds spent in each phase (queue_wait, navigation, parse, persist, ...)
+ALTER TABLE scrape_jobs
+  ADD COLUMN IF NOT EXISTS timings JSONB;
+
+-- p50/p95 seconds per source (county jobs per state) and job phase over the last 7 days
+CREATE OR REPLACE VIEW scrape_phase_timings AS
+SELECT
+    COALESCE(s.name, 'county:' || j.state_abbr) as source_name,
+    t.phase,
+    COUNT(*) as jobs,
+    percentile_cont(0.5) WITHIN GROUP (ORDER BY t.seconds::DOUBLE PRECISION) as p50_seconds,
+    percentile_cont(0.95) WITHIN GROUP (ORDER BY t.seconds::DOUBLE PRECISION) as p95_seconds
+FROM scrape_jobs j
+LEFT JOIN scrape_sources s ON j.source_id = s.id
+CROSS JOIN LATERAL jsonb_each_text(j.timings) AS t(phase, seconds)
+WHERE j.timings IS NOT NULL
+AND j.created_at > NOW() - INTERVAL '7 days'
+GROUP BY 1, t.phase
+ORDER BY 1, t.phase;
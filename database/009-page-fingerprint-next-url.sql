@@ -0,0 +1,13 @@
+-- Migration: Next-page link on page fingerprints
+-- Run this on the foreclosure-leads-db Supabase instance
+
+-- A 304 has no body to read the next-page link from, so paginated pages keep it here
+ALTER TABLE page_fingerprints
+  ADD COLUMN IF NOT EXISTS next_url TEXT;
+
+-- Existing rows have no link saved yet; drop their validators so the next run
+-- reads each page in full and records it, instead of stopping at the first 304.
+-- Content hashes are kept, so unchanged pages still skip parsing.
+UPDATE page_fingerprints
+SET etag = NULL, last_modified = NULL
+WHERE next_url IS NULL;
@@ -83,6 +83,7 @@ CREATE TABLE IF NOT EXISTS scrape_jobs (
 
     -- Parameters
     params JSONB DEFAULT '{}', -- date range, filters, etc.
+    scheduled_for TIMESTAMPTZ, -- not claimable before this time (staggered fan-out)
 
     -- Status
     status TEXT DEFAULT 'pending' CHECK (status IN ('pending', 'running', 'completed', 'failed', 'cancelled')),
@@ -90,12 +91,17 @@ CREATE TABLE IF NOT EXISTS scrape_jobs (
     started_at TIMESTAMPTZ,
     completed_at TIMESTAMPTZ,
 
+    -- Lease (renewed by the owning worker's heartbeat; expired leases are reaped)
+    lease_expires_at TIMESTAMPTZ,
+    heartbeat_at TIMESTAMPTZ,
+
     -- Results
     leads_found INTEGER DEFAULT 0,
     leads_new INTEGER DEFAULT 0,
     leads_updated INTEGER DEFAULT 0,
     error_message TEXT,
     error_details JSONB,
+    timings JSONB, -- seconds per phase: {"queue_wait": 1.2, "navigation": 8.4, ...}
 
     -- Retry logic
     attempt_number INTEGER DEFAULT 1,
@@ -151,6 +157,22 @@ CREATE TABLE IF NOT EXISTS proxy_pool (
     created_at TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- Archived page bodies: zstd-compressed, stored once per distinct SHA-256
+CREATE TABLE IF NOT EXISTS raw_page_blobs (
+    content_sha256 TEXT PRIMARY KEY, -- hex digest of the uncompressed body
+    compression TEXT NOT NULL DEFAULT 'zstd',
+    size_bytes INTEGER NOT NULL,
+    compressed_bytes INTEGER NOT NULL,
+
+    -- Either inline (storage = 'db') or in a local segment file (storage = 'segment')
+    storage TEXT NOT NULL CHECK (storage IN ('db', 'segment')),
+    data BYTEA,
+    segment TEXT,
+    segment_offset BIGINT,
+
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
 -- Raw scraped data (before normalization)
 CREATE TABLE IF NOT EXISTS raw_scraped_data (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -162,6 +184,10 @@ CREATE TABLE IF NOT EXISTS raw_scraped_data (
     raw_json JSONB,
     page_url TEXT,
 
+    -- Archived page body (one row per fetch; identical bodies share a blob)
+    content_sha256 TEXT REFERENCES raw_page_blobs(content_sha256),
+    content_type TEXT, -- html, json
+
     -- Extracted data (pre-normalization)
     extracted_data JSONB,
 
@@ -173,13 +199,29 @@ CREATE TABLE IF NOT EXISTS raw_scraped_data (
     created_at TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- Last successful fetch of each listing page, for conditional re-fetch
+CREATE TABLE IF NOT EXISTS page_fingerprints (
+    url TEXT PRIMARY KEY,
+    source TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT, -- SHA-256 of the page with scripts, tokens and whitespace normalized away
+    next_url TEXT, -- next-page link on paginated pages, followed when the page returns 304
+    checked_at TIMESTAMPTZ DEFAULT NOW(),
+    changed_at TIMESTAMPTZ DEFAULT NOW()
+);
+
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_counties_state ON counties(state_abbr);
 CREATE INDEX IF NOT EXISTS idx_counties_next_scrape ON counties(next_scheduled_scrape) WHERE is_active = TRUE;
 CREATE INDEX IF NOT EXISTS idx_scrape_jobs_status ON scrape_jobs(status);
 CREATE INDEX IF NOT EXISTS idx_scrape_jobs_priority ON scrape_jobs(priority, created_at) WHERE status = 'pending';
 CREATE INDEX IF NOT EXISTS idx_scrape_jobs_source ON scrape_jobs(source_id);
+CREATE INDEX IF NOT EXISTS idx_scrape_jobs_county_active ON scrape_jobs(county_id) WHERE status IN ('pending', 'running');
+CREATE INDEX IF NOT EXISTS idx_scrape_jobs_lease ON scrape_jobs(lease_expires_at) WHERE status = 'running';
 CREATE INDEX IF NOT EXISTS idx_raw_data_unprocessed ON raw_scraped_data(created_at) WHERE is_processed = FALSE;
+CREATE INDEX IF NOT EXISTS idx_raw_data_source ON raw_scraped_data(source_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_raw_data_job ON raw_scraped_data(job_id);
 CREATE INDEX IF NOT EXISTS idx_email_requests_status ON email_requests(status);
 
 -- Function to get next scrape job
@@ -192,11 +234,14 @@ BEGIN
     UPDATE scrape_jobs
     SET status = 'running',
         worker_id = p_worker_id,
-        started_at = NOW()
+        started_at = NOW(),
+        heartbeat_at = NOW(),
+        lease_expires_at = NOW() + INTERVAL '5 minutes'
     WHERE id = (
         SELECT id FROM scrape_jobs
         WHERE status = 'pending'
         AND (next_retry_at IS NULL OR next_retry_at <= NOW())
+        AND (scheduled_for IS NULL OR scheduled_for <= NOW())
         ORDER BY priority ASC, created_at ASC
         FOR UPDATE SKIP LOCKED
         LIMIT 1
@@ -207,6 +252,98 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Function to claim up to p_limit scrape jobs in one round-trip.
+-- Returns each claimed job joined with its source and county so workers
+-- don't need a follow-up lookup. Claimed jobs are leased for p_lease_seconds.
+-- queue_wait_seconds is how long each job sat claimable before this claim.
+DROP FUNCTION IF EXISTS get_next_scrape_jobs(TEXT, INTEGER);
+DROP FUNCTION IF EXISTS get_next_scrape_jobs(TEXT, INTEGER, INTEGER);
+CREATE OR REPLACE FUNCTION get_next_scrape_jobs(
+    p_worker_id TEXT,
+    p_limit INTEGER,
+    p_lease_seconds INTEGER DEFAULT 300
+)
+RETURNS TABLE (
+    id UUID,
+    source_id UUID,
+    county_id UUID,
+    state_abbr TEXT,
+    job_type TEXT,
+    priority INTEGER,
+    params JSONB,
+    attempt_number INTEGER,
+    max_attempts INTEGER,
+    created_at TIMESTAMPTZ,
+    scraper_class TEXT,
+    source_name TEXT,
+    county_name TEXT,
+    queue_wait_seconds DOUBLE PRECISION
+) AS $$
+#variable_conflict use_column
+BEGIN
+    RETURN QUERY
+    WITH claimed AS (
+        UPDATE scrape_jobs j
+        SET status = 'running',
+            worker_id = p_worker_id,
+            started_at = NOW(),
+            heartbeat_at = NOW(),
+            lease_expires_at = NOW() + make_interval(secs => p_lease_seconds)
+        WHERE j.id IN (
+            SELECT q.id FROM scrape_jobs q
+            WHERE q.status = 'pending'
+            AND (q.next_retry_at IS NULL OR q.next_retry_at <= NOW())
+            AND (q.scheduled_for IS NULL OR q.scheduled_for <= NOW())
+            ORDER BY q.priority ASC, q.created_at ASC
+            FOR UPDATE SKIP LOCKED
+            LIMIT p_limit
+        )
+        RETURNING j.*
+    )
+    SELECT c.id, c.source_id, c.county_id, c.state_abbr, c.job_type,
+           c.priority, c.params, c.attempt_number, c.max_attempts, c.created_at,
+           s.scraper_class, s.name, co.name,
+           EXTRACT(EPOCH FROM NOW() - GREATEST(c.created_at, c.scheduled_for, c.next_retry_at))::DOUBLE PRECISION
+    FROM claimed c
+    LEFT JOIN scrape_sources s ON c.source_id = s.id
+    LEFT JOIN counties co ON c.county_id = co.id
+    ORDER BY c.priority ASC, c.created_at ASC;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Wake idle workers when a job becomes claimable (new job or requeued retry).
+-- Jobs deferred by scheduled_for / next_retry_at don't notify; workers sleep
+-- until the earliest of those instead (see next_scrape_job_due_in).
+-- The payload is constant so Postgres collapses a bulk insert into one notification.
+CREATE OR REPLACE FUNCTION notify_scrape_job_pending()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF (TG_OP = 'INSERT' OR OLD.status IS DISTINCT FROM 'pending')
+       AND (NEW.scheduled_for IS NULL OR NEW.scheduled_for <= NOW())
+       AND (NEW.next_retry_at IS NULL OR NEW.next_retry_at <= NOW()) THEN
+        PERFORM pg_notify('scrape_jobs_pending', '');
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_scrape_jobs_notify ON scrape_jobs;
+CREATE TRIGGER trg_scrape_jobs_notify
+    AFTER INSERT OR UPDATE OF status ON scrape_jobs
+    FOR EACH ROW
+    WHEN (NEW.status = 'pending')
+    EXECUTE FUNCTION notify_scrape_job_pending();
+
+-- Seconds until the earliest deferred pending job becomes claimable, or NULL
+-- if none is waiting. Idle workers and the dispatcher sleep at most this long.
+CREATE OR REPLACE FUNCTION next_scrape_job_due_in()
+RETURNS DOUBLE PRECISION AS $$
+    SELECT EXTRACT(EPOCH FROM MIN(GREATEST(scheduled_for, next_retry_at)) - NOW())::DOUBLE PRECISION
+    FROM scrape_jobs
+    WHERE status = 'pending'
+      AND GREATEST(scheduled_for, next_retry_at) > NOW();
+$$ LANGUAGE sql STABLE;
+
 -- Function to schedule next scrape for a county
 CREATE OR REPLACE FUNCTION schedule_county_scrape(p_county_id UUID)
 RETURNS UUID AS $$
@@ -235,6 +372,50 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Function to schedule every due county in one statement.
+-- Skips counties that already have a pending/running job and advances
+-- next_scheduled_scrape for the rest. Returns the number of jobs created.
+CREATE OR REPLACE FUNCTION schedule_due_county_scrapes()
+RETURNS INTEGER AS $$
+DECLARE
+    v_count INTEGER;
+BEGIN
+    WITH due AS (
+        SELECT c.id, c.state_abbr, c.consecutive_failures
+        FROM counties c
+        WHERE c.is_active = TRUE
+          AND c.has_online_records = TRUE
+          AND (c.next_scheduled_scrape IS NULL OR c.next_scheduled_scrape <= NOW())
+          AND c.consecutive_failures < 5
+          AND NOT EXISTS (
+              SELECT 1 FROM scrape_jobs j
+              WHERE j.county_id = c.id
+                AND j.status IN ('pending', 'running')
+          )
+        FOR UPDATE OF c SKIP LOCKED
+    ),
+    rescheduled AS (
+        UPDATE counties c
+        SET next_scheduled_scrape = NOW() + (c.scrape_frequency_hours || ' hours')::INTERVAL
+        FROM due
+        WHERE c.id = due.id
+    ),
+    inserted AS (
+        INSERT INTO scrape_jobs (county_id, state_abbr, job_type, priority)
+        SELECT
+            due.id,
+            due.state_abbr,
+            'scheduled',
+            CASE WHEN due.consecutive_failures > 0 THEN 8 ELSE 5 END
+        FROM due
+        RETURNING 1
+    )
+    SELECT COUNT(*) INTO v_count FROM inserted;
+
+    RETURN v_count;
+END;
+$$ LANGUAGE plpgsql;
+
 -- View for scraping dashboard
 CREATE OR REPLACE VIEW scraping_dashboard AS
 SELECT
@@ -253,3 +434,19 @@ LEFT JOIN counties c ON s.state_abbr = c.state_abbr
 LEFT JOIN scrape_jobs j ON c.id = j.county_id
 GROUP BY s.state_abbr, s.state_name
 ORDER BY s.state_name;
+
+-- p50/p95 seconds per source (county jobs per state) and job phase over the last 7 days
+CREATE OR REPLACE VIEW scrape_phase_timings AS
+SELECT
+    COALESCE(s.name, 'county:' || j.state_abbr) as source_name,
+    t.phase,
+    COUNT(*) as jobs,
+    percentile_cont(0.5) WITHIN GROUP (ORDER BY t.seconds::DOUBLE PRECISION) as p50_seconds,
+    percentile_cont(0.95) WITHIN GROUP (ORDER BY t.seconds::DOUBLE PRECISION) as p95_seconds
+FROM scrape_jobs j
+LEFT JOIN scrape_sources s ON j.source_id = s.id
+CROSS JOIN LATERAL jsonb_each_text(j.timings) AS t(phase, seconds)
+WHERE j.timings IS NOT NULL
+AND j.created_at > NOW() - INTERVAL '7 days'
+GROUP BY 1, t.phase
+ORDER BY 1, t.phase;
@@ -38,6 +38,13 @@ class RedisConfig:
     password: Optional[str] = os.getenv("REDIS_PASSWORD")
     db: int = int(os.getenv("REDIS_DB", "0"))
 
+    # Job queue (used when QUEUE_BACKEND=redis)
+    job_stream: str = os.getenv("REDIS_JOB_STREAM", "scrape_jobs")
+    job_group: str = os.getenv("REDIS_JOB_GROUP", "scrape_workers")
+    stream_max_backlog: int = int(os.getenv("REDIS_STREAM_MAX_BACKLOG", "200"))
+    dispatch_lease_seconds: int = 3600  # Postgres lease of jobs in the stream, renewed by the dispatcher
+    audit_flush_interval: float = 5.0  # seconds between batched scrape_jobs writes
+
     @property
     def url(self) -> str:
         if self.password:
@@ -52,14 +59,31 @@ class ScraperConfig:
     max_concurrent_jobs: int = int(os.getenv("MAX_CONCURRENT_JOBS", "10"))
     max_concurrent_requests: int = int(os.getenv("MAX_CONCURRENT_REQUESTS", "5"))
 
+    # Queue backend: "postgres" (claim from scrape_jobs) or "redis" (Redis Streams)
+    queue_backend: str = os.getenv("QUEUE_BACKEND", "postgres")
+
+    # Queue wakeup: workers LISTEN for new jobs and only poll as a safety net
+    queue_notify_channel: str = "scrape_jobs_pending"
+    queue_poll_interval: int = int(os.getenv("QUEUE_POLL_INTERVAL", "60"))  # seconds
+
+    # Job leases: workers heartbeat in-flight jobs; expired leases are requeued
+    job_lease_seconds: int = int(os.getenv("JOB_LEASE_SECONDS", "300"))
+    heartbeat_interval: int = int(os.getenv("HEARTBEAT_INTERVAL", "60"))  # seconds
+
     # Rate limiting
     default_rate_limit: int = 10  # requests per minute
     default_delay_between_requests: float = 2.0  # seconds
+    fanout_requests_per_job: int = int(os.getenv("FANOUT_REQUESTS_PER_JOB", "6"))  # est. per state job
+
+    fanout_county_concurrency: int = int(os.getenv("FANOUT_COUNTY_CONCURRENCY", "4"))  # counties in flight per sweep
 
     # Timeouts
     request_timeout: int = 30
     page_load_timeout: int = 60
 
+    # Persistence: leads are upserted in micro-batches while a scrape streams
+    persist_batch_size: int = int(os.getenv("PERSIST_BATCH_SIZE", "100"))
+
     # Retries
     max_retries: int = 3
     retry_delay: int = 60  # seconds
@@ -67,6 +91,25 @@ class ScraperConfig:
     # Browser settings
     headless: bool = True
     browser_type: str = "chromium"  # chromium, firefox, webkit
+    browser_pool_size: int = int(os.getenv("BROWSER_POOL_SIZE", "2"))  # warm browsers per worker
+    browser_max_contexts: int = int(os.getenv("BROWSER_MAX_CONTEXTS", "50"))  # recycle after N contexts
+    http_first: bool = os.getenv("HTTP_FIRST", "true").lower() == "true"  # probe with plain GET before a browser
+
+    # HTML parsing: "selectolax" (default), "lxml" (streams cards), or "soup" (BeautifulSoup)
+    parser_backend: str = os.getenv("PARSER_BACKEND", "selectolax")
+    # Listing pages at least this large are parsed in a process pool, off the event loop
+    parse_offload: bool = os.getenv("PARSE_OFFLOAD", "true").lower() == "true"
+    parse_workers: int = int(os.getenv("PARSE_WORKERS", "0"))  # 0 = one per CPU core
+    parse_offload_min_bytes: int = int(os.getenv("PARSE_OFFLOAD_MIN_BYTES", "65536"))
+
+    # Raw-page archive: "db" (bytea in raw_page_blobs), "segment" (local files), or "none"
+    archive_backend: str = os.getenv("ARCHIVE_BACKEND", "db")
+    archive_dir: str = os.getenv("ARCHIVE_DIR", "/data/scraper/archive")
+    archive_segment_bytes: int = int(os.getenv("ARCHIVE_SEGMENT_BYTES", str(256 * 1024 * 1024)))
+    archive_zstd_level: int = int(os.getenv("ARCHIVE_ZSTD_LEVEL", "9"))
+
+    # Conditional re-fetch: skip pages whose ETag/Last-Modified/content hash match the last run
+    conditional_fetch: bool = os.getenv("CONDITIONAL_FETCH", "true").lower() == "true"
 
     # Data paths
     data_dir: str = os.getenv("DATA_DIR", "/data/scraper")
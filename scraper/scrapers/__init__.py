@@ -1,6 +1,8 @@
 """Scraper implementations."""
 from .base import BaseScraper, Crawl4AIScraper, PlaywrightScraper, ForeclosureLead, ScrapeResult
 from .auction_com import AuctionComScraper, RealAuctionScraper
+from .browser_pool import BrowserPool
+from .leads import LeadBatch
 
 __all__ = [
     "BaseScraper",
@@ -10,4 +12,6 @@ __all__ = [
     "ScrapeResult",
     "AuctionComScraper",
     "RealAuctionScraper",
+    "BrowserPool",
+    "LeadBatch",
 ]
@@ -4,13 +4,146 @@ Scrapes foreclosure listings from Auction.com - the largest online foreclosure m
 """
 
 import asyncio
+import json
 import re
-from typing import Any, Optional
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, Optional
 from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from ..config import config
+from .base import NOT_MODIFIED, PlaywrightScraper, ForeclosureLead, ScrapeResult
+from .browser_pool import BrowserPool
+from .leads import LeadBatch
+from .parsing import Node
+
+
+# Query/body keys Auction.com-style listing APIs use for paging
+PAGE_KEYS = ("page", "pageNumber", "page_number", "pageNum", "p")
+OFFSET_KEYS = ("offset", "start", "from", "skip")
+TOTAL_KEYS = ("total", "totalCount", "total_count", "totalResults", "count")
+
+# Captured request headers that belong to the original connection, not the API call
+UNREPLAYED_HEADERS = frozenset({
+    "host", "content-length", "connection", "keep-alive", "proxy-authenticate",
+    "proxy-authorization", "proxy-connection", "te", "trailer", "transfer-encoding", "upgrade",
+})
+
+# Keys that mark a dict as a property listing
+LISTING_KEYS = ("address", "streetAddress", "street_address", "propertyAddress", "property_address")
+
+
+def find_listings(payload: Any) -> list[dict]:
+    """Return the first list of listing-shaped dicts found in a JSON payload."""
+    if isinstance(payload, list):
+        if payload and all(isinstance(item, dict) for item in payload):
+            if any(key in payload[0] for key in LISTING_KEYS):
+                return payload
+        for item in payload:
+            found = find_listings(item)
+            if found:
+                return found
+    elif isinstance(payload, dict):
+        for value in payload.values():
+            if isinstance(value, (dict, list)):
+                found = find_listings(value)
+                if found:
+                    return found
+    return []
+
+
+def find_total(payload: Any) -> Optional[int]:
+    """Total result count advertised by a listing response, if any."""
+    if isinstance(payload, dict):
+        for key in TOTAL_KEYS:
+            if isinstance(payload.get(key), int):
+                return payload[key]
+        for value in payload.values():
+            if isinstance(value, dict):
+                total = find_total(value)
+                if total is not None:
+                    return total
+    return None
+
+
+def pick(item: dict, *paths: str) -> Any:
+    """First non-empty value among dotted key paths (e.g. "address.city")."""
+    for path in paths:
+        value: Any = item
+        for key in path.split("."):
+            value = value.get(key) if isinstance(value, dict) else None
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def replay_headers(headers: dict[str, str]) -> dict[str, str]:
+    """A captured request's headers (auth, API keys, x-* client headers), minus hop-by-hop ones."""
+    return {name: value for name, value in headers.items()
+            if name.lower() not in UNREPLAYED_HEADERS and not name.startswith(":")}
+
+
+def advance_paging(params: dict, page_size: int) -> None:
+    """Move page/offset params in-place to the next page.
+
+    First requests usually omit paging (the API defaults to page 1), so
+    with no page/offset key this asks for page 2. An API that ignores the
+    key repeats page 1, which the pager stops on.
+    """
+    if not _advance_existing(params, page_size):
+        variables = params.get("variables")
+        target = variables if isinstance(variables, dict) else params
+        target[PAGE_KEYS[0]] = 2
+
+
+def _advance_existing(params: dict, page_size: int) -> bool:
+    for key in PAGE_KEYS:
+        if key in params:
+            params[key] = int(params[key]) + 1
+            return True
+    for key in OFFSET_KEYS:
+        if key in params:
+            params[key] = int(params[key]) + page_size
+            return True
+    variables = params.get("variables")
+    if isinstance(variables, dict):
+        return _advance_existing(variables, page_size)
+    return False
+
+
+class ListingCapture:
+    """Collects the listing API responses a search page issues while loading."""
+
+    def __init__(self, is_listing_url):
+        self.is_listing_url = is_listing_url
+        self.request = None
+        self.payload: Any = None
+        self.body: bytes = b""
+        self.captured = asyncio.Event()
+
+    async def on_response(self, response):
+        if self.captured.is_set() or not self.is_listing_url(response.url):
+            return
+        if "json" not in (response.headers.get("content-type") or ""):
+            return
+        try:
+            body = await response.body()
+            payload = json.loads(body)
+        except Exception:
+            return
+        if find_listings(payload):
+            self.request = response.request
+            self.payload = payload
+            self.body = body
+            self.captured.set()
+
+    async def wait(self, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(self.captured.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.captured.is_set()
 
-from bs4 import BeautifulSoup
-
-from .base import PlaywrightScraper, ForeclosureLead, ScrapeResult
 
 
 class AuctionComScraper(PlaywrightScraper):
@@ -24,83 +157,293 @@ class AuctionComScraper(PlaywrightScraper):
     BASE_URL = "https://www.auction.com"
     SEARCH_URL = "https://www.auction.com/residential/foreclosure"
 
+    # Network capture: read the listing API the search page calls instead of the DOM
+    capture_json: bool = True
+    LISTING_API_PATTERN = re.compile(r"auction\.com/.*(api|graphql|search).*", re.IGNORECASE)
+    JSON_CAPTURE_TIMEOUT = 15  # seconds to wait for the first listing response
+    MAX_API_PAGES = 100
+
+    SELECTORS = {
+        "card": ".property-card",
+        "address": ".property-address",
+        "price": ".property-price, .auction-price, .bid-amount",
+        "date": ".auction-date, .sale-date",
+        "link": "a[href*='/property/']",
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.api_pages = 0  # listing API pages read this run
+        self.api_shortfall: Optional[str] = None  # why API paging ended before the last page, if it did
+
     async def scrape(self) -> ScrapeResult:
         """Scrape foreclosure listings from Auction.com."""
+        return await self.collect_stream()
+
+    async def scrape_stream(self) -> AsyncGenerator[ForeclosureLead, None]:
+        """Scrape Auction.com, yielding leads as the listing page is parsed."""
         start_time = datetime.utcnow()
-        leads = []
+        found = 0
         pages_scraped = 0
+        errors: list[str] = []
+
+        # Build search URL with state filter
+        url = self.SEARCH_URL
+        if self.state_abbr:
+            url = f"{self.SEARCH_URL}?state={self.state_abbr}"
 
         try:
             async with self:
-                # Build search URL with state filter
-                url = self.SEARCH_URL
-                if self.state_abbr:
-                    url = f"{self.SEARCH_URL}?state={self.state_abbr}"
-
                 self.logger.info("Starting Auction.com scrape", url=url)
 
-                # Navigate to search page
-                page = await self._context.new_page()
-                await page.goto(url, timeout=60000)
-
-                # Wait for listings to load
-                await page.wait_for_selector(".property-card", timeout=30000)
-                pages_scraped += 1
-
-                # Scroll to load more results (infinite scroll)
-                for _ in range(5):  # Load ~5 pages worth
-                    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    await asyncio.sleep(2)
+                # Navigate to search page, listening for its listing API calls
+                page = await self.new_page()
+                capture = ListingCapture(self.LISTING_API_PATTERN.search)
+                if self.capture_json:
+                    page.on("response", capture.on_response)
+
+                await self.rate_limit_delay(url)
+                with self.timings.phase("navigation"):
+                    await page.goto(url, timeout=60000)
+
+                with self.timings.phase("selector_wait"):
+                    captured = self.capture_json and await capture.wait(self.JSON_CAPTURE_TIMEOUT)
+                api_lead_ids: set[str] = set()
+                if captured:
+                    self.logger.info("Capturing listing API", api_url=capture.request.url)
+                    async for lead in self.stream_api_listings(page, capture):
+                        api_lead_ids.add(lead.id)
+                        found += 1
+                        yield lead
+                    pages_scraped = self.api_pages
+
+                    if self.api_shortfall is None:
+                        await page.close()
+                        self.stream_result = ScrapeResult(
+                            success=True,
+                            total_found=found,
+                            new_count=found,  # Will be calculated during insert
+                            duration_seconds=(datetime.utcnow() - start_time).total_seconds(),
+                            pages_scraped=pages_scraped,
+                            source_url=url,
+                            unchanged_pages=self.unchanged_pages,
+                        )
+                        return
+
+                    # Paging broke off early: top up from the rendered results and report it
+                    errors.append(self.api_shortfall)
+                    self.logger.warning("Listing API incomplete, parsing HTML too", reason=self.api_shortfall)
+                else:
+                    # Fallback: no listing API seen, scroll and parse the rendered HTML
+                    self.logger.info("No listing API captured, parsing HTML")
+
+                # Wait for listings to load, then scroll to load more results (infinite scroll)
+                with self.timings.phase("selector_wait"):
+                    try:
+                        await page.wait_for_selector(".property-card", timeout=30000)
+                        rendered = True
+                    except Exception:
+                        if not captured:
+                            raise
+                        # The API leads already yielded stand; the shortfall is in errors
+                        rendered = False
+                    for _ in range(5 if rendered else 0):  # Load ~5 pages worth
+                        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                        await asyncio.sleep(2)
 
                 # Get page content
-                content = await page.content()
-                soup = BeautifulSoup(content, "lxml")
+                content = await page.content() if rendered else None
+                await page.close()
+                await self.archive_page(url, content)
 
-                # Find all property cards
-                property_cards = soup.select(".property-card")
-                self.logger.info(f"Found {len(property_cards)} property cards")
+                # Parse property cards off the event loop, unless nothing changed since last run
+                leads = []
+                if rendered:
+                    pages_scraped += 1
+                    if not await self.page_unchanged(url, content):
+                        leads, _ = await self.parse_listing_page(content)
+                self.logger.info(f"Parsed {len(leads)} property cards")
 
-                for card in property_cards:
-                    try:
-                        lead = await self.parse_listing(card)
-                        if lead:
-                            leads.append(lead)
-                    except Exception as e:
-                        self.logger.warning("Failed to parse listing", error=str(e))
+                for lead in leads:
+                    if lead.id in api_lead_ids:
                         continue
-
-                await page.close()
+                    found += 1
+                    yield lead
 
             duration = (datetime.utcnow() - start_time).total_seconds()
 
-            return ScrapeResult(
+            self.stream_result = ScrapeResult(
                 success=True,
-                leads=leads,
-                total_found=len(leads),
-                new_count=len(leads),  # Will be calculated during insert
+                total_found=found,
+                new_count=found,  # Will be calculated during insert
                 duration_seconds=duration,
                 pages_scraped=pages_scraped,
                 source_url=url,
+                unchanged_pages=self.unchanged_pages,
+                errors=errors,
             )
 
         except Exception as e:
             self.logger.exception("Auction.com scrape failed", error=str(e))
-            return ScrapeResult(
+            self.stream_result = ScrapeResult(
                 success=False,
+                total_found=found,
                 error=str(e),
                 error_details={"type": type(e).__name__},
                 duration_seconds=(datetime.utcnow() - start_time).total_seconds(),
+                pages_scraped=pages_scraped,
+                source_url=url,
             )
 
-    async def parse_listing(self, data: Any) -> Optional[ForeclosureLead]:
-        """Parse an Auction.com property card into a ForeclosureLead."""
+    async def stream_api_listings(self, page, capture: ListingCapture) -> AsyncGenerator[ForeclosureLead, None]:
+        """Yield leads from the captured listing response, then page the API until exhausted.
+
+        Follow-up pages replay the captured request's headers. If paging
+        ends before the last page, api_shortfall says why.
+        """
+        request = capture.request
+        payload = capture.payload
+        method = request.method
+        headers = replay_headers(request.headers)
+        parsed = urlparse(request.url)
+        query = dict(parse_qsl(parsed.query))
+        body = None
+        if method != "GET" and request.post_data:
+            try:
+                body = json.loads(request.post_data)
+            except ValueError:
+                body = None
+
+        seen: set[str] = set()
+        total = find_total(payload)
+        self.api_pages = 0
+        self.api_shortfall = None
+        raw = capture.body
+        page_key = self.api_page_key(request.url, body)
+        await self.archive_page(request.url, raw, "json")
+
+        while payload is not None and self.api_pages < self.MAX_API_PAGES:
+            self.api_pages += 1
+            listings = find_listings(payload)
+            # Unchanged pages still advance paging, but their listings aren't re-parsed or saved
+            unchanged = await self.page_unchanged(page_key, raw)
+            new_items = 0
+            rows = []
+
+            for item in listings:
+                key = str(pick(item, "id", "listingId", "assetId", "propertyId") or json.dumps(item, sort_keys=True, default=str))
+                if key in seen:
+                    continue
+                seen.add(key)
+                new_items += 1
+                if unchanged:
+                    continue
+                try:
+                    row = self.parse_listing_json(item)
+                except Exception as e:
+                    self.logger.warning("Failed to parse listing JSON", error=str(e))
+                    continue
+                if row:
+                    rows.append(row)
+
+            # Validate the whole API page at once
+            for lead in LeadBatch.validate(rows, self.logger):
+                yield lead
+
+            # Stop on an empty/repeated page or once the advertised total is reached
+            if not new_items or (total is not None and len(seen) >= total):
+                break
+
+            advance_paging(body if body is not None else query, len(listings))
+
+            next_url = urlunparse(parsed._replace(query=urlencode(query)))
+            await self.rate_limit_delay(next_url)
+            with self.timings.phase("navigation"):
+                if body is not None:
+                    response = await page.request.fetch(
+                        next_url, method=method, data=json.dumps(body),
+                        headers={"content-type": "application/json", **headers},
+                    )
+                else:
+                    response = await page.request.get(next_url, headers=headers)
+
+            if not response.ok:
+                self.logger.warning("Listing API page failed", status=response.status, url=next_url)
+                self.api_shortfall = f"Listing API page {self.api_pages + 1} failed with HTTP {response.status}"
+                break
+            raw = await response.body()
+            page_key = self.api_page_key(next_url, body)
+            await self.archive_page(next_url, raw, "json")
+            payload = json.loads(raw)
+
+        if self.api_shortfall is None and total is not None and len(seen) < total:
+            self.api_shortfall = f"Listing API stopped at {len(seen)} of {total} listings"
+
+    @staticmethod
+    def api_page_key(url: str, body: Optional[dict]) -> str:
+        """Fingerprint key for a listing API page (POST APIs page through the body)."""
+        return f"{url}#{json.dumps(body, sort_keys=True)}" if body is not None else url
+
+    def parse_listing_json(self, item: dict) -> Optional[dict[str, Any]]:
+        """Lead fields straight from a listing API record."""
+        address = pick(item, "address.street", "address.line1", "address.streetAddress",
+                       "streetAddress", "street_address", "propertyAddress", "property_address", "address")
+        if not isinstance(address, str) or not address:
+            return None
+
+        state_abbr = pick(item, "address.state", "address.stateCode", "state", "stateCode") or self.state_abbr or ""
+        zip_code = pick(item, "address.zip", "address.zipCode", "address.postalCode", "zip", "zipCode", "postalCode")
+
+        source_url = pick(item, "url", "pdpUrl", "propertyUrl", "detailUrl")
+        if isinstance(source_url, str) and not source_url.startswith("http"):
+            source_url = f"{self.BASE_URL}{source_url}"
+
+        return dict(
+            source=self.name,
+            source_type=self.source_type,
+            batch_id=self.batch_id,
+            property_address=self.normalize_address(address.split(",")[0].strip()),
+            city=pick(item, "address.city", "city"),
+            state_abbr=str(state_abbr)[:2].upper(),
+            zip_code=str(zip_code)[:5] if zip_code else None,
+            county=pick(item, "address.county", "county"),
+            parcel_id=pick(item, "apn", "parcelNumber", "parcelId"),
+            owner_name="Property Owner",  # Default - will be updated via skip trace
+            sale_date=self.parse_date(pick(item, "auctionStartDate", "auctionDate", "saleDate", "auction.startDate")),
+            sale_amount=self.parse_currency(pick(item, "openingBid", "startingBid", "currentBid", "price", "auction.openingBid")),
+            foreclosure_type="non-judicial",  # Most auction.com are non-judicial
+            source_url=source_url if isinstance(source_url, str) else None,
+            raw_data={"json": item},
+        )
+
+    def parse_listing_json_page(self, payload: Any) -> LeadBatch:
+        """Leads from an archived listing API response (used by re-parse)."""
+        rows = []
+        for item in find_listings(payload):
+            try:
+                row = self.parse_listing_json(item)
+            except Exception as e:
+                self.logger.warning("Failed to parse listing JSON", error=str(e))
+                continue
+            if row:
+                rows.append(row)
+        return LeadBatch.validate(rows, self.logger)
+
+    async def parse_listing(self, data: Node) -> Optional[ForeclosureLead]:
+        """Parse an Auction.com property card node into a ForeclosureLead."""
+        fields = self.parse_card(data)
+        return ForeclosureLead(**fields) if fields else None
+
+    def parse_card(self, data: Node) -> Optional[dict[str, Any]]:
+        """Lead fields from an Auction.com property card node (runs in parse workers)."""
+        selectors = self.selectors
         try:
             # Extract address
-            address_elem = data.select_one(".property-address")
+            address_elem = data.select_one(selectors["address"])
             if not address_elem:
                 return None
 
-            full_address = address_elem.get_text(strip=True)
+            full_address = address_elem.text()
 
             # Parse address components
             # Format: "123 Main St, City, ST 12345"
@@ -121,28 +464,28 @@ class AuctionComScraper(PlaywrightScraper):
                     zip_code = state_zip_match.group(2) or ""
 
             # Extract price/bid
-            price_elem = data.select_one(".property-price, .auction-price, .bid-amount")
+            price_elem = data.select_one(selectors["price"])
             sale_amount = None
             if price_elem:
-                sale_amount = self.parse_currency(price_elem.get_text())
+                sale_amount = self.parse_currency(price_elem.text(strip=False))
 
             # Extract auction date
-            date_elem = data.select_one(".auction-date, .sale-date")
+            date_elem = data.select_one(selectors["date"])
             sale_date = None
             if date_elem:
-                sale_date = self.parse_date(date_elem.get_text())
+                sale_date = self.parse_date(date_elem.text(strip=False))
 
             # Extract property link for more details
-            link_elem = data.select_one("a[href*='/property/']")
+            link_elem = data.select_one(selectors["link"])
             source_url = None
             if link_elem:
-                href = link_elem.get("href", "")
+                href = link_elem.attr("href", "")
                 source_url = href if href.startswith("http") else f"{self.BASE_URL}{href}"
 
             # Try to get owner name (may not be available on listing page)
             owner_name = "Property Owner"  # Default - will be updated via skip trace
 
-            return ForeclosureLead(
+            return dict(
                 source=self.name,
                 source_type=self.source_type,
                 batch_id=self.batch_id,
@@ -155,7 +498,7 @@ class AuctionComScraper(PlaywrightScraper):
                 sale_amount=sale_amount,
                 foreclosure_type="non-judicial",  # Most auction.com are non-judicial
                 source_url=source_url,
-                raw_data={"html": str(data)[:1000]},  # Store snippet for debugging
+                raw_data={"html": data.html()[:1000]},  # Store snippet for debugging
             )
 
         except Exception as e:
@@ -176,6 +519,20 @@ class RealAuctionScraper(PlaywrightScraper):
 
     BASE_URL = "https://www.realauction.com"
 
+    expected_selector = ".auction-item, .property-listing"
+
+    SELECTORS = {
+        "card": ".auction-item, .property-listing, .foreclosure-item",
+        "next": ".pagination .next, a[rel='next']",
+        "address": ".property-address, .address, h3, h4",
+        "case": ".case-number, .case-no",
+        "date": ".auction-date, .sale-date, .date",
+        "bid": ".opening-bid, .judgment, .bid-amount",
+        "plaintiff": ".plaintiff, .lender",
+        "defendant": ".defendant, .owner",
+        "parcel": ".parcel, .parcel-id, .folio",
+    }
+
     # Florida counties using RealAuction
     FLORIDA_COUNTIES = [
         "Alachua", "Baker", "Bay", "Bradford", "Brevard", "Broward",
@@ -192,158 +549,297 @@ class RealAuctionScraper(PlaywrightScraper):
         "Wakulla", "Walton", "Washington",
     ]
 
-    def __init__(self, county: Optional[str] = None, *args, **kwargs):
+    def __init__(
+        self,
+        county: Optional[str] = None,
+        *args,
+        counties: Optional[list[str]] = None,
+        fan_out: bool = True,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.county = county
         # Default to FL if no state provided
         if not self.state_abbr:
             self.state_abbr = "FL"
+        # State-wide Florida runs sweep every county calendar concurrently
+        self.counties = counties
+        self.fan_out = fan_out
+
+    @property
+    def fan_out_counties(self) -> list[str]:
+        """Counties a state-wide run sweeps, or [] for a single calendar scrape."""
+        if self.county or not self.fan_out:
+            return []
+        if self.counties is not None:
+            return list(self.counties)
+        return list(self.FLORIDA_COUNTIES) if self.state_abbr == "FL" else []
 
     async def scrape(self) -> ScrapeResult:
         """Scrape foreclosure auctions from RealAuction."""
+        return await self.collect_stream()
+
+    async def scrape_stream(self) -> AsyncGenerator[ForeclosureLead, None]:
+        """Scrape RealAuction, fanning out across counties for a state-wide run."""
+        counties = self.fan_out_counties
+        stream = self.scrape_counties(counties) if counties else self.scrape_calendar()
+        async with aclosing(stream) as leads:
+            async for lead in leads:
+                yield lead
+
+    async def scrape_counties(self, counties: list[str]) -> AsyncGenerator[ForeclosureLead, None]:
+        """Scrape county calendars concurrently and merge their leads into one stream.
+
+        Each county gets its own browser context on a shared browser (the
+        worker's pool, or a single-browser pool for this sweep), and every
+        request still draws from the site-wide rate budget. Counties stage
+        page fingerprints separately and only those that succeed hand them
+        to this scraper for the worker to commit.
+
+        Failed counties are listed in the result's errors; the sweep only
+        counts as failed when most counties failed.
+        """
+        start_time = datetime.utcnow()
+        concurrency = max(1, config.scraper.fanout_county_concurrency)
+        pool = self.browser_pool or BrowserPool(size=1)
+        semaphore = asyncio.Semaphore(concurrency)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, config.scraper.persist_batch_size))
+        county_stats: dict[str, dict] = {}
+        failed: dict[str, str] = {}
+
+        async def run_county(county: str):
+            result = None
+            try:
+                async with semaphore:
+                    child = RealAuctionScraper(
+                        county=county,
+                        state_abbr=self.state_abbr,
+                        county_id=self.county_id,
+                        batch_id=self.batch_id,
+                        browser_pool=pool,
+                        page_archive=self.page_archive,
+                        fingerprints=self.fingerprints.fork() if self.fingerprints else None,
+                        timings=self.timings,
+                    )
+                    async with aclosing(child.scrape_calendar()) as leads:
+                        async for lead in leads:
+                            await queue.put(lead)
+                    result = child.stream_result
+                    if result and result.success and self.fingerprints:
+                        self.fingerprints.adopt(child.fingerprints)
+                    self.unchanged_pages += child.unchanged_pages
+                    self.note_unparseable_dates(child.unparseable_dates)
+            except Exception as e:
+                result = ScrapeResult(success=False, error=str(e))
+            finally:
+                await queue.put((county, result))
+
+        self.logger.info("Starting RealAuction county sweep", counties=len(counties), concurrency=concurrency)
+        tasks = [asyncio.create_task(run_county(county)) for county in counties]
+        remaining = len(tasks)
+        found = 0
+
+        try:
+            while remaining:
+                item = await queue.get()
+                if not isinstance(item, tuple):
+                    found += 1
+                    yield item
+                    continue
+
+                county, result = item
+                remaining -= 1
+                result = result or ScrapeResult(success=False, error="cancelled")
+                county_stats[county] = {
+                    "pages": result.pages_scraped,
+                    "unchanged_pages": result.unchanged_pages,
+                    "leads": result.total_found,
+                    "seconds": round(result.duration_seconds, 1),
+                }
+                if not result.success:
+                    failed[county] = result.error or "unknown error"
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if pool is not self.browser_pool:
+                await pool.close()
+
+        duration = (datetime.utcnow() - start_time).total_seconds()
+        self.logger.info(
+            "RealAuction county sweep complete",
+            counties=len(counties),
+            failed=len(failed),
+            leads=found,
+            duration=duration,
+        )
+
+        self.stream_result = ScrapeResult(
+            success=len(failed) * 2 < len(counties),
+            total_found=found,
+            new_count=found,
+            error=f"{len(failed)} of {len(counties)} counties failed" if failed else None,
+            error_details={"failed_counties": failed} if failed else None,
+            duration_seconds=duration,
+            pages_scraped=sum(stats["pages"] for stats in county_stats.values()),
+            source_url=f"{self.BASE_URL}/foreclosure/{self.state_abbr.lower()}",
+            county_stats=county_stats,
+            unchanged_pages=self.unchanged_pages,
+            unparseable_dates=dict(self.unparseable_dates),
+            errors=[f"{county}: {error}" for county, error in failed.items()],
+        )
+
+    async def scrape_calendar(self) -> AsyncGenerator[ForeclosureLead, None]:
+        """Scrape one auction calendar, yielding each page's leads as it is parsed."""
         start_time = datetime.utcnow()
-        leads = []
+        found = 0
         pages_scraped = 0
 
+        # Get auction calendar
+        calendar_url = f"{self.BASE_URL}/foreclosure/{self.state_abbr.lower()}"
+        if self.county:
+            calendar_url += f"/{self.county.lower().replace(' ', '-')}"
+
         try:
             async with self:
-                # Get auction calendar
-                calendar_url = f"{self.BASE_URL}/foreclosure/{self.state_abbr.lower()}"
-                if self.county:
-                    calendar_url += f"/{self.county.lower().replace(' ', '-')}"
-
                 self.logger.info("Starting RealAuction scrape", url=calendar_url)
 
-                page = await self._context.new_page()
-                await page.goto(calendar_url, timeout=60000)
-
-                # Wait for auction listings
-                try:
-                    await page.wait_for_selector(".auction-item, .property-listing", timeout=15000)
-                except Exception:
+                # Calendar pages are usually server-rendered; fetch_page only
+                # opens a browser when the listings need JavaScript
+                content = await self.fetch_page(calendar_url, wait_timeout=15000)
+                if content is None:
                     # No auctions found
                     self.logger.info("No auctions found on page")
-                    await page.close()
-                    return ScrapeResult(
+                    self.stream_result = ScrapeResult(
                         success=True,
-                        leads=[],
                         total_found=0,
                         duration_seconds=(datetime.utcnow() - start_time).total_seconds(),
                     )
+                    return
 
-                pages_scraped += 1
-                content = await page.content()
-                soup = BeautifulSoup(content, "lxml")
-
-                # Parse auction items
-                auction_items = soup.select(".auction-item, .property-listing, .foreclosure-item")
+                page_num = 1
+                page_url = calendar_url
 
-                for item in auction_items:
-                    try:
-                        lead = await self.parse_listing(item)
-                        if lead:
-                            leads.append(lead)
-                    except Exception as e:
-                        self.logger.warning("Failed to parse RealAuction item", error=str(e))
-
-                # Check for pagination
-                next_page = soup.select_one(".pagination .next, a[rel='next']")
-                page_num = 2
-
-                while next_page and page_num <= 10:  # Max 10 pages
-                    next_url = next_page.get("href")
-                    if not next_url:
+                while True:
+                    pages_scraped += 1
+                    if content is NOT_MODIFIED:
+                        # A 304 has no body to follow; use the link saved with the page
+                        previous = await self.fingerprints.get(page_url)
+                        next_url = previous.next_url if previous else None
+                    elif await self.page_unchanged(page_url, content):
+                        # Same listings as the last successful run: skip parse and persist,
+                        # but keep walking the calendar
+                        next_url = self.next_page_href(content)
+                    else:
+                        # Parse auction items off the event loop
+                        leads, next_url = await self.parse_listing_page(content)
+
+                        for lead in leads:
+                            found += 1
+                            yield lead
+
+                    if self.fingerprints and content is not NOT_MODIFIED:
+                        self.fingerprints.stage(page_url, next_url=next_url)
+
+                    # Check for pagination
+                    page_num += 1
+                    if not next_url or page_num > 10:  # Max 10 pages
                         break
 
                     if not next_url.startswith("http"):
                         next_url = f"{self.BASE_URL}{next_url}"
 
-                    await self.rate_limit_delay()
-                    await page.goto(next_url, timeout=60000)
-
-                    try:
-                        await page.wait_for_selector(".auction-item, .property-listing", timeout=10000)
-                    except Exception:
+                    page_url = next_url
+                    content = await self.fetch_page(page_url, wait_timeout=10000)
+                    if content is None:
                         break
 
-                    pages_scraped += 1
-                    content = await page.content()
-                    soup = BeautifulSoup(content, "lxml")
-
-                    auction_items = soup.select(".auction-item, .property-listing, .foreclosure-item")
-                    for item in auction_items:
-                        try:
-                            lead = await self.parse_listing(item)
-                            if lead:
-                                leads.append(lead)
-                        except Exception:
-                            continue
-
-                    next_page = soup.select_one(".pagination .next, a[rel='next']")
-                    page_num += 1
-
-                await page.close()
-
-            return ScrapeResult(
+            self.stream_result = ScrapeResult(
                 success=True,
-                leads=leads,
-                total_found=len(leads),
-                new_count=len(leads),
+                total_found=found,
+                new_count=found,
                 duration_seconds=(datetime.utcnow() - start_time).total_seconds(),
                 pages_scraped=pages_scraped,
                 source_url=calendar_url,
+                unchanged_pages=self.unchanged_pages,
             )
 
         except Exception as e:
             self.logger.exception("RealAuction scrape failed", error=str(e))
-            return ScrapeResult(
+            self.stream_result = ScrapeResult(
                 success=False,
+                total_found=found,
                 error=str(e),
                 duration_seconds=(datetime.utcnow() - start_time).total_seconds(),
+                pages_scraped=pages_scraped,
+                source_url=calendar_url,
             )
 
-    async def parse_listing(self, data: Any) -> Optional[ForeclosureLead]:
-        """Parse a RealAuction listing."""
+    def parse_kwargs(self) -> dict[str, Any]:
+        return {**super().parse_kwargs(), "county": self.county}
+
+    @property
+    def date_source(self) -> str:
+        """Each county clerk formats its own calendar, so formats are learned per county."""
+        return f"{self.name}_{self.county}" if self.county else self.name
+
+    @classmethod
+    def archived_page_kwargs(cls, url: str) -> dict[str, Any]:
+        """Recover the county from a calendar URL (/foreclosure/fl/<county>)."""
+        parts = urlparse(url).path.strip("/").split("/")
+        if len(parts) < 3 or parts[0] != "foreclosure":
+            return {}
+        slugs = {county.lower().replace(" ", "-"): county for county in cls.FLORIDA_COUNTIES}
+        return {"county": slugs.get(parts[2], parts[2].replace("-", " ").title())}
+
+    async def parse_listing(self, data: Node) -> Optional[ForeclosureLead]:
+        """Parse a RealAuction listing node."""
+        fields = self.parse_card(data)
+        return ForeclosureLead(**fields) if fields else None
+
+    def parse_card(self, data: Node) -> Optional[dict[str, Any]]:
+        """Lead fields from a RealAuction listing node (runs in parse workers)."""
+        selectors = self.selectors
         try:
             # Get address
-            address_elem = data.select_one(".property-address, .address, h3, h4")
+            address_elem = data.select_one(selectors["address"])
             if not address_elem:
                 return None
 
-            full_address = address_elem.get_text(strip=True)
+            full_address = address_elem.text()
             address_parts = full_address.split(",")
             street_address = address_parts[0].strip()
             city = address_parts[1].strip() if len(address_parts) > 1 else ""
 
             # Case number
-            case_elem = data.select_one(".case-number, .case-no")
-            case_number = case_elem.get_text(strip=True) if case_elem else None
+            case_elem = data.select_one(selectors["case"])
+            case_number = case_elem.text() if case_elem else None
 
             # Sale date
-            date_elem = data.select_one(".auction-date, .sale-date, .date")
+            date_elem = data.select_one(selectors["date"])
             sale_date = None
             if date_elem:
-                sale_date = self.parse_date(date_elem.get_text())
+                sale_date = self.parse_date(date_elem.text(strip=False))
 
             # Opening bid / judgment amount
-            bid_elem = data.select_one(".opening-bid, .judgment, .bid-amount")
+            bid_elem = data.select_one(selectors["bid"])
             sale_amount = None
             if bid_elem:
-                sale_amount = self.parse_currency(bid_elem.get_text())
+                sale_amount = self.parse_currency(bid_elem.text(strip=False))
 
             # Plaintiff (lender)
-            plaintiff_elem = data.select_one(".plaintiff, .lender")
-            lender_name = plaintiff_elem.get_text(strip=True) if plaintiff_elem else None
+            plaintiff_elem = data.select_one(selectors["plaintiff"])
+            lender_name = plaintiff_elem.text() if plaintiff_elem else None
 
             # Defendant (owner)
-            defendant_elem = data.select_one(".defendant, .owner")
-            owner_name = defendant_elem.get_text(strip=True) if defendant_elem else "Property Owner"
+            defendant_elem = data.select_one(selectors["defendant"])
+            owner_name = defendant_elem.text() if defendant_elem else "Property Owner"
 
             # Parcel ID
-            parcel_elem = data.select_one(".parcel, .parcel-id, .folio")
-            parcel_id = parcel_elem.get_text(strip=True) if parcel_elem else None
+            parcel_elem = data.select_one(selectors["parcel"])
+            parcel_id = parcel_elem.text() if parcel_elem else None
 
-            return ForeclosureLead(
+            return dict(
                 source=f"{self.name}_{self.county}" if self.county else self.name,
                 source_type=self.source_type,
                 batch_id=self.batch_id,
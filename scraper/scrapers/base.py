@@ -4,71 +4,132 @@ Abstract base classes for all foreclosure lead scrapers.
 """
 
 import asyncio
-import hashlib
+import json
+import re
+import time
 from abc import ABC, abstractmethod
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
+from concurrent.futures.process import BrokenProcessPool
 from typing import Any, AsyncGenerator, Optional
+from urllib.parse import urlparse
 from uuid import UUID
 
 import structlog
-from pydantic import BaseModel, Field
 
 from ..config import config
+from .browser_pool import BrowserPool
+from .leads import ForeclosureLead, LeadBatch, LeadRow
+from .parsing import (
+    Document,
+    Node,
+    ParserBackend,
+    compile_selector,
+    compiled_selectors,
+    get_parse_pool,
+    get_parser_backend,
+    shutdown_parse_pool,
+)
+from ..utils.address import normalize_address
+from ..utils.dates import parse_date_string
+from ..utils.page_fingerprints import normalized_hash
+from ..utils.rate_limiter import domain_for, get_rate_limiter
+from ..utils.timings import PhaseTimings
 
 logger = structlog.get_logger()
 
 
-class ForeclosureLead(BaseModel):
-    """Normalized foreclosure lead data model."""
-    # Identifiers
-    id: str = ""  # Generated from hash of unique fields
-    source: str
-    source_type: str
-    batch_id: str = ""
-
-    # Property info
-    property_address: str
-    city: Optional[str] = None
-    state: Optional[str] = None
-    state_abbr: str
-    zip_code: Optional[str] = None
-    parcel_id: Optional[str] = None
-    county: Optional[str] = None
-
-    # Owner info
-    owner_name: str
-    owner_address: Optional[str] = None
-
-    # Foreclosure details
-    case_number: Optional[str] = None
-    sale_date: Optional[str] = None
-    sale_amount: Optional[float] = None
-    opening_bid: Optional[float] = None
-    mortgage_amount: Optional[float] = None
-    surplus_amount: Optional[float] = None
-
-    # Parties
-    lender_name: Optional[str] = None
-    trustee_name: Optional[str] = None
-    attorney_name: Optional[str] = None
-
-    # Classification
-    foreclosure_type: Optional[str] = None  # judicial, non-judicial, tax
-
-    # Source metadata
-    source_url: Optional[str] = None
-    raw_data: Optional[dict] = None
-    scraped_at: datetime = Field(default_factory=datetime.utcnow)
+# HTTP-first fetching: per (source, URL pattern), "http" once a plain GET has
+# returned the expected listing markup, "browser" once only Playwright has.
+# Decisions are re-probed after FETCH_STRATEGY_TTL in case a site changes.
+FETCH_STRATEGY_TTL = 6 * 3600
+_fetch_strategies: dict[tuple[str, str], tuple[str, float]] = {}
+_http_client = None
+
+_DIGITS_RE = re.compile(r"\d+")
+
+# Distinct unparseable date strings kept per scrape for ScrapeResult
+MAX_UNPARSEABLE_DATES = 50
+
+
+class NotModified(str):
+    """Marker for a 304 response; empty, so callers that don't check parse nothing."""
+
+
+NOT_MODIFIED = NotModified("")
+
+
+def url_pattern(url: str) -> str:
+    """Collapse a URL to its shape: host, path with digit runs masked, sorted query keys."""
+    parsed = urlparse(url)
+    path = _DIGITS_RE.sub("{n}", parsed.path.rstrip("/"))
+    keys = sorted({part.split("=", 1)[0] for part in parsed.query.split("&") if part})
+    return f"{parsed.netloc.lower()}{path}?{'&'.join(keys)}" if keys else f"{parsed.netloc.lower()}{path}"
+
+
+def get_fetch_strategy(source: str, url: str) -> Optional[str]:
+    """Cached "http"/"browser" decision for a source's URL pattern, if still fresh."""
+    entry = _fetch_strategies.get((source, url_pattern(url)))
+    if entry is None or time.monotonic() - entry[1] > FETCH_STRATEGY_TTL:
+        return None
+    return entry[0]
+
+
+def set_fetch_strategy(source: str, url: str, strategy: str) -> None:
+    _fetch_strategies[(source, url_pattern(url))] = (strategy, time.monotonic())
+
+
+def get_http_client() -> Any:
+    """Process-wide pooled httpx client (keep-alive connections reused across scrapers)."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        import httpx
+
+        _http_client = httpx.AsyncClient(
+            timeout=config.scraper.request_timeout,
+            follow_redirects=True,
+            headers={"User-Agent": PlaywrightScraper.CONTEXT_OPTIONS["user_agent"]},
+            limits=httpx.Limits(
+                max_connections=config.scraper.max_concurrent_requests * 4,
+                max_keepalive_connections=config.scraper.max_concurrent_requests * 2,
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
-    def generate_id(self) -> str:
-        """Generate unique ID from key fields."""
-        unique_string = f"{self.property_address}|{self.state_abbr}|{self.owner_name}|{self.sale_date or ''}"
-        return hashlib.sha256(unique_string.encode()).hexdigest()[:16]
+def parse_page_job(
+    scraper_class: type,
+    scraper_kwargs: dict,
+    backend: str,
+    html: str,
+) -> tuple[LeadBatch, Optional[str], dict[str, int]]:
+    """Parse-pool entry point: parse a listing page in a worker process.
 
-    def model_post_init(self, __context: Any) -> None:
-        if not self.id:
-            self.id = self.generate_id()
+    Returns the leads, the next-page href and the page's unparseable dates.
+    """
+    config.scraper.parser_backend = backend
+    scraper = scraper_class(**scraper_kwargs)
+    leads, next_href = scraper.parse_listing_page_sync(html)
+    return leads, next_href, dict(scraper.unparseable_dates)
+
+
+def parse_json_page_job(
+    scraper_class: type,
+    scraper_kwargs: dict,
+    body: str,
+) -> tuple[LeadBatch, Optional[str], dict[str, int]]:
+    """Same as parse_page_job, for an archived listing API response."""
+    scraper = scraper_class(**scraper_kwargs)
+    leads = scraper.parse_listing_json_page(json.loads(body))
+    return leads, None, dict(scraper.unparseable_dates)
 
 
 @dataclass
@@ -84,6 +145,11 @@ class ScrapeResult:
     duration_seconds: float = 0
     pages_scraped: int = 0
     source_url: Optional[str] = None
+    county_stats: dict[str, dict] = field(default_factory=dict)  # per-county pages/leads for fan-out scrapes
+    unchanged_pages: int = 0  # pages skipped because they matched the last run's fingerprint
+    unparseable_dates: dict[str, int] = field(default_factory=dict)  # raw date strings that didn't parse, with counts
+    timings: dict[str, float] = field(default_factory=dict)  # seconds per job phase (see utils.timings)
+    errors: list[str] = field(default_factory=list)  # non-fatal failures; the leads found were still saved
 
 
 class BaseScraper(ABC):
@@ -94,64 +160,260 @@ class BaseScraper(ABC):
     requires_javascript: bool = False
     rate_limit: int = 10  # requests per minute
 
+    # CSS selector (list) present on any page that carries listings
+    expected_selector: Optional[str] = None
+
+    # Named CSS selectors for listing pages, compiled once per class by the parser backend
+    SELECTORS: dict[str, str] = {}
+
     def __init__(
         self,
         state_abbr: Optional[str] = None,
         county_id: Optional[UUID] = None,
         batch_id: Optional[str] = None,
+        page_archive: Any = None,
+        fingerprints: Any = None,
+        timings: Optional[PhaseTimings] = None,
     ):
         self.state_abbr = state_abbr
         self.county_id = county_id
         self.batch_id = batch_id or datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        self.page_archive = page_archive  # JobPageArchive for the running job, if archiving
+        self.fingerprints = fingerprints  # JobFingerprints for conditional re-fetch, if enabled
+        self.unchanged_pages = 0
+        self.unparseable_dates: Counter = Counter()  # raw sale-date strings parse_date() couldn't read
+        self.timings = timings or PhaseTimings()  # per-phase seconds, shared with the job's worker
         self.logger = logger.bind(scraper=self.name, state=state_abbr)
         self._request_count = 0
         self._last_request_time: Optional[datetime] = None
+        self.stream_result: Optional[ScrapeResult] = None
 
     @abstractmethod
     async def scrape(self) -> ScrapeResult:
         """Execute the scrape operation."""
         pass
 
+    async def scrape_stream(self) -> AsyncGenerator[ForeclosureLead, None]:
+        """Yield leads as they are parsed.
+
+        Multi-page scrapers override this and yield per page; the default
+        runs scrape() and yields its leads. Once exhausted, stream_result
+        holds the run summary (without leads).
+        """
+        result = await self.scrape()
+        leads, result.leads = result.leads, []
+        self.stream_result = result
+        for lead in leads:
+            yield lead
+
+    async def collect_stream(self) -> ScrapeResult:
+        """Drain scrape_stream() into a ScrapeResult, for scrapers built on streaming.
+
+        Streams may yield LeadRow views; they are materialized here so
+        result.leads holds ForeclosureLead models like any scrape() result.
+        """
+        leads = [
+            lead.to_lead() if isinstance(lead, LeadRow) else lead
+            async for lead in self.scrape_stream()
+        ]
+        result = self.stream_result or ScrapeResult(success=True, total_found=len(leads))
+        result.leads = leads
+        result.unparseable_dates = result.unparseable_dates or dict(self.unparseable_dates)
+        return result
+
     @abstractmethod
     async def parse_listing(self, data: Any) -> Optional[ForeclosureLead]:
         """Parse a single listing into a ForeclosureLead."""
         pass
 
-    async def rate_limit_delay(self) -> None:
-        """Implement rate limiting between requests."""
-        if self._last_request_time:
-            elapsed = (datetime.utcnow() - self._last_request_time).total_seconds()
-            min_delay = 60.0 / self.rate_limit
-            if elapsed < min_delay:
-                await asyncio.sleep(min_delay - elapsed)
+    @abstractmethod
+    def parse_card(self, card: Node) -> Optional[dict[str, Any]]:
+        """Synchronous card parser used by parse_listing_page().
+
+        Returns ForeclosureLead field values, validated in bulk per page.
+        """
+        pass
+
+    def parse_kwargs(self) -> dict[str, Any]:
+        """Constructor kwargs that rebuild an equivalent scraper in a parse worker."""
+        return {
+            "state_abbr": self.state_abbr,
+            "county_id": self.county_id,
+            "batch_id": self.batch_id,
+        }
+
+    @classmethod
+    def archived_page_kwargs(cls, url: str) -> dict[str, Any]:
+        """Extra constructor kwargs recoverable from an archived page's URL (for re-parsing)."""
+        return {}
+
+    def parse_listing_page_sync(self, html: str) -> tuple[LeadBatch, Optional[str]]:
+        """Parse every card on a listing page; also returns the next-page href, if any.
+
+        Cards are parsed to field dicts and validated together as one LeadBatch.
+        """
+        selectors = self.selectors
+        document = self.parse_page(html)
+        rows = []
+        for card in document.cards(selectors["card"]):
+            try:
+                row = self.parse_card(card)
+            except Exception as e:
+                self.logger.warning("Failed to parse listing", error=str(e))
+                continue
+            if row:
+                rows.append(row)
+        leads = LeadBatch.validate(rows, self.logger)
+
+        next_href = None
+        if "next" in selectors:
+            next_node = document.select_one(selectors["next"])
+            next_href = next_node.attr("href") if next_node else None
+        return leads, next_href
+
+    def parse_listing_json_page(self, payload: Any) -> LeadBatch:
+        """Leads from a listing API response. Scrapers that archive JSON pages override this."""
+        return LeadBatch()
+
+    async def parse_listing_page(self, html: str) -> tuple[LeadBatch, Optional[str]]:
+        """Parse a listing page, in the parse pool when it's big enough to stall the event loop.
+
+        Only the columnar LeadBatch crosses the process boundary.
+        """
+        with self.timings.phase("parse"):
+            pool = get_parse_pool() if len(html) >= config.scraper.parse_offload_min_bytes else None
+            if pool is None:
+                return self.parse_listing_page_sync(html)
+
+            loop = asyncio.get_running_loop()
+            try:
+                leads, next_href, unparseable_dates = await loop.run_in_executor(
+                    pool, parse_page_job, type(self), self.parse_kwargs(), self.parser.name, html,
+                )
+            except BrokenProcessPool:
+                self.logger.warning("Parse pool broken, parsing inline")
+                shutdown_parse_pool(wait=False)
+                return self.parse_listing_page_sync(html)
+            self.note_unparseable_dates(unparseable_dates)
+            return leads, next_href
+
+    @property
+    def rate_limit_domain(self) -> str:
+        """Domain whose shared request budget this scraper draws from."""
+        base_url = getattr(self, "BASE_URL", None)
+        return domain_for(base_url) if base_url else self.name
+
+    async def rate_limit_delay(self, url: Optional[str] = None) -> None:
+        """Wait for the fleet-wide per-domain budget before a request."""
+        domain = domain_for(url) if url else self.rate_limit_domain
+        with self.timings.phase("rate_limit_wait"):
+            await get_rate_limiter().acquire(domain, self.rate_limit)
         self._last_request_time = datetime.utcnow()
         self._request_count += 1
 
+    async def archive_page(self, url: str, content: Any, content_type: str = "html") -> None:
+        """Keep the fetched body so it can be re-parsed without re-fetching."""
+        if self.page_archive is None or content is None or content is NOT_MODIFIED:
+            return
+        try:
+            await self.page_archive.store(url, content, content_type)
+        except Exception as e:
+            self.logger.warning("Page archive failed", url=url, error=str(e))
+
+    async def conditional_headers(self, url: str) -> dict[str, str]:
+        """If-None-Match / If-Modified-Since from the last successful run's fingerprint."""
+        previous = await self.fingerprints.get(url) if self.fingerprints else None
+        headers = {}
+        if previous and previous.etag:
+            headers["If-None-Match"] = previous.etag
+        if previous and previous.last_modified:
+            headers["If-Modified-Since"] = previous.last_modified
+        return headers
+
+    async def page_unchanged(self, url: str, content: Any) -> bool:
+        """Record a fetched page's content hash; True if it matches the last successful run."""
+        if self.fingerprints is None or content is None:
+            return False
+        if content is NOT_MODIFIED:
+            return True
+
+        content_hash = normalized_hash(content)
+        previous = await self.fingerprints.get(url)
+        self.fingerprints.stage(url, content_hash=content_hash)
+        if previous and previous.content_hash == content_hash:
+            self.unchanged_pages += 1
+            self.logger.debug("Page unchanged since last run", url=url)
+            return True
+        return False
+
+    async def fetch_http(self, url: str, conditional: bool = True) -> Any:
+        """GET through the pooled HTTP client.
+
+        Returns the response, NOT_MODIFIED on a 304, or None on errors or
+        non-HTML responses. Only send the last run's validators
+        (`conditional`) once HTTP is known to serve the listing markup;
+        otherwise a 304 could vouch for a JavaScript shell.
+        """
+        headers = await self.conditional_headers(url) if conditional else {}
+        await self.rate_limit_delay(url)
+        try:
+            with self.timings.phase("navigation"):
+                response = await get_http_client().get(url, headers=headers)
+        except Exception as e:
+            self.logger.warning("HTTP fetch failed", url=url, error=str(e))
+            return None
+
+        if response.status_code == 304 and headers:
+            self.fingerprints.stage(url)
+            self.unchanged_pages += 1
+            self.logger.debug("Page not modified", url=url)
+            return NOT_MODIFIED
+
+        if response.status_code != 200 or "html" not in response.headers.get("content-type", ""):
+            self.logger.debug("HTTP fetch unusable", url=url, status=response.status_code)
+            return None
+        return response
+
+    def stage_validators(self, url: str, response: Any):
+        """Keep a response's ETag/Last-Modified for the next run's conditional GET."""
+        if self.fingerprints:
+            self.fingerprints.stage(
+                url,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+            )
+
+    def next_page_href(self, html: str) -> Optional[str]:
+        """The next-page link on a listing page, without parsing its cards."""
+        if "next" not in self.selectors:
+            return None
+        next_node = self.parse_page(html).select_one(self.selectors["next"])
+        return next_node.attr("href") if next_node else None
+
+    def has_expected_markup(self, html: str, selector: Optional[str] = None) -> bool:
+        """Whether the page already contains the listing markup."""
+        selector = selector or self.expected_selector
+        if not selector:
+            return False
+        return self.parse_page(html).select_one(compile_selector(selector, self.parser)) is not None
+
+    @property
+    def parser(self) -> ParserBackend:
+        """The configured HTML parser backend."""
+        return get_parser_backend()
+
+    @property
+    def selectors(self) -> dict[str, Any]:
+        """This class's SELECTORS, compiled for the active backend."""
+        return compiled_selectors(type(self), self.parser)
+
+    def parse_page(self, html: str) -> Document:
+        """Parse a page; iterate listings with .cards(self.selectors["card"])."""
+        return self.parser.parse(html)
+
     def normalize_address(self, address: str) -> str:
-        """Normalize an address string."""
-        if not address:
-            return ""
-        # Basic normalization
-        address = address.strip().upper()
-        # Common abbreviations
-        replacements = {
-            " STREET": " ST",
-            " AVENUE": " AVE",
-            " BOULEVARD": " BLVD",
-            " DRIVE": " DR",
-            " ROAD": " RD",
-            " LANE": " LN",
-            " COURT": " CT",
-            " CIRCLE": " CIR",
-            " PLACE": " PL",
-            " NORTH": " N",
-            " SOUTH": " S",
-            " EAST": " E",
-            " WEST": " W",
-        }
-        for full, abbr in replacements.items():
-            address = address.replace(full, abbr)
-        return address
+        """Normalize an address string (USPS abbreviations, cached)."""
+        return normalize_address(address)
 
     def parse_currency(self, value: Any) -> Optional[float]:
         """Parse a currency string to float."""
@@ -168,103 +430,339 @@ class BaseScraper(ABC):
                 return None
         return None
 
+    @property
+    def date_source(self) -> str:
+        """Key the learned sale-date format is remembered under."""
+        return self.name
+
     def parse_date(self, value: Any) -> Optional[str]:
-        """Parse various date formats to YYYY-MM-DD string."""
+        """Parse various date formats to YYYY-MM-DD string.
+
+        Unparseable strings return None and are counted in unparseable_dates
+        rather than being stored raw.
+        """
         if not value:
             return None
         if isinstance(value, datetime):
             return value.strftime("%Y-%m-%d")
         if isinstance(value, str):
-            # Try common formats
-            from dateutil import parser
-            try:
-                dt = parser.parse(value)
-                return dt.strftime("%Y-%m-%d")
-            except Exception:
-                return value  # Return as-is if unparseable
+            parsed = parse_date_string(value, self.date_source)
+            if parsed is None and value.strip():
+                self.note_unparseable_dates({value.strip(): 1})
+            return parsed
         return None
 
+    def note_unparseable_dates(self, counts: dict[str, int]) -> None:
+        """Count raw date strings that didn't parse (distinct values capped)."""
+        for value, count in counts.items():
+            if value in self.unparseable_dates or len(self.unparseable_dates) < MAX_UNPARSEABLE_DATES:
+                self.unparseable_dates[value] += count
+
 
 class Crawl4AIScraper(BaseScraper):
     """Base class for Crawl4AI-powered scrapers."""
 
     requires_javascript: bool = False
 
-    async def fetch_page(self, url: str) -> Optional[str]:
-        """Fetch a page using Crawl4AI."""
-        try:
-            from crawl4ai import AsyncWebCrawler
+    # Bounds in-flight page fetches across every Crawl4AI scraper in the process
+    _fetch_semaphore: Optional[asyncio.BoundedSemaphore] = None
 
-            await self.rate_limit_delay()
+    def __init__(self, *args, crawler: Any = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._crawler = crawler  # shared crawler owned by the caller, if given
+        self._owns_crawler = False
+
+    @classmethod
+    def fetch_semaphore(cls) -> asyncio.BoundedSemaphore:
+        if Crawl4AIScraper._fetch_semaphore is None:
+            Crawl4AIScraper._fetch_semaphore = asyncio.BoundedSemaphore(
+                config.scraper.max_concurrent_requests
+            )
+        return Crawl4AIScraper._fetch_semaphore
+
+    async def setup_crawler(self):
+        """Start a crawler that stays open until close_crawler()."""
+        self._crawler = await start_crawler()
+        self._owns_crawler = True
+
+    async def close_crawler(self):
+        """Stop the crawler if this scraper started it."""
+        if self._crawler and self._owns_crawler:
+            await self._crawler.__aexit__(None, None, None)
+            self._crawler = None
+            self._owns_crawler = False
 
-            async with AsyncWebCrawler(verbose=False) as crawler:
-                result = await crawler.arun(url=url)
-                if result.success:
-                    return result.html
-                else:
-                    self.logger.error("Crawl4AI fetch failed", url=url, error=result.error_message)
-                    return None
+    async def fetch_page(self, url: str) -> Optional[str]:
+        """Fetch a page through the persistent crawler (one tab per fetch)."""
+        try:
+            if not self._crawler:
+                await self.setup_crawler()
+
+            async with self.fetch_semaphore():
+                await self.rate_limit_delay(url)
+                with self.timings.phase("navigation"):
+                    result = await self._crawler.arun(url=url)
+
+            if result.success:
+                await self.archive_page(url, result.html)
+                return result.html
+            else:
+                self.logger.error("Crawl4AI fetch failed", url=url, error=result.error_message)
+                return None
         except Exception as e:
             self.logger.exception("Crawl4AI error", url=url, error=str(e))
             return None
 
+    async def fetch_pages(self, urls: list[str]) -> dict[str, Optional[str]]:
+        """Fetch many pages through the crawler, max_concurrent_requests at a time."""
+        if not self._crawler:
+            await self.setup_crawler()
+
+        if not hasattr(self._crawler, "arun_many"):
+            pages = await asyncio.gather(*(self.fetch_page(url) for url in urls))
+            return dict(zip(urls, pages))
+
+        pages: dict[str, Optional[str]] = {}
+        chunk_size = max(1, config.scraper.max_concurrent_requests)
+        for i in range(0, len(urls), chunk_size):
+            chunk = urls[i:i + chunk_size]
+            for url in chunk:
+                await self.rate_limit_delay(url)
+
+            try:
+                with self.timings.phase("navigation"):
+                    results = await self._crawler.arun_many(urls=chunk)
+            except Exception as e:
+                self.logger.exception("Crawl4AI batch error", urls=len(chunk), error=str(e))
+                results = []
+
+            by_url = {result.url: result for result in results}
+            for url in chunk:
+                result = by_url.get(url)
+                if result is not None and result.success:
+                    pages[url] = result.html
+                    await self.archive_page(url, result.html)
+                else:
+                    self.logger.error(
+                        "Crawl4AI fetch failed",
+                        url=url,
+                        error=getattr(result, "error_message", "no result"),
+                    )
+                    pages[url] = None
+        return pages
+
+    async def __aenter__(self):
+        if not self._crawler:
+            await self.setup_crawler()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close_crawler()
+
+
+async def start_crawler() -> Any:
+    """Start a headless AsyncWebCrawler that stays open across fetches."""
+    from crawl4ai import AsyncWebCrawler
+
+    crawler = AsyncWebCrawler(verbose=False)
+    await crawler.__aenter__()
+    return crawler
+
 
 class PlaywrightScraper(BaseScraper):
     """Base class for Playwright-powered scrapers (JavaScript-heavy sites)."""
 
     requires_javascript: bool = True
 
-    def __init__(self, *args, **kwargs):
+    # Try a plain GET first and only open a browser when the listing markup is missing
+    http_first: bool = config.scraper.http_first
+
+    CONTEXT_OPTIONS = {
+        "viewport": {"width": 1920, "height": 1080},
+        "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+    }
+
+    # Request interception: listing parsers only need the DOM, so heavy
+    # resources and third-party trackers are aborted before they load.
+    block_resources: bool = True
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+    BLOCKED_DOMAINS = (
+        "google-analytics.com",
+        "googletagmanager.com",
+        "doubleclick.net",
+        "googlesyndication.com",
+        "adservice.google.com",
+        "facebook.net",
+        "facebook.com",
+        "hotjar.com",
+        "segment.io",
+        "segment.com",
+        "newrelic.com",
+        "nr-data.net",
+        "optimizely.com",
+        "criteo.com",
+        "adsrvr.org",
+        "bing.com",
+    )
+    # Assumed transfer size per blocked request type. Requests are aborted before
+    # any response arrives, so the bytes they would have cost can't be measured.
+    ASSUMED_BLOCKED_BYTES = {
+        "image": 60_000,
+        "media": 500_000,
+        "font": 40_000,
+        "script": 50_000,
+    }
+
+    def __init__(self, *args, browser_pool: Optional[BrowserPool] = None, **kwargs):
         super().__init__(*args, **kwargs)
+        self.browser_pool = browser_pool
+        self._playwright = None
         self._browser = None
         self._context = None
+        self.blocked_requests = 0
+        self.estimated_bytes_saved = 0
+
+    async def new_page(self, block_resources: Optional[bool] = None):
+        """Open a page, intercepting heavy resources unless disabled."""
+        with self.timings.phase("browser_acquire"):
+            if not self._context:
+                await self.setup_browser()
+            page = await self._context.new_page()
+
+        if self.block_resources if block_resources is None else block_resources:
+            await page.route("**/*", self._route_request)
+        return page
+
+    def is_blocked_request(self, request) -> bool:
+        """Whether a request should be aborted by the interception layer."""
+        if request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            return True
+        host = urlparse(request.url).hostname or ""
+        return any(host == domain or host.endswith(f".{domain}") for domain in self.BLOCKED_DOMAINS)
+
+    async def _route_request(self, route):
+        request = route.request
+        if self.is_blocked_request(request):
+            self.blocked_requests += 1
+            self.estimated_bytes_saved += self.ASSUMED_BLOCKED_BYTES.get(request.resource_type, 10_000)
+            await route.abort()
+        else:
+            await route.continue_()
 
     async def setup_browser(self):
-        """Initialize Playwright browser."""
+        """Get a browser context, from the shared pool when one is provided."""
+        if self.browser_pool:
+            self._context = await self.browser_pool.acquire(**self.CONTEXT_OPTIONS)
+            return
+
         from playwright.async_api import async_playwright
 
         self._playwright = await async_playwright().start()
         self._browser = await self._playwright.chromium.launch(
             headless=config.scraper.headless
         )
-        self._context = await self._browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
-        )
+        self._context = await self._browser.new_context(**self.CONTEXT_OPTIONS)
 
     async def close_browser(self):
-        """Close browser resources."""
+        """Close browser resources (or hand the context back to the pool)."""
+        if self.blocked_requests:
+            self.logger.info(
+                "Blocked page resources",
+                requests=self.blocked_requests,
+                estimated_bytes_saved=self.estimated_bytes_saved,  # from ASSUMED_BLOCKED_BYTES, not measured
+            )
+
+        if self.browser_pool:
+            if self._context:
+                await self.browser_pool.release(self._context)
+            self._context = None
+            return
+
         if self._context:
             await self._context.close()
         if self._browser:
             await self._browser.close()
         if self._playwright:
             await self._playwright.stop()
+        self._context = self._browser = self._playwright = None
 
-    async def fetch_page(self, url: str, wait_selector: Optional[str] = None) -> Optional[str]:
-        """Fetch a page using Playwright."""
-        if not self._browser:
-            await self.setup_browser()
-
-        await self.rate_limit_delay()
-
+    async def fetch_page(
+        self,
+        url: str,
+        wait_selector: Optional[str] = None,
+        wait_timeout: int = 30000,
+    ) -> Optional[str]:
+        """Fetch a page over plain HTTP when that suffices, otherwise with Playwright.
+
+        With a selector to look for, the first fetch of each URL pattern
+        probes with a pooled GET; if the markup is already server-rendered
+        the pattern stays on HTTP, and if only the browser finds it the
+        pattern goes straight to the browser from then on.
+        """
+        selector = wait_selector or self.expected_selector
+        strategy = get_fetch_strategy(self.name, url) if selector and self.http_first else "browser"
+
+        if strategy != "browser":
+            # Validators are only trusted for patterns HTTP already serves; an
+            # unknown pattern is probed unconditionally so a 304 can't skip a page
+            # whose saved validators belong to a shell the browser had to render.
+            response = await self.fetch_http(url, conditional=strategy == "http")
+            if response is NOT_MODIFIED:
+                return response
+            html = response.text if response is not None else None
+            if html is not None and self.has_expected_markup(html, selector):
+                self.stage_validators(url, response)
+                if strategy is None:
+                    self.logger.info("Serving pattern over HTTP", pattern=url_pattern(url))
+                    set_fetch_strategy(self.name, url, "http")
+                await self.archive_page(url, html)
+                return html
+            self.logger.debug("Expected markup missing over HTTP, escalating", url=url)
+
+        html = await self.fetch_browser(url, selector, wait_timeout)
+
+        # Only a browser that found what HTTP couldn't proves the site needs JavaScript
+        if html is not None and selector and self.http_first and strategy != "browser":
+            self.logger.info("Escalating pattern to browser", pattern=url_pattern(url))
+            set_fetch_strategy(self.name, url, "browser")
+        await self.archive_page(url, html)
+        return html
+
+    async def fetch_browser(
+        self,
+        url: str,
+        wait_selector: Optional[str] = None,
+        wait_timeout: int = 30000,
+    ) -> Optional[str]:
+        """Fetch a page using Playwright. None on errors or if wait_selector never appears."""
+        await self.rate_limit_delay(url)
+
+        page = None
         try:
-            page = await self._context.new_page()
-            await page.goto(url, timeout=config.scraper.page_load_timeout * 1000)
+            page = await self.new_page()
+            with self.timings.phase("navigation"):
+                await page.goto(url, timeout=config.scraper.page_load_timeout * 1000)
 
             if wait_selector:
-                await page.wait_for_selector(wait_selector, timeout=30000)
+                try:
+                    with self.timings.phase("selector_wait"):
+                        await page.wait_for_selector(wait_selector, timeout=wait_timeout)
+                except Exception:
+                    self.logger.info("Expected markup not found", url=url, selector=wait_selector)
+                    return None
 
-            content = await page.content()
-            await page.close()
-            return content
+            return await page.content()
 
         except Exception as e:
             self.logger.exception("Playwright error", url=url, error=str(e))
             return None
+        finally:
+            if page is not None:
+                await page.close()
 
     async def __aenter__(self):
-        await self.setup_browser()
+        # The browser is set up by the first page that needs one, so scrapes
+        # served entirely over HTTP never start Chromium.
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -0,0 +1,173 @@
+"""
+Browser Pool
+Process-wide pool of warm Playwright browsers shared across scrape jobs.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import structlog
+
+from ..config import config
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class PooledBrowser:
+    """A launched browser and its context accounting."""
+    browser: Any
+    contexts_served: int = 0
+    active_contexts: int = 0
+    retiring: bool = False
+
+    @property
+    def healthy(self) -> bool:
+        return not self.retiring and self.browser.is_connected()
+
+
+@dataclass
+class BrowserPoolStats:
+    """Counters exposed for monitoring."""
+    hits: int = 0  # context served from an already-warm browser
+    misses: int = 0  # context needed a browser launch
+    launches: int = 0
+    launch_seconds: float = 0.0
+    recycled: int = 0
+    crashed: int = 0
+    active_contexts: int = 0
+    browsers: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / max(self.hits + self.misses, 1), 3),
+            "launches": self.launches,
+            "avg_launch_seconds": round(self.launch_seconds / max(self.launches, 1), 3),
+            "recycled": self.recycled,
+            "crashed": self.crashed,
+            "active_contexts": self.active_contexts,
+            "browsers": self.browsers,
+        }
+
+
+class BrowserPool:
+    """Keeps up to `size` warm browsers and hands out an isolated context per job.
+
+    A browser is retired after `max_contexts` contexts (or when it crashes)
+    and closed once its last context is released, so long-running workers
+    don't accumulate Chromium memory leaks.
+    """
+
+    def __init__(self, size: Optional[int] = None, max_contexts: Optional[int] = None):
+        self.size = max(1, size or config.scraper.browser_pool_size)
+        self.max_contexts = max(1, max_contexts or config.scraper.browser_max_contexts)
+        self.stats = BrowserPoolStats()
+        self._playwright = None
+        self._browsers: list[PooledBrowser] = []
+        self._owners: dict[Any, PooledBrowser] = {}
+        self._lock = asyncio.Lock()
+        self.logger = logger.bind(component="browser_pool")
+
+    async def start(self):
+        """Start Playwright and warm the pool's browsers."""
+        async with self._lock:
+            while len(self._browsers) < self.size:
+                await self._launch()
+
+    async def close(self):
+        """Close every browser and stop Playwright."""
+        async with self._lock:
+            for pooled in self._browsers:
+                await self._close_browser(pooled)
+            self._browsers.clear()
+            self._owners.clear()
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def acquire(self, **context_options) -> Any:
+        """Return a fresh BrowserContext on a warm browser."""
+        async with self._lock:
+            self._prune()
+            pooled = self._pick()
+            if pooled is None:
+                self.stats.misses += 1
+                pooled = await self._launch()
+            else:
+                self.stats.hits += 1
+
+            context = await pooled.browser.new_context(**context_options)
+            pooled.contexts_served += 1
+            pooled.active_contexts += 1
+            if pooled.contexts_served >= self.max_contexts:
+                pooled.retiring = True
+            self._owners[context] = pooled
+            self.stats.active_contexts += 1
+            return context
+
+    async def release(self, context: Any):
+        """Close a context and recycle its browser if it has been retired."""
+        pooled = self._owners.pop(context, None)
+        try:
+            await context.close()
+        except Exception as e:
+            self.logger.debug("Context close failed", error=str(e))
+
+        if pooled is None:
+            return
+
+        async with self._lock:
+            pooled.active_contexts -= 1
+            self.stats.active_contexts -= 1
+            if pooled.retiring and pooled.active_contexts <= 0 and pooled in self._browsers:
+                self._browsers.remove(pooled)
+                self.stats.recycled += 1
+                await self._close_browser(pooled)
+            self.stats.browsers = len(self._browsers)
+
+    def _pick(self) -> Optional[PooledBrowser]:
+        """Least-loaded healthy browser, or None if another should be launched."""
+        healthy = [b for b in self._browsers if b.healthy]
+        if len(healthy) < self.size and not any(b.active_contexts == 0 for b in healthy):
+            return None
+        if not healthy:
+            return None
+        return min(healthy, key=lambda b: b.active_contexts)
+
+    def _prune(self):
+        """Drop browsers that crashed or disconnected."""
+        for pooled in list(self._browsers):
+            if not pooled.browser.is_connected():
+                self._browsers.remove(pooled)
+                self.stats.crashed += 1
+                self.logger.warning("Pooled browser disconnected", served=pooled.contexts_served)
+        self.stats.browsers = len(self._browsers)
+
+    async def _launch(self) -> PooledBrowser:
+        if self._playwright is None:
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+
+        started = time.monotonic()
+        browser_type = getattr(self._playwright, config.scraper.browser_type)
+        browser = await browser_type.launch(headless=config.scraper.headless)
+        elapsed = time.monotonic() - started
+
+        self.stats.launches += 1
+        self.stats.launch_seconds += elapsed
+        pooled = PooledBrowser(browser=browser)
+        self._browsers.append(pooled)
+        self.stats.browsers = len(self._browsers)
+        self.logger.info("Launched pooled browser", seconds=round(elapsed, 2), browsers=len(self._browsers))
+        return pooled
+
+    async def _close_browser(self, pooled: PooledBrowser):
+        try:
+            await pooled.browser.close()
+        except Exception as e:
+            self.logger.debug("Browser close failed", error=str(e))
@@ -0,0 +1,218 @@
+"""
+Lead Models
+ForeclosureLead, plus LeadBatch: leads stored column-wise, validated a page
+at a time in one pydantic call and handed to the database as COPY records
+without building a model per lead.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Any, Iterator, Optional, Union
+
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing_extensions import NotRequired, Required, TypedDict
+
+from ..utils.address import address_key
+
+
+def lead_id(property_address: str, state_abbr: str, owner_name: str, sale_date: Optional[str]) -> str:
+    """Stable lead id: hash of the normalized address key plus owner and sale date."""
+    unique_string = f"{address_key(property_address, state_abbr)}|{owner_name}|{sale_date or ''}"
+    return hashlib.sha256(unique_string.encode()).hexdigest()[:16]
+
+
+class ForeclosureLead(BaseModel):
+    """Normalized foreclosure lead data model."""
+    # Identifiers
+    id: str = ""  # Generated from hash of unique fields
+    source: str
+    source_type: str
+    batch_id: str = ""
+
+    # Property info
+    property_address: str
+    city: Optional[str] = None
+    state: Optional[str] = None
+    state_abbr: str
+    zip_code: Optional[str] = None
+    parcel_id: Optional[str] = None
+    county: Optional[str] = None
+
+    # Owner info
+    owner_name: str
+    owner_address: Optional[str] = None
+
+    # Foreclosure details
+    case_number: Optional[str] = None
+    sale_date: Optional[str] = None
+    sale_amount: Optional[float] = None
+    opening_bid: Optional[float] = None
+    mortgage_amount: Optional[float] = None
+    surplus_amount: Optional[float] = None
+
+    # Parties
+    lender_name: Optional[str] = None
+    trustee_name: Optional[str] = None
+    attorney_name: Optional[str] = None
+
+    # Classification
+    foreclosure_type: Optional[str] = None  # judicial, non-judicial, tax
+
+    # Source metadata
+    source_url: Optional[str] = None
+    raw_data: Optional[dict] = None
+    scraped_at: datetime = Field(default_factory=datetime.utcnow)
+
+    def generate_id(self) -> str:
+        """Generate unique ID from key fields."""
+        return lead_id(self.property_address, self.state_abbr, self.owner_name, self.sale_date)
+
+    def model_post_init(self, __context: Any) -> None:
+        if not self.id:
+            self.id = self.generate_id()
+
+
+LEAD_FIELDS = tuple(ForeclosureLead.model_fields)
+
+# The model's fields as a TypedDict, so a whole page of plain dicts validates
+# in one pydantic-core call with the same coercion rules as the model.
+LeadFields = TypedDict(
+    "LeadFields",
+    {
+        name: Required[info.annotation] if info.is_required() else NotRequired[info.annotation]
+        for name, info in ForeclosureLead.model_fields.items()
+    },
+)
+
+_LEAD_ROWS = TypeAdapter(list[LeadFields])
+
+# Column fill for fields a row leaves out (scraped_at is stamped per batch)
+_FIELD_DEFAULTS = {
+    name: None if info.is_required() or info.default_factory else info.default
+    for name, info in ForeclosureLead.model_fields.items()
+}
+
+
+class LeadRow:
+    """Read-only view of one lead in a LeadBatch; reads like a ForeclosureLead."""
+
+    __slots__ = ("batch", "index")
+
+    def __init__(self, batch: "LeadBatch", index: int):
+        self.batch = batch
+        self.index = index
+
+    def to_lead(self) -> ForeclosureLead:
+        return self.batch.lead(self.index)
+
+    def __repr__(self) -> str:
+        return f"LeadRow(id={self.id!r}, property_address={self.property_address!r})"
+
+
+for _name in LEAD_FIELDS:
+    setattr(LeadRow, _name, property(lambda row, _name=_name: row.batch.columns[_name][row.index]))
+
+
+class LeadBatch:
+    """Leads stored column-wise: one list per ForeclosureLead field.
+
+    Parse workers return a LeadBatch per page (one list per field crosses
+    the process boundary, not a model per lead), scrapers yield LeadRow
+    views over it, and the worker COPYs records() straight into the
+    staging table.
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns: Optional[dict[str, list]] = None):
+        self.columns = columns if columns is not None else {name: [] for name in LEAD_FIELDS}
+
+    @classmethod
+    def validate(cls, rows: list[dict], logger: Any = None) -> "LeadBatch":
+        """Validate lead field dicts in one pass; rows that fail are logged and dropped."""
+        try:
+            valid = _LEAD_ROWS.validate_python(rows)
+        except ValidationError as e:
+            invalid = {error["loc"][0] for error in e.errors() if error["loc"]}
+            if logger:
+                logger.warning("Dropping invalid leads", count=len(invalid), error=str(e.errors()[0]["msg"]))
+            valid = _LEAD_ROWS.validate_python([row for i, row in enumerate(rows) if i not in invalid])
+        return cls.from_dicts(valid)
+
+    @classmethod
+    def from_dicts(cls, rows: list[dict]) -> "LeadBatch":
+        """Columns from already-validated field dicts; fills defaults and lead ids."""
+        # Pre-filled with defaults, so each row only writes the fields it sets
+        columns = {name: [default] * len(rows) for name, default in _FIELD_DEFAULTS.items()}
+        for index, row in enumerate(rows):
+            for name, value in row.items():
+                columns[name][index] = value
+
+        scraped_at = datetime.utcnow()
+        columns["scraped_at"] = [value or scraped_at for value in columns["scraped_at"]]
+
+        ids = columns["id"]
+        for i, value in enumerate(ids):
+            if not value:
+                ids[i] = lead_id(
+                    columns["property_address"][i],
+                    columns["state_abbr"][i],
+                    columns["owner_name"][i],
+                    columns["sale_date"][i],
+                )
+        return cls(columns)
+
+    @classmethod
+    def from_leads(cls, leads: list[Union[ForeclosureLead, LeadRow]]) -> "LeadBatch":
+        batch = cls()
+        for lead in leads:
+            batch.append(lead)
+        return batch
+
+    def append(self, lead: Union[ForeclosureLead, LeadRow]):
+        if isinstance(lead, LeadRow):
+            source, index = lead.batch.columns, lead.index
+            for name, column in self.columns.items():
+                column.append(source[name][index])
+        else:
+            for name, column in self.columns.items():
+                column.append(getattr(lead, name))
+
+    def extend(self, other: "LeadBatch"):
+        for name, column in self.columns.items():
+            column.extend(other.columns[name])
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def __iter__(self) -> Iterator[LeadRow]:
+        for index in range(len(self)):
+            yield LeadRow(self, index)
+
+    def __getitem__(self, index: int) -> LeadRow:
+        if not -len(self) <= index < len(self):
+            raise IndexError("lead index out of range")
+        return LeadRow(self, index % len(self))
+
+    def lead(self, index: int) -> ForeclosureLead:
+        """Build the model for one row, without validating it again."""
+        return ForeclosureLead.model_construct(**{name: column[index] for name, column in self.columns.items()})
+
+    def to_leads(self) -> list[ForeclosureLead]:
+        return [self.lead(index) for index in range(len(self))]
+
+    def dedup(self) -> "LeadBatch":
+        """Drop duplicate lead ids, keeping the last occurrence of each.
+
+        ON CONFLICT cannot touch the same row twice in one statement, and the
+        later card on a page is the most recently rendered copy of the listing.
+        """
+        last = {value: index for index, value in enumerate(self.columns["id"])}
+        if len(last) == len(self):
+            return self
+        keep = sorted(last.values())
+        return LeadBatch({name: [column[i] for i in keep] for name, column in self.columns.items()})
+
+    def records(self, columns: tuple[str, ...]) -> Iterator[tuple]:
+        """Row tuples in `columns` order, ready for copy_records_to_table()."""
+        return zip(*(self.columns[name] for name in columns))
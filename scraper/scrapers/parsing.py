@@ -0,0 +1,365 @@
+"""
+Listing Page Parsing
+Pluggable HTML parser backends with selectors compiled once per scraper class.
+
+Scrapers declare their CSS selectors in a SELECTORS dict; the active backend
+compiles them on first use and hands parse_listing() lightweight node
+handles that expose the same small API whichever library sits underneath:
+
+    select_one(selector) / select(selector) / text() / attr(name) / html()
+"""
+
+import multiprocessing
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterator, Optional
+
+from ..config import config
+
+# Bytes fed to the lxml pull parser at a time while streaming cards
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class Node(ABC):
+    """Backend-neutral handle on a parsed element."""
+
+    __slots__ = ("_el",)
+
+    def __init__(self, el: Any):
+        self._el = el
+
+    @abstractmethod
+    def select_one(self, selector: Any) -> Optional["Node"]:
+        pass
+
+    @abstractmethod
+    def select(self, selector: Any) -> list["Node"]:
+        pass
+
+    @abstractmethod
+    def text(self, strip: bool = True) -> str:
+        """Text content; with strip, each text node stripped and joined (like get_text(strip=True))."""
+        pass
+
+    @abstractmethod
+    def attr(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def html(self) -> str:
+        pass
+
+
+class Document(ABC):
+    """A parsed page: iterate its cards and query the rest of the page."""
+
+    @abstractmethod
+    def cards(self, selector: Any) -> Iterator[Node]:
+        pass
+
+    @abstractmethod
+    def select_one(self, selector: Any) -> Optional[Node]:
+        pass
+
+    @abstractmethod
+    def select(self, selector: Any) -> list[Node]:
+        pass
+
+
+class ParserBackend(ABC):
+    """Parses pages and compiles selectors for one HTML library."""
+
+    name: str = "base"
+
+    def compile(self, css: str) -> Any:
+        return css
+
+    @abstractmethod
+    def parse(self, html: str) -> Document:
+        pass
+
+
+# --- lxml ------------------------------------------------------------------
+
+
+class LxmlSelector:
+    """A CSS selector compiled to XPath, plus a self-match for streaming."""
+
+    __slots__ = ("css", "find", "match")
+
+    def __init__(self, css: str):
+        from cssselect import HTMLTranslator
+        from lxml import etree
+
+        translator = HTMLTranslator()
+        self.css = css
+        self.find = etree.XPath(translator.css_to_xpath(css))
+        # Only selectors without combinators can be tested against a lone element
+        simple = not any(c in part.strip() for part in css.split(",") for c in " >+~")
+        self.match = etree.XPath(translator.css_to_xpath(css, prefix="self::")) if simple else None
+
+
+class LxmlNode(Node):
+    __slots__ = ()
+
+    def select_one(self, selector: LxmlSelector) -> Optional["LxmlNode"]:
+        found = selector.find(self._el)
+        return LxmlNode(found[0]) if found else None
+
+    def select(self, selector: LxmlSelector) -> list["LxmlNode"]:
+        return [LxmlNode(el) for el in selector.find(self._el)]
+
+    def text(self, strip: bool = True) -> str:
+        if strip:
+            return "".join(part.strip() for part in self._el.itertext())
+        return "".join(self._el.itertext())
+
+    def attr(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        return self._el.get(name, default)
+
+    def html(self) -> str:
+        from lxml import etree
+
+        return etree.tostring(self._el, encoding="unicode", method="html")
+
+
+class LxmlDocument(Document):
+    """Streams cards out of an incremental parse; the full tree is built lazily."""
+
+    def __init__(self, html: str):
+        self._html = html
+        self._root = None
+
+    @property
+    def root(self):
+        if self._root is None:
+            import lxml.html
+
+            self._root = lxml.html.document_fromstring(self._html or "<html></html>")
+        return self._root
+
+    def cards(self, selector: LxmlSelector) -> Iterator[Node]:
+        if self._root is not None or selector.match is None:
+            for el in selector.find(self.root):
+                yield LxmlNode(el)
+            return
+
+        from lxml import etree
+
+        # Yield each card as soon as its closing tag is parsed, then clear it
+        # so large result pages never hold every card subtree at once.
+        parser = etree.HTMLPullParser(events=("end",))
+        html = self._html or ""
+        for i in range(0, len(html), STREAM_CHUNK_SIZE):
+            parser.feed(html[i:i + STREAM_CHUNK_SIZE])
+            for _, el in parser.read_events():
+                if isinstance(el.tag, str) and selector.match(el):
+                    yield LxmlNode(el)
+                    el.clear(keep_tail=True)
+        self._root = parser.close()
+        for _, el in parser.read_events():
+            if isinstance(el.tag, str) and selector.match(el):
+                yield LxmlNode(el)
+                el.clear(keep_tail=True)
+
+    def select_one(self, selector: LxmlSelector) -> Optional[Node]:
+        found = selector.find(self.root)
+        return LxmlNode(found[0]) if found else None
+
+    def select(self, selector: LxmlSelector) -> list[Node]:
+        return [LxmlNode(el) for el in selector.find(self.root)]
+
+
+class LxmlBackend(ParserBackend):
+    name = "lxml"
+
+    def compile(self, css: str) -> LxmlSelector:
+        return LxmlSelector(css)
+
+    def parse(self, html: str) -> Document:
+        return LxmlDocument(html)
+
+
+# --- selectolax --------------------------------------------------------------
+
+
+class SelectolaxNode(Node):
+    __slots__ = ()
+
+    def select_one(self, selector: str) -> Optional["SelectolaxNode"]:
+        found = self._el.css_first(selector)
+        return SelectolaxNode(found) if found is not None else None
+
+    def select(self, selector: str) -> list["SelectolaxNode"]:
+        return [SelectolaxNode(el) for el in self._el.css(selector)]
+
+    def text(self, strip: bool = True) -> str:
+        return self._el.text(strip=strip)
+
+    def attr(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        value = self._el.attributes.get(name)
+        return default if value is None else value
+
+    def html(self) -> str:
+        return self._el.html or ""
+
+
+def _selectolax_parser() -> Any:
+    """Lexbor engine when available (selectolax >= 0.3.13), else the older Modest engine."""
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+
+        return LexborHTMLParser
+    except ImportError:
+        from selectolax.parser import HTMLParser
+
+        return HTMLParser
+
+
+class SelectolaxDocument(Document):
+    def __init__(self, html: str):
+        self._tree = _selectolax_parser()(html or "")
+
+    def cards(self, selector: str) -> Iterator[Node]:
+        for el in self._tree.css(selector):
+            yield SelectolaxNode(el)
+
+    def select_one(self, selector: str) -> Optional[Node]:
+        found = self._tree.css_first(selector)
+        return SelectolaxNode(found) if found is not None else None
+
+    def select(self, selector: str) -> list[Node]:
+        return [SelectolaxNode(el) for el in self._tree.css(selector)]
+
+
+class SelectolaxBackend(ParserBackend):
+    """selectolax parser; selectors are validated once and kept as strings."""
+
+    name = "selectolax"
+
+    def compile(self, css: str) -> str:
+        _selectolax_parser()("<p></p>").css(css)  # Raise on invalid selectors up front
+        return css
+
+    def parse(self, html: str) -> Document:
+        return SelectolaxDocument(html)
+
+
+# --- BeautifulSoup (reference) ---------------------------------------------
+
+
+class SoupNode(Node):
+    __slots__ = ()
+
+    def select_one(self, selector: Any) -> Optional["SoupNode"]:
+        found = selector.select_one(self._el)
+        return SoupNode(found) if found is not None else None
+
+    def select(self, selector: Any) -> list["SoupNode"]:
+        return [SoupNode(el) for el in selector.select(self._el)]
+
+    def text(self, strip: bool = True) -> str:
+        return self._el.get_text(strip=strip)
+
+    def attr(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        return self._el.get(name, default)
+
+    def html(self) -> str:
+        return str(self._el)
+
+
+class SoupDocument(Document):
+    def __init__(self, html: str):
+        from bs4 import BeautifulSoup
+
+        self._soup = BeautifulSoup(html or "", "lxml")
+
+    def cards(self, selector: Any) -> Iterator[Node]:
+        for el in selector.select(self._soup):
+            yield SoupNode(el)
+
+    def select_one(self, selector: Any) -> Optional[Node]:
+        found = selector.select_one(self._soup)
+        return SoupNode(found) if found is not None else None
+
+    def select(self, selector: Any) -> list[Node]:
+        return [SoupNode(el) for el in selector.select(self._soup)]
+
+
+class SoupBackend(ParserBackend):
+    """BeautifulSoup with soupsieve-compiled selectors; slowest, most forgiving."""
+
+    name = "soup"
+
+    def compile(self, css: str) -> Any:
+        import soupsieve
+
+        return soupsieve.compile(css)
+
+    def parse(self, html: str) -> Document:
+        return SoupDocument(html)
+
+
+PARSER_BACKENDS: dict[str, type[ParserBackend]] = {
+    "lxml": LxmlBackend,
+    "selectolax": SelectolaxBackend,
+    "soup": SoupBackend,
+}
+
+_backends: dict[str, ParserBackend] = {}
+_compiled: dict[tuple[str, str], Any] = {}
+_compiled_sets: dict[tuple[type, str], dict[str, Any]] = {}
+
+
+def get_parser_backend(name: Optional[str] = None) -> ParserBackend:
+    """Backend by name (default: PARSER_BACKEND), created once per process."""
+    name = name or config.scraper.parser_backend
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {name} (expected one of {', '.join(PARSER_BACKENDS)})")
+    if name not in _backends:
+        _backends[name] = PARSER_BACKENDS[name]()
+    return _backends[name]
+
+
+def compile_selector(css: str, backend: ParserBackend) -> Any:
+    """A selector compiled for a backend, cached per process."""
+    key = (backend.name, css)
+    if key not in _compiled:
+        _compiled[key] = backend.compile(css)
+    return _compiled[key]
+
+
+def compiled_selectors(owner: type, backend: ParserBackend) -> dict[str, Any]:
+    """owner.SELECTORS compiled for a backend, cached per class."""
+    key = (owner, backend.name)
+    if key not in _compiled_sets:
+        _compiled_sets[key] = {
+            field: compile_selector(css, backend) for field, css in getattr(owner, "SELECTORS", {}).items()
+        }
+    return _compiled_sets[key]
+
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """Process-wide pool for CPU-bound page parsing, or None when offload is disabled."""
+    global _parse_pool
+    if not config.scraper.parse_offload:
+        return None
+    if _parse_pool is None:
+        workers = config.scraper.parse_workers or os.cpu_count() or 1
+        # forkserver: children never inherit the worker's event loop or sockets
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _parse_pool
+
+
+def shutdown_parse_pool(wait: bool = True) -> None:
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=wait, cancel_futures=True)
+        _parse_pool = None
@@ -0,0 +1,63 @@
+"""
+Benchmark Sale Date Parsing
+Compares dateutil on every value against parse_date_string()'s learned
+per-source strptime format, across typical auction-date layouts.
+
+Usage:
+    python -m scraper.scripts.benchmark_dates [--values 20000]
+"""
+
+import argparse
+import time
+
+from dateutil import parser as dateutil_parser
+
+from scraper.utils.dates import learned_format, parse_date_string
+
+# One source per layout, as each site renders every sale date the same way
+SAMPLES = {
+    "realauction": "03/{day:02d}/2026",
+    "auction_com_json": "2026-03-{day:02d}T14:00:00.000Z",
+    "auction_com_html": "Mar {day}, 2026",
+    "clerk_long": "Tuesday, March {day}, 2026",
+    "clerk_time": "03/{day:02d}/2026 10:00 AM",
+    "iso": "2026-03-{day:02d}",
+}
+
+
+def dateutil_only(values: list[str]) -> list[str]:
+    return [dateutil_parser.parse(value).strftime("%Y-%m-%d") for value in values]
+
+
+def learned(values: list[str], source: str) -> list[str]:
+    return [parse_date_string(value, source) for value in values]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sale date parsing")
+    parser.add_argument("--values", type=int, default=20_000, help="Dates per layout")
+    args = parser.parse_args()
+
+    print(f"{args.values} dates per layout\n")
+    print(f"{'source':<18}{'dateutil/s':>12}{'learned/s':>12}{'speedup':>9}  format")
+
+    for source, template in SAMPLES.items():
+        values = [template.format(day=i % 28 + 1) for i in range(args.values)]
+
+        started = time.perf_counter()
+        expected = dateutil_only(values)
+        dateutil_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        parsed = learned(values, source)
+        learned_seconds = time.perf_counter() - started
+
+        assert parsed == expected, f"{source}: learned parse disagrees with dateutil"
+        print(
+            f"{source:<18}{args.values / dateutil_seconds:>12.0f}{args.values / learned_seconds:>12.0f}"
+            f"{dateutil_seconds / learned_seconds:>8.1f}x  {learned_format(source)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
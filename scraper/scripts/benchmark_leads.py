@@ -0,0 +1,91 @@
+"""
+Benchmark Lead Batches
+Compares building, de-duplicating and flattening leads to COPY records as
+one ForeclosureLead model per lead versus a columnar LeadBatch.
+
+Usage:
+    python -m scraper.scripts.benchmark_leads [--leads 100000] [--repeat 3]
+"""
+
+import argparse
+import pickle
+import time
+import tracemalloc
+from typing import Callable
+
+from scraper.scrapers.leads import ForeclosureLead, LeadBatch
+from scraper.workers.job_worker import LEAD_COLUMNS
+
+
+def synthetic_rows(count: int) -> list[dict]:
+    """Field dicts shaped like parse_card() output, ~2% duplicate listings."""
+    distinct = count - count // 50
+    return [
+        dict(
+            source="RealAuctionScraper_Miami-Dade",
+            source_type="auction",
+            batch_id="bench",
+            property_address=f"{i % distinct} OCEAN DR",
+            city="Miami",
+            state_abbr="FL",
+            county="Miami-Dade",
+            owner_name=f"Owner {i % distinct}",
+            case_number=f"2026-CA-{i:06d}",
+            sale_date=f"2026-03-{i % distinct % 28 + 1:02d}",
+            sale_amount=float(i * 1000),
+            lender_name="First National Bank",
+            parcel_id=f"01-{i:04d}-000",
+            foreclosure_type="judicial",
+        )
+        for i in range(count)
+    ]
+
+
+def per_model(rows: list[dict]) -> tuple[int, int]:
+    leads = [ForeclosureLead(**row) for row in rows]
+    unique = list({lead.id: lead for lead in leads}.values())
+    records = [tuple(getattr(lead, column) for column in LEAD_COLUMNS) for lead in unique]
+    return len(records), len(pickle.dumps([tuple(lead.__dict__.values()) for lead in leads]))
+
+
+def columnar(rows: list[dict]) -> tuple[int, int]:
+    batch = LeadBatch.validate(rows)
+    records = list(batch.dedup().records(LEAD_COLUMNS))
+    return len(records), len(pickle.dumps(batch))
+
+
+def measure(fn: Callable, rows: list[dict], repeat: int) -> tuple[int, int, float, int]:
+    """Best-of-`repeat` seconds and the peak traced allocation of one run."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        records, pickled = fn(rows)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    fn(rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return records, pickled, best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-lead models against LeadBatch")
+    parser.add_argument("--leads", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = synthetic_rows(args.leads)
+    print(f"{args.leads} leads, best of {args.repeat}\n")
+    print(f"{'container':<12}{'records':>9}{'seconds':>10}{'leads/s':>11}{'peak MB':>10}{'pickle MB':>11}")
+
+    for name, fn in (("model", per_model), ("LeadBatch", columnar)):
+        records, pickled, seconds, peak = measure(fn, rows, args.repeat)
+        print(
+            f"{name:<12}{records:>9}{seconds:>10.3f}{args.leads / seconds:>11.0f}"
+            f"{peak / 1_000_000:>10.1f}{pickled / 1_000_000:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
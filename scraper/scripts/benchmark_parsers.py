@@ -0,0 +1,133 @@
+"""
+Benchmark Parser Backends
+Measures listing cards parsed per second for each HTML parser backend
+against recorded listing pages.
+
+Usage:
+    python -m scraper.scripts.benchmark_parsers [PAGES...] [--scraper realauction]
+    python -m scraper.scripts.benchmark_parsers --synthetic 2000
+
+PAGES are .html files or directories of them (default: $DATA_DIR/recorded_pages).
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+from scraper.config import config
+from scraper.scrapers.auction_com import AuctionComScraper, RealAuctionScraper
+from scraper.scrapers.parsing import PARSER_BACKENDS, compiled_selectors, get_parser_backend
+
+SCRAPERS = {
+    "auction_com": AuctionComScraper,
+    "realauction": RealAuctionScraper,
+}
+
+SYNTHETIC_CARDS = {
+    "auction_com": """
+    <div class="property-card">
+      <a href="/property/{i}"><img src="/img/{i}.jpg"></a>
+      <div class="property-address">{i} Main Street, Orlando, FL 32801</div>
+      <div class="property-price">$ {i},500</div>
+      <div class="auction-date">Mar {day}, 2026</div>
+    </div>""",
+    "realauction": """
+    <div class="auction-item">
+      <h3>{i} Ocean Drive, Miami</h3>
+      <span class="case-number">2026-CA-{i:06d}</span>
+      <span class="auction-date">03/{day:02d}/2026</span>
+      <span class="opening-bid">$ {i},000.00</span>
+      <span class="plaintiff">First National Bank</span>
+      <span class="defendant">Owner {i}</span>
+      <span class="parcel">01-{i:04d}-000</span>
+    </div>""",
+}
+
+
+def synthetic_page(scraper_name: str, cards: int) -> str:
+    """A listing page with `cards` cards wrapped in typical page chrome."""
+    template = SYNTHETIC_CARDS[scraper_name]
+    body = "".join(template.format(i=i, day=i % 28 + 1) for i in range(1, cards + 1))
+    chrome = "<nav>" + "".join(f"<a href='/n/{i}'>Link {i}</a>" for i in range(200)) + "</nav>"
+    return f"<html><head><title>Listings</title></head><body>{chrome}<main>{body}</main></body></html>"
+
+
+def load_pages(paths: list[str]) -> list[str]:
+    pages = []
+    for path in map(Path, paths):
+        files = sorted(path.glob("*.html")) if path.is_dir() else [path]
+        pages.extend(f.read_text(encoding="utf-8", errors="replace") for f in files if f.is_file())
+    return pages
+
+
+def extract_cards(selectors: dict, backend, pages: list[str], repeat: int) -> tuple[int, float]:
+    """Parse pages and pull every selector's text out of every card; returns (cards, seconds)."""
+    card_selector = selectors["card"]
+    fields = [selector for name, selector in selectors.items() if name not in ("card", "next")]
+
+    cards = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            for card in backend.parse(html).cards(card_selector):
+                cards += 1
+                for selector in fields:
+                    node = card.select_one(selector)
+                    if node is not None:
+                        node.text()
+    return cards, time.perf_counter() - started
+
+
+async def build_leads(scraper, backend, selectors: dict, pages: list[str], repeat: int) -> tuple[int, float]:
+    """Full parse_listing() path including lead construction; returns (leads, seconds)."""
+    leads = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            for card in backend.parse(html).cards(selectors["card"]):
+                if await scraper.parse_listing(card):
+                    leads += 1
+    return leads, time.perf_counter() - started
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark listing parser backends")
+    parser.add_argument("pages", nargs="*", help="Recorded .html pages or directories")
+    parser.add_argument("--scraper", choices=SCRAPERS, default="auction_com")
+    parser.add_argument("--backends", nargs="+", choices=PARSER_BACKENDS, default=list(PARSER_BACKENDS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--synthetic", type=int, default=0, help="Generate a page with N cards instead")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        pages = [synthetic_page(args.scraper, args.synthetic)]
+    else:
+        pages = load_pages(args.pages or [str(Path(config.scraper.data_dir) / "recorded_pages")])
+    if not pages:
+        parser.error("No recorded pages found; pass .html files or use --synthetic N")
+
+    scraper = SCRAPERS[args.scraper](state_abbr="FL")
+    size_mb = sum(len(page) for page in pages) / 1_000_000
+    print(f"{args.scraper}: {len(pages)} page(s), {size_mb:.1f} MB, x{args.repeat}\n")
+    print(f"{'backend':<12}{'cards':>9}{'parse s':>10}{'cards/s':>10}{'leads':>9}{'lead s':>10}{'leads/s':>10}")
+
+    for name in args.backends:
+        try:
+            backend = get_parser_backend(name)
+            selectors = compiled_selectors(type(scraper), backend)
+        except ImportError as e:
+            print(f"{name:<12}  unavailable ({e})")
+            continue
+
+        config.scraper.parser_backend = name
+        cards, parse_seconds = extract_cards(selectors, backend, pages, args.repeat)
+        leads, lead_seconds = await build_leads(scraper, backend, selectors, pages, args.repeat)
+        print(
+            f"{name:<12}{cards:>9}{parse_seconds:>10.2f}{cards / max(parse_seconds, 1e-9):>10.0f}"
+            f"{leads:>9}{lead_seconds:>10.2f}{leads / max(lead_seconds, 1e-9):>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
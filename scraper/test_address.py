@@ -0,0 +1,65 @@
+"""
+Tests for the USPS street address normalizer.
+
+    pip install pytest
+    python -m pytest scraper/test_address.py
+"""
+
+import pytest
+
+from scraper.utils.address import address_key, normalize_address
+
+
+@pytest.mark.parametrize(
+    "raw, normalized",
+    [
+        ("123 North Main Street, Apt. #4", "123 N MAIN ST APT 4"),
+        ("123 Main St.", "123 MAIN ST"),
+        ("456 Oak Avenue", "456 OAK AVE"),
+        ("789 Sunset Boulevard Suite 200", "789 SUNSET BLVD STE 200"),
+        ("10 Elm Street North", "10 ELM ST N"),
+        ("55 Southwest 8th Terrace", "55 SW 8TH TER"),
+        ("123 1/2 Maple Lane", "123 1/2 MAPLE LN"),
+        ("12-B Harbor Drive Unit C", "12-B HARBOR DR UNIT C"),
+        ("900 Pine Road #12", "900 PINE RD # 12"),
+        ("4 Ocean Court Penthouse", "4 OCEAN CT PH"),
+    ],
+)
+def test_normalizes_to_usps_abbreviations(raw, normalized):
+    assert normalize_address(raw) == normalized
+
+
+@pytest.mark.parametrize(
+    "raw, normalized",
+    [
+        # Suffix words only abbreviate in the suffix position
+        ("100 North St", "100 NORTH ST"),
+        ("42 Court Street", "42 COURT ST"),
+        ("7 Park Avenue", "7 PARK AVE"),
+        # Words that merely start like a suffix or directional stay whole
+        ("300 Northridge Road", "300 NORTHRIDGE RD"),
+        ("18 Courtland Way", "18 COURTLAND WAY"),
+        # A designator without a unit value is part of the street name
+        ("25 Lot Lane", "25 LOT LN"),
+        ("61 Floor Street", "61 FLOOR ST"),
+    ],
+)
+def test_abbreviates_by_position(raw, normalized):
+    assert normalize_address(raw) == normalized
+
+
+def test_is_idempotent():
+    for raw in ("123 North Main Street, Apt. #4", "10 Elm Street North", "300 Northridge Road"):
+        once = normalize_address(raw)
+        assert normalize_address(once) == once
+
+
+@pytest.mark.parametrize("raw", [None, "", "  ", ",."])
+def test_empty_addresses(raw):
+    assert normalize_address(raw) == ""
+
+
+def test_address_key_matches_spelling_variants():
+    assert address_key("123 North Main Street", "fl") == address_key("123 N. MAIN ST", "FL")
+    assert address_key("123 N Main St", "FL") == "123 N MAIN ST|FL"
+    assert address_key("123 N Main St", "FL") != address_key("123 N Main St", "GA")
@@ -0,0 +1,228 @@
+"""
+Tests for paging Auction.com's captured listing API.
+
+The captured request and Playwright's APIRequestContext are replaced by
+small fakes, so no browser or network is needed:
+
+    pip install pytest
+    python -m pytest scraper/test_auction_com_paging.py
+"""
+
+import asyncio
+import json
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from scraper.scrapers.auction_com import (
+    AuctionComScraper,
+    advance_paging,
+    find_listings,
+    find_total,
+    replay_headers,
+)
+
+API_URL = "https://www.auction.com/api/search?state=FL"
+PAGE_SIZE = 2
+
+
+def listing(n: int) -> dict:
+    return {"id": n, "address": {"street": f"{n} Main St", "city": "Miami", "state": "FL"}}
+
+
+def api_page(numbers, total=None) -> dict:
+    payload = {"data": {"results": [listing(n) for n in numbers]}}
+    if total is not None:
+        payload["data"]["totalCount"] = total
+    return payload
+
+
+class FakeRequest:
+    def __init__(self, url=API_URL, method="GET", post_data=None, headers=None):
+        self.url = url
+        self.method = method
+        self.post_data = post_data
+        self.headers = headers or {
+            "host": "www.auction.com",
+            "content-length": "120",
+            "authorization": "Bearer token",
+            "x-api-key": "key",
+        }
+
+
+class FakeResponse:
+    def __init__(self, payload=None, status=200):
+        self.status = status
+        self.ok = status < 400
+        self._body = json.dumps(payload).encode()
+
+    async def body(self):
+        return self._body
+
+
+class FakeAPI:
+    """page.request: answers follow-up API calls from a list of responses."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    async def get(self, url, headers=None):
+        self.calls.append({"url": url, "headers": headers})
+        return self.responses.pop(0)
+
+    async def fetch(self, url, method=None, data=None, headers=None):
+        self.calls.append({"url": url, "method": method, "data": json.loads(data), "headers": headers})
+        return self.responses.pop(0)
+
+
+class FakePage:
+    def __init__(self, responses):
+        self.request = FakeAPI(responses)
+
+
+class Capture:
+    def __init__(self, request, payload):
+        self.request = request
+        self.payload = payload
+        self.body = json.dumps(payload).encode()
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    scraper = AuctionComScraper(state_abbr="FL")
+
+    async def no_delay(url=None):
+        pass
+
+    monkeypatch.setattr(scraper, "rate_limit_delay", no_delay)
+    return scraper
+
+
+def stream(scraper, request, first_payload, responses):
+    page = FakePage(responses)
+
+    async def run():
+        capture = Capture(request, first_payload)
+        return [lead async for lead in scraper.stream_api_listings(page, capture)]
+
+    return asyncio.run(run()), page.request.calls
+
+
+# ============================================================================
+# Paging helpers
+# ============================================================================
+
+@pytest.mark.parametrize(
+    "params, expected",
+    [
+        ({"page": "1"}, {"page": 2}),
+        ({"pageNumber": 3}, {"pageNumber": 4}),
+        ({"offset": "0", "limit": "2"}, {"offset": 2, "limit": "2"}),
+        ({"variables": {"skip": 4}}, {"variables": {"skip": 6}}),
+        # No paging key: the first request relied on the API's default page 1
+        ({"state": "FL"}, {"state": "FL", "page": 2}),
+        ({"query": "q", "variables": {"state": "FL"}}, {"query": "q", "variables": {"state": "FL", "page": 2}}),
+    ],
+)
+def test_advance_paging(params, expected):
+    advance_paging(params, PAGE_SIZE)
+    assert params == expected
+
+
+def test_replay_headers_drops_connection_headers():
+    headers = {
+        "Host": "www.auction.com",
+        "Content-Length": "120",
+        "Connection": "keep-alive",
+        "Transfer-Encoding": "chunked",
+        ":authority": "www.auction.com",
+        "Authorization": "Bearer token",
+        "x-api-key": "key",
+        "accept": "application/json",
+    }
+    assert replay_headers(headers) == {
+        "Authorization": "Bearer token",
+        "x-api-key": "key",
+        "accept": "application/json",
+    }
+
+
+def test_finds_listings_and_total_in_nested_payload():
+    payload = {"meta": {"ok": True}, **api_page([1, 2], total=7)}
+
+    assert [item["id"] for item in find_listings(payload)] == [1, 2]
+    assert find_total(payload) == 7
+    assert find_listings({"data": {"results": [{"id": 1}]}}) == []
+
+
+# ============================================================================
+# Streaming the API
+# ============================================================================
+
+def test_pages_get_api_until_total(scraper):
+    leads, calls = stream(
+        scraper,
+        FakeRequest(),
+        api_page([1, 2], total=5),
+        [FakeResponse(api_page([3, 4], total=5)), FakeResponse(api_page([5], total=5))],
+    )
+
+    assert [lead.property_address for lead in leads] == [f"{n} MAIN ST" for n in range(1, 6)]
+    assert [parse_qs(urlparse(call["url"]).query)["page"] for call in calls] == [["2"], ["3"]]
+    assert calls[0]["headers"] == {"authorization": "Bearer token", "x-api-key": "key"}
+    assert scraper.api_pages == 3 and scraper.api_shortfall is None
+
+
+def test_pages_post_api_through_body(scraper):
+    body = {"query": "search", "variables": {"state": "FL", "offset": 0}}
+    request = FakeRequest(method="POST", post_data=json.dumps(body))
+    leads, calls = stream(
+        scraper,
+        request,
+        api_page([1, 2], total=3),
+        [FakeResponse(api_page([3], total=3))],
+    )
+
+    assert len(leads) == 3
+    assert calls[0]["method"] == "POST"
+    assert calls[0]["data"]["variables"] == {"state": "FL", "offset": 2}
+    assert calls[0]["headers"]["content-type"] == "application/json"
+    assert "content-length" not in calls[0]["headers"]
+
+
+def test_failed_page_reports_shortfall(scraper):
+    leads, calls = stream(
+        scraper,
+        FakeRequest(),
+        api_page([1, 2], total=6),
+        [FakeResponse(status=401)],
+    )
+
+    assert len(leads) == 2
+    assert scraper.api_shortfall == "Listing API page 2 failed with HTTP 401"
+
+
+def test_repeated_page_stops_short_of_total(scraper):
+    # An API that ignores the page key serves page 1 again
+    leads, calls = stream(
+        scraper,
+        FakeRequest(),
+        api_page([1, 2], total=4),
+        [FakeResponse(api_page([1, 2], total=4))],
+    )
+
+    assert len(leads) == 2 and len(calls) == 1
+    assert scraper.api_shortfall == "Listing API stopped at 2 of 4 listings"
+
+
+def test_without_total_pages_until_empty(scraper):
+    leads, calls = stream(
+        scraper,
+        FakeRequest(),
+        api_page([1, 2]),
+        [FakeResponse(api_page([3])), FakeResponse(api_page([]))],
+    )
+
+    assert len(leads) == 3 and len(calls) == 2
+    assert scraper.api_shortfall is None
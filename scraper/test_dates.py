@@ -0,0 +1,86 @@
+"""
+Tests for sale-date parsing with per-source learned formats.
+
+    pip install pytest
+    python -m pytest scraper/test_dates.py
+"""
+
+import pytest
+
+from scraper.utils import dates
+from scraper.utils.dates import learned_format, parse_date_string
+
+
+@pytest.fixture(autouse=True)
+def fresh_formats(monkeypatch):
+    """Each test starts with nothing learned."""
+    monkeypatch.setattr(dates, "_learned_formats", {})
+
+
+@pytest.fixture
+def tried(monkeypatch):
+    """Record every strptime format attempted."""
+    formats = []
+    strptime = dates._strptime
+
+    def recording(value, fmt):
+        formats.append(fmt)
+        return strptime(value, fmt)
+
+    monkeypatch.setattr(dates, "_strptime", recording)
+    return formats
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("11/03/2026", "2026-11-03"),
+        ("2026-11-03T10:00:00Z", "2026-11-03"),
+        ("Nov 3, 2026", "2026-11-03"),
+        ("Tuesday, November 3, 2026", "2026-11-03"),
+        ("11/03/2026 10:00 AM", "2026-11-03"),
+        ("  11/03/2026\n", "2026-11-03"),
+    ],
+)
+def test_known_layouts(value, expected):
+    assert parse_date_string(value) == expected
+
+
+def test_learns_matching_format_per_source():
+    parse_date_string("Nov 3, 2026", "realauction")
+
+    assert learned_format("realauction") == "%b %d, %Y"
+    assert learned_format("auction.com") is None
+
+
+def test_learned_format_is_tried_first(tried):
+    parse_date_string("03 Nov 2026", "realauction")
+    tried.clear()
+
+    assert parse_date_string("17 Dec 2026", "realauction") == "2026-12-17"
+    assert tried == ["%d %b %Y"]
+
+
+def test_relearns_when_layout_changes(tried):
+    parse_date_string("11/03/2026", "realauction")
+    tried.clear()
+
+    assert parse_date_string("2026-12-17", "realauction") == "2026-12-17"
+    # The stale format is tried once, then skipped in the fallback scan
+    assert tried.count("%m/%d/%Y") == 1
+    assert learned_format("realauction") == "%Y-%m-%d"
+
+
+def test_without_source_nothing_is_learned():
+    parse_date_string("11/03/2026")
+    assert dates._learned_formats == {}
+
+
+def test_dateutil_fallback_does_not_learn():
+    assert parse_date_string("November 3rd, 2026", "realauction") == "2026-11-03"
+    assert learned_format("realauction") is None
+
+
+@pytest.mark.parametrize("value", ["", "   ", "TBD", "Cancelled"])
+def test_unparseable_dates(value):
+    assert parse_date_string(value, "realauction") is None
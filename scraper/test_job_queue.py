@@ -0,0 +1,306 @@
+"""
+Tests for the scrape job queue.
+
+Postgres writes run against a small fake connection that applies each
+statement's worker_id guard to one scrape_jobs row, and the Redis stream
+queue against fakeredis, so neither server is needed:
+
+    pip install pytest "fakeredis[lua]"
+    python -m pytest scraper/test_job_queue.py
+"""
+
+import asyncio
+import re
+from uuid import uuid4
+
+import fakeredis
+import pytest
+import redis.asyncio
+
+from scraper.config import config
+from scraper.workers.queue import (
+    LeaseLost,
+    PostgresJobQueue,
+    RedisStreamJobQueue,
+    complete_job,
+    fail_job,
+)
+
+WORKER = "worker-a"
+OTHER = "worker-b"
+
+# The ownership guard every worker-issued scrape_jobs write carries
+GUARD_RE = re.compile(r"\(\$(\d+)::text IS NULL OR \(worker_id = \$\1 AND status = 'running'\)\)")
+
+
+class FakeConn:
+    """One scrape_jobs row; guarded UPDATEs only match while the worker owns it."""
+
+    def __init__(self, worker_id=WORKER, status="running", attempt_number=1, max_attempts=3):
+        self.job = {
+            "worker_id": worker_id,
+            "status": status,
+            "attempt_number": attempt_number,
+            "max_attempts": max_attempts,
+        }
+        self.executed: list[str] = []
+
+    async def fetchrow(self, query, job_id):
+        return dict(self.job)
+
+    async def execute(self, query, *args):
+        self.executed.append(query)
+        guard = GUARD_RE.search(query)
+        if guard and "UPDATE scrape_jobs" in query:
+            worker_id = args[int(guard.group(1)) - 1]
+            if worker_id is not None and (
+                self.job["worker_id"] != worker_id or self.job["status"] != "running"
+            ):
+                return "UPDATE 0"
+        return "UPDATE 1"
+
+    def wrote(self, table: str) -> int:
+        return sum(f"UPDATE {table}" in query for query in self.executed)
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def acquire(self):
+        conn = self.conn
+
+        class Acquire:
+            async def __aenter__(self):
+                return conn
+
+            async def __aexit__(self, *exc):
+                pass
+
+        return Acquire()
+
+
+def complete(conn, worker_id=WORKER, leads_found=3):
+    return asyncio.run(complete_job(conn, uuid4(), leads_found, 2, 1, {"parse": 0.5}, worker_id))
+
+
+def fail(conn, worker_id=WORKER):
+    return asyncio.run(fail_job(conn, uuid4(), "boom", None, worker_id))
+
+
+# ============================================================================
+# Lease-lost guards
+# ============================================================================
+
+def test_owner_completes_job():
+    conn = FakeConn()
+    complete(conn)
+
+    assert conn.wrote("scrape_jobs") == 1
+    assert conn.wrote("counties") == 1
+
+
+def test_complete_from_another_worker_raises_lease_lost():
+    conn = FakeConn(worker_id=OTHER)
+
+    with pytest.raises(LeaseLost):
+        complete(conn)
+    # The county stats are left to the worker that owns the job now
+    assert conn.wrote("counties") == 0
+
+
+def test_complete_after_requeue_raises_lease_lost():
+    # The reaper requeued the job; its old worker must not mark it completed
+    conn = FakeConn(worker_id=None, status="pending")
+
+    with pytest.raises(LeaseLost):
+        complete(conn)
+
+
+def test_unguarded_complete_skips_ownership_check():
+    conn = FakeConn(worker_id=OTHER)
+    complete(conn, worker_id=None)
+
+    assert conn.wrote("scrape_jobs") == 1
+
+
+def test_owner_failure_is_retried_with_backoff():
+    conn = FakeConn(attempt_number=2)
+
+    assert fail(conn) == 240
+    assert conn.wrote("counties") == 0
+
+
+def test_owner_failure_without_attempts_left_fails_for_good():
+    conn = FakeConn(attempt_number=3, max_attempts=3)
+
+    assert fail(conn) is None
+    assert conn.wrote("counties") == 1
+
+
+def test_fail_from_another_worker_writes_nothing():
+    conn = FakeConn(worker_id=OTHER)
+
+    with pytest.raises(LeaseLost):
+        fail(conn)
+    assert conn.executed == []
+
+
+def test_fail_loses_race_with_reaper():
+    conn = FakeConn()
+    fetchrow = conn.fetchrow
+
+    async def reaped_after_read(query, job_id):
+        # The reaper requeues the job between fail_job's read and its write
+        row = await fetchrow(query, job_id)
+        conn.job.update(worker_id=None, status="pending")
+        return row
+
+    conn.fetchrow = reaped_after_read
+    with pytest.raises(LeaseLost):
+        fail(conn)
+
+
+def test_postgres_queue_drops_outcome_of_lost_lease():
+    conn = FakeConn(worker_id=OTHER)
+    queue = PostgresJobQueue(FakePool(conn), WORKER)
+
+    async def run():
+        await queue.complete(uuid4(), 3, 2, 1)
+        await queue.fail(uuid4(), "boom")
+
+    asyncio.run(run())
+    assert conn.wrote("counties") == 0
+
+
+# ============================================================================
+# Redis stream queue
+# ============================================================================
+
+class TableConn:
+    """Pending scrape_jobs rows for dispatch(), and the stream leases it renews."""
+
+    def __init__(self, jobs):
+        self.jobs = list(jobs)
+        self.renewed: list[list] = []
+
+    async def fetch(self, query, owner, limit, lease_seconds):
+        claimed, self.jobs = self.jobs[:limit], self.jobs[limit:]
+        return claimed
+
+    async def execute(self, query, job_ids, lease_seconds):
+        self.renewed.append(job_ids)
+        return f"UPDATE {len(job_ids)}"
+
+
+def pending_job(**fields):
+    return {"id": uuid4(), "state_abbr": "FL", "scraper_class": "AuctionComScraper",
+            "queue_wait_seconds": 1.5, **fields}
+
+
+@pytest.fixture
+def stream(monkeypatch):
+    """Point RedisStreamJobQueue at a fake Redis server shared by every consumer."""
+    server = fakeredis.FakeServer()
+
+    def from_url(url, **kwargs):
+        return fakeredis.FakeAsyncRedis(server=server, **kwargs)
+
+    monkeypatch.setattr(redis.asyncio, "from_url", from_url)
+    return fakeredis.FakeRedis(server=server, decode_responses=True)
+
+
+async def connected(*worker_ids):
+    queues = [RedisStreamJobQueue(None, worker_id) for worker_id in worker_ids]
+    for queue in queues:
+        await queue.connect()
+    return queues
+
+
+def test_dispatched_jobs_are_claimed_once(stream):
+    jobs = [pending_job(), pending_job()]
+
+    async def run():
+        dispatcher, worker, other = await connected("dispatcher", WORKER, OTHER)
+        dispatched = await dispatcher.dispatch(TableConn(jobs))
+        return dispatched, await worker.claim(5), await other.claim(5)
+
+    dispatched, claimed, claimed_elsewhere = asyncio.run(run())
+    assert dispatched == 2
+    assert [job["id"] for job in claimed] == [job["id"] for job in jobs]
+    assert all(job["queue_wait_seconds"] >= 1.5 for job in claimed)
+    assert claimed_elsewhere == []
+
+
+def test_dispatch_respects_backlog_cap(stream, monkeypatch):
+    monkeypatch.setattr(config.redis, "stream_max_backlog", 2)
+    table = TableConn([pending_job() for _ in range(3)])
+
+    async def run():
+        dispatcher, = await connected("dispatcher")
+        return [await dispatcher.dispatch(table), await dispatcher.dispatch(table)]
+
+    assert asyncio.run(run()) == [2, 0]
+    assert stream.xlen(config.redis.job_stream) == 2 and len(table.jobs) == 1
+
+
+def test_dispatch_renews_leases_of_jobs_in_stream(stream):
+    jobs = [pending_job(), pending_job()]
+    table = TableConn(jobs)
+
+    async def run():
+        dispatcher, worker = await connected("dispatcher", WORKER)
+        await dispatcher.dispatch(table)
+        await worker.claim(1)
+        dispatcher._stream_leases_renewed = 0.0  # next heartbeat is due
+        await dispatcher.dispatch(table)
+
+    asyncio.run(run())
+    # Both the waiting and the claimed job stay leased while Redis holds them
+    assert table.renewed == [[job["id"] for job in jobs]]
+
+
+def test_complete_acks_and_removes_entry(stream):
+    async def run():
+        dispatcher, worker = await connected("dispatcher", WORKER)
+        await dispatcher.dispatch(TableConn([pending_job()]))
+        job, = await worker.claim(1)
+        await worker.complete(job["id"], 3, 2, 1)
+        return job, worker
+
+    job, worker = asyncio.run(run())
+    assert stream.xlen(config.redis.job_stream) == 0
+    assert stream.xpending(config.redis.job_stream, config.redis.job_group)["pending"] == 0
+    assert worker.audit._completed[0][0] == job["id"]
+
+
+def test_renew_keeps_owned_entries(stream):
+    async def run():
+        dispatcher, worker = await connected("dispatcher", WORKER)
+        await dispatcher.dispatch(TableConn([pending_job()]))
+        job, = await worker.claim(1)
+        return job, await worker.renew([job["id"]]), worker
+
+    job, lost, worker = asyncio.run(run())
+    assert lost == set()
+    assert job["id"] in worker.audit._leases
+
+
+def test_stalled_entry_is_reclaimed_and_not_acked_by_old_owner(stream, monkeypatch):
+    monkeypatch.setattr(config.scraper, "job_lease_seconds", 0)  # every entry counts as stalled
+
+    async def run():
+        dispatcher, worker, other = await connected("dispatcher", WORKER, OTHER)
+        await dispatcher.dispatch(TableConn([pending_job()]))
+        job, = await worker.claim(1)
+        reclaimed = await other.claim(1)
+        lost = await worker.renew([job["id"]])
+        await worker.complete(job["id"], 0, 0, 0)
+        return job, reclaimed, lost
+
+    job, reclaimed, lost = asyncio.run(run())
+    assert [entry["id"] for entry in reclaimed] == [job["id"]]
+    assert lost == {job["id"]}
+    # The new owner still has the entry; the old owner's completion didn't ack it
+    pending = stream.xpending(config.redis.job_stream, config.redis.job_group)
+    assert pending["pending"] == 1 and pending["consumers"][0]["name"] == OTHER
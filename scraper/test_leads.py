@@ -0,0 +1,92 @@
+"""
+Tests for the column-wise LeadBatch.
+
+    pip install pytest
+    python -m pytest scraper/test_leads.py
+"""
+
+from scraper.scrapers.leads import ForeclosureLead, LeadBatch, LeadRow
+
+
+def row(address="123 Main St", owner="Jane Doe", **fields):
+    return {
+        "source": "auction.com",
+        "source_type": "auction",
+        "property_address": address,
+        "state_abbr": "FL",
+        "owner_name": owner,
+        **fields,
+    }
+
+
+def batch(*rows):
+    return LeadBatch.validate(list(rows))
+
+
+# ============================================================================
+# Dedup
+# ============================================================================
+
+def test_dedup_keeps_last_occurrence():
+    leads = batch(
+        row(opening_bid=100_000),
+        row("9 Oak Ave"),
+        row(opening_bid=125_000),  # re-rendered copy of the first card
+    )
+
+    deduped = leads.dedup()
+    assert len(deduped) == 2
+    assert [lead.property_address for lead in deduped] == ["9 Oak Ave", "123 Main St"]
+    assert deduped[1].opening_bid == 125_000
+
+
+def test_dedup_keys_on_normalized_address():
+    leads = batch(row("123 Main Street"), row("123 MAIN ST."))
+    assert len(leads.dedup()) == 1
+
+
+def test_dedup_without_duplicates_returns_same_batch():
+    leads = batch(row(), row("9 Oak Ave"))
+    assert leads.dedup() is leads
+
+
+def test_dedup_keeps_every_column_aligned():
+    deduped = batch(row(case_number="A"), row("9 Oak Ave", case_number="B"), row(case_number="C")).dedup()
+    assert {name: len(column) for name, column in deduped.columns.items()} == dict.fromkeys(deduped.columns, 2)
+    assert [lead.case_number for lead in deduped] == ["B", "C"]
+
+
+# ============================================================================
+# Validation and rows
+# ============================================================================
+
+def test_validate_drops_invalid_rows():
+    leads = batch(row(), {"property_address": "no owner or source"}, row("9 Oak Ave"))
+    assert [lead.property_address for lead in leads] == ["123 Main St", "9 Oak Ave"]
+
+
+def test_validate_fills_ids_and_scraped_at():
+    lead = batch(row())[0]
+    assert len(lead.id) == 16
+    assert lead.scraped_at is not None
+
+
+def test_rows_convert_to_models():
+    leads = batch(row(sale_date="2026-11-03"))
+    rows = list(leads)
+
+    assert isinstance(rows[0], LeadRow)
+    model = rows[0].to_lead()
+    assert isinstance(model, ForeclosureLead)
+    assert model.id == rows[0].id and model.sale_date == "2026-11-03"
+
+
+def test_append_copies_rows_and_models():
+    source = batch(row(), row("9 Oak Ave"))
+    combined = LeadBatch.from_leads([source[1], source.lead(0)])
+
+    assert [lead.property_address for lead in combined] == ["9 Oak Ave", "123 Main St"]
+    assert list(combined.records(("id", "owner_name"))) == [
+        (source[1].id, "Jane Doe"),
+        (source[0].id, "Jane Doe"),
+    ]
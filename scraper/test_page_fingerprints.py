@@ -0,0 +1,245 @@
+"""
+Tests for page fingerprints: staging during a run, and committing only
+after the run's leads are saved.
+
+The page_fingerprints table is replaced by an in-memory store that applies
+the same upsert rules, so no database is needed:
+
+    pip install pytest
+    python -m pytest scraper/test_page_fingerprints.py
+"""
+
+import asyncio
+import re
+from dataclasses import replace
+from uuid import uuid4
+
+import pytest
+
+from scraper.scrapers.auction_com import RealAuctionScraper
+from scraper.scrapers.base import NOT_MODIFIED, BaseScraper, ScrapeResult
+from scraper.utils.page_fingerprints import Fingerprint, PageFingerprints, normalized_hash
+from scraper.workers import job_worker
+from scraper.workers.job_worker import JobWorker
+
+URL = "https://miamidade.realforeclose.com/index.cfm"
+
+
+class MemoryFingerprints(PageFingerprints):
+    """page_fingerprints in a dict, following UPSERT_FINGERPRINTS_SQL's merge rules."""
+
+    def __init__(self, rows=None):
+        super().__init__(db_pool=None)
+        self.rows: dict[str, Fingerprint] = rows or {}
+        self.saves = 0
+
+    async def fetch(self, url):
+        row = self.rows.get(url)
+        return replace(row) if row else None
+
+    async def save(self, source, fingerprints):
+        self.saves += 1
+        for url, staged in fingerprints.items():
+            row = self.rows.setdefault(url, Fingerprint())
+            for name in ("etag", "last_modified", "content_hash"):
+                if getattr(staged, name) is not None:
+                    setattr(row, name, getattr(staged, name))
+            if staged.content_hash is not None:
+                row.next_url = staged.next_url
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+# ============================================================================
+# Content hash
+# ============================================================================
+
+def test_hash_ignores_volatile_markup():
+    page = '<div class="card">123 Main St</div>'
+    noisy = (
+        '<script>var t = 1;</script>\n  <div class="card">123   Main St</div><!-- rendered 10:02 -->'
+        '<input type="hidden" name="__VIEWSTATE" value="abc">'
+    )
+    assert normalized_hash(page) == normalized_hash(noisy)
+    assert normalized_hash(page.encode()) == normalized_hash(page)
+
+
+def test_hash_changes_with_listings():
+    assert normalized_hash("<div>123 Main St</div>") != normalized_hash("<div>125 Main St</div>")
+
+
+# ============================================================================
+# Stage and commit
+# ============================================================================
+
+def test_staged_fingerprints_wait_for_commit():
+    store = MemoryFingerprints()
+    fingerprints = store.for_job("realauction")
+    fingerprints.stage(URL, etag='"v1"', content_hash="abc")
+
+    assert store.rows == {}
+    run(fingerprints.commit())
+    assert store.rows[URL] == Fingerprint(etag='"v1"', content_hash="abc")
+
+    run(fingerprints.commit())  # staging was cleared by the first commit
+    assert store.saves == 2 and store.rows[URL].etag == '"v1"'
+
+
+def test_stage_merges_fields_and_skips_none():
+    fingerprints = MemoryFingerprints().for_job("realauction")
+    fingerprints.stage(URL, content_hash="abc")
+    fingerprints.stage(URL, etag='"v1"', last_modified=None)
+
+    assert fingerprints._staged[URL] == Fingerprint(etag='"v1"', content_hash="abc")
+
+
+def test_lookups_see_last_run_not_this_one():
+    store = MemoryFingerprints({URL: Fingerprint(content_hash="old")})
+    fingerprints = store.for_job("realauction")
+
+    assert run(fingerprints.get(URL)).content_hash == "old"
+    fingerprints.stage(URL, content_hash="new")
+    assert run(fingerprints.get(URL)).content_hash == "old"
+
+
+def test_failed_lookup_counts_as_unseen():
+    class Broken(MemoryFingerprints):
+        async def fetch(self, url):
+            raise ConnectionError("db down")
+
+    assert run(Broken().for_job("realauction").get(URL)) is None
+
+
+def test_fork_is_only_committed_once_adopted():
+    store = MemoryFingerprints()
+    sweep = store.for_job("realauction")
+    succeeded, failed = sweep.fork(), sweep.fork()
+    succeeded.stage(f"{URL}?county=a", content_hash="a")
+    failed.stage(f"{URL}?county=b", content_hash="b")
+
+    sweep.adopt(succeeded)
+    run(sweep.commit())
+    assert list(store.rows) == [f"{URL}?county=a"]
+
+
+# ============================================================================
+# Scraper integration
+# ============================================================================
+
+class PageScraper(BaseScraper):
+    name = "pages"
+
+    async def scrape(self):
+        return ScrapeResult(success=True)
+
+    async def parse_listing(self, data):
+        return None
+
+    def parse_card(self, card):
+        return None
+
+
+def test_page_unchanged_compares_with_last_run():
+    html = '<div class="card">123 Main St</div>'
+    store = MemoryFingerprints({URL: Fingerprint(content_hash=normalized_hash(html))})
+    scraper = PageScraper(fingerprints=store.for_job("pages"))
+
+    assert run(scraper.page_unchanged(URL, html)) is True
+    assert run(scraper.page_unchanged(f"{URL}?page=2", html)) is False
+    assert run(scraper.page_unchanged(URL, NOT_MODIFIED)) is True
+    assert scraper.unchanged_pages == 1
+    assert scraper.fingerprints._staged[f"{URL}?page=2"].content_hash == normalized_hash(html)
+
+
+def test_conditional_headers_from_last_run():
+    store = MemoryFingerprints({URL: Fingerprint(etag='"v1"', last_modified="Tue, 03 Nov 2026 10:00:00 GMT")})
+    scraper = PageScraper(fingerprints=store.for_job("pages"))
+
+    assert run(scraper.conditional_headers(URL)) == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Tue, 03 Nov 2026 10:00:00 GMT",
+    }
+    assert run(scraper.conditional_headers(f"{URL}?page=2")) == {}
+
+
+def calendar_page(n: int, last: int = 3) -> str:
+    next_link = f'<a class="next" href="/foreclosure/fl/miami-dade?page={n + 1}">Next</a>' if n < last else ""
+    return f'<div class="auction-item">Page {n}</div>{next_link}'
+
+
+def walk_calendar(store, not_modified=()):
+    """Run RealAuctionScraper.scrape_calendar over canned pages; returns the URLs fetched."""
+    scraper = RealAuctionScraper(state_abbr="FL", county="Miami-Dade", fingerprints=store.for_job("realauction"))
+    fetched = []
+
+    async def fetch_page(url, **kwargs):
+        fetched.append(url)
+        if url in not_modified:
+            return NOT_MODIFIED
+        page = re.search(r"page=(\d+)", url)
+        return calendar_page(int(page.group(1)) if page else 1)
+
+    async def parse_listing_page(html):
+        return [], scraper.next_page_href(html)
+
+    scraper.fetch_page = fetch_page
+    scraper.parse_listing_page = parse_listing_page
+    scraper.next_page_href = lambda html: (re.search(r'href="([^"]+)"', html) or [None, None])[1]
+
+    async def drain():
+        async for _ in scraper.scrape_calendar():
+            pass
+        await scraper.fingerprints.commit()
+
+    run(drain())
+    return fetched
+
+
+def test_calendar_walk_follows_saved_link_past_304():
+    store = MemoryFingerprints()
+    first_run = walk_calendar(store)
+    assert len(first_run) == 3
+
+    # Every page but the last answers 304 on the next run
+    second_run = walk_calendar(store, not_modified=set(first_run[:2]))
+    assert second_run == first_run
+    assert store.rows[first_run[0]].next_url.endswith("page=2")
+    assert store.rows[first_run[2]].next_url is None
+
+
+# ============================================================================
+# Worker: commit only after a successful run
+# ============================================================================
+
+class RecordingQueue:
+    def __init__(self):
+        self.completed, self.failed = [], []
+
+    async def complete(self, job_id, *counts, timings=None, error=None):
+        self.completed.append(job_id)
+
+    async def fail(self, job_id, error, timings=None):
+        self.failed.append(job_id)
+
+
+@pytest.mark.parametrize("success", [True, False])
+def test_worker_commits_fingerprints_only_on_success(monkeypatch, success):
+    class StagingScraper(PageScraper):
+        async def scrape_stream(self):
+            self.fingerprints.stage(URL, content_hash="abc")
+            self.stream_result = ScrapeResult(success=success, error=None if success else "blocked")
+            return
+            yield
+
+    monkeypatch.setitem(job_worker.SCRAPERS, "StagingScraper", StagingScraper)
+    worker = JobWorker()
+    worker.queue = RecordingQueue()
+    worker.fingerprints = store = MemoryFingerprints()
+
+    job = {"id": uuid4(), "scraper_class": "StagingScraper", "state_abbr": "FL", "county_id": None}
+    run(worker.process_job(job))
+
+    assert (URL in store.rows) is success
+    assert (worker.queue.completed, worker.queue.failed) == (([job["id"]], []) if success else ([], [job["id"]]))
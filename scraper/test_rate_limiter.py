@@ -0,0 +1,179 @@
+"""
+Tests for the distributed rate limiter.
+
+The Lua token bucket runs against fakeredis (with lupa for scripting), so no
+Redis server is needed:
+
+    pip install pytest "fakeredis[lua]"
+    python -m pytest scraper/test_rate_limiter.py
+"""
+
+import asyncio
+
+import fakeredis
+import pytest
+import redis.asyncio
+
+from scraper.utils import rate_limiter
+from scraper.utils.rate_limiter import LocalTokenBucket, RateLimiter, domain_for
+
+RATE = 1.0  # tokens per second
+DOMAIN = "auction.com"
+KEY = f"ratelimit:{DOMAIN}"
+
+
+@pytest.fixture
+def server():
+    """One fake Redis server; every client built from it shares its buckets."""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def connect(monkeypatch, server):
+    """Point RateLimiter's Redis connections at the fake server."""
+    def from_url(url, **kwargs):
+        return fakeredis.FakeAsyncRedis(server=server)
+
+    monkeypatch.setattr(redis.asyncio, "from_url", from_url)
+
+
+def reserve(limiter: RateLimiter, times: int = 1) -> list[float]:
+    async def run():
+        return [await limiter._reserve_redis(DOMAIN, RATE) for _ in range(times)]
+    return asyncio.run(run())
+
+
+def rewind_bucket(server, seconds: float):
+    """Pretend the bucket was last touched `seconds` earlier."""
+    client = fakeredis.FakeRedis(server=server)
+    ts = float(client.hget(KEY, "ts"))
+    client.hset(KEY, "ts", ts - seconds)
+
+
+# ============================================================================
+# Lua token bucket
+# ============================================================================
+
+def test_burst_then_wait(connect):
+    waits = reserve(RateLimiter(burst=3), times=5)
+
+    assert waits[:3] == [0, 0, 0]
+    # Past the burst, each caller reserves the next free slot
+    assert waits[3] == pytest.approx(1.0, abs=0.05)
+    assert waits[4] == pytest.approx(2.0, abs=0.05)
+
+
+def test_refill(connect, server):
+    limiter = RateLimiter(burst=2)
+    reserve(limiter, times=2)
+    assert reserve(limiter)[0] > 0
+
+    # 10 idle seconds refill the bucket, but only up to its capacity
+    rewind_bucket(server, 10)
+    assert reserve(limiter, times=3) == [0, 0, pytest.approx(1.0, abs=0.05)]
+
+
+def test_shared_budget_across_workers(connect):
+    # Separate limiters stand in for worker processes sharing one Redis
+    first, second = RateLimiter(burst=2), RateLimiter(burst=2)
+
+    assert reserve(first, times=2) == [0, 0]
+    assert reserve(second)[0] == pytest.approx(1.0, abs=0.05)
+    assert reserve(first)[0] == pytest.approx(2.0, abs=0.05)
+
+
+def test_domains_have_separate_budgets(connect):
+    limiter = RateLimiter(burst=1)
+
+    async def run():
+        return [
+            await limiter._reserve_redis("auction.com", RATE),
+            await limiter._reserve_redis("realauction.com", RATE),
+        ]
+
+    assert asyncio.run(run()) == [0, 0]
+
+
+def test_bucket_key_expires_once_full(connect, server):
+    reserve(RateLimiter(burst=2))
+    ttl = fakeredis.FakeRedis(server=server).pttl(KEY)
+    assert 0 < ttl <= 2000
+
+
+# ============================================================================
+# Local fallback
+# ============================================================================
+
+def test_local_bucket_refill(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: now[0])
+    bucket = LocalTokenBucket(rate=RATE, capacity=2)
+
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 1.0]
+
+    now[0] += 10
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 1.0]
+
+
+def test_falls_back_to_local_when_redis_unreachable(monkeypatch):
+    def from_url(url, **kwargs):
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(redis.asyncio, "from_url", from_url)
+    limiter = RateLimiter(burst=1)
+
+    assert reserve(limiter) == [None]
+    assert limiter._reserve_local(DOMAIN, RATE) == 0
+    assert limiter._reserve_local(DOMAIN, RATE) == pytest.approx(1.0, abs=0.05)
+
+
+def test_unreachable_redis_is_not_retried_immediately(monkeypatch):
+    attempts = []
+
+    def from_url(url, **kwargs):
+        attempts.append(url)
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(redis.asyncio, "from_url", from_url)
+    limiter = RateLimiter(burst=1)
+
+    reserve(limiter, times=3)
+    assert len(attempts) == 1
+
+
+def test_script_failure_disconnects_and_falls_back(connect):
+    limiter = RateLimiter(burst=1)
+    reserve(limiter)
+
+    async def broken(**kwargs):
+        raise ConnectionError("connection reset")
+
+    limiter._script = broken
+    assert reserve(limiter) == [None]
+    assert limiter._redis is None
+
+
+def test_acquire_sleeps_for_reservation(monkeypatch):
+    slept = []
+
+    async def sleep(seconds):
+        slept.append(seconds)
+
+    async def no_redis(self, domain, rate):
+        return None
+
+    monkeypatch.setattr(RateLimiter, "_reserve_redis", no_redis)
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", sleep)
+    limiter = RateLimiter(burst=1)
+
+    async def run():
+        return [await limiter.acquire(DOMAIN, rate_per_minute=60) for _ in range(2)]
+
+    waits = asyncio.run(run())
+    assert waits[0] == 0
+    assert slept == [waits[1]] and waits[1] == pytest.approx(1.0, abs=0.05)
+
+
+def test_domain_for():
+    assert domain_for("https://www.Auction.com/residential/foreclosure") == "auction.com"
+    assert domain_for("https://miamidade.realforeclose.com/index.cfm") == "miamidade.realforeclose.com"
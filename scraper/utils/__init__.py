@@ -1,4 +1,9 @@
 """Utility modules."""
+from .address import address_key, normalize_address
 from .email_automation import EmailAutomation, run_email_automation
+from .page_archive import PageArchive
+from .page_fingerprints import PageFingerprints
+from .rate_limiter import RateLimiter, get_rate_limiter
+from .timings import PhaseTimings
 
-__all__ = ["EmailAutomation", "run_email_automation"]
+__all__ = ["address_key", "normalize_address", "EmailAutomation", "run_email_automation", "PageArchive", "PageFingerprints", "RateLimiter", "get_rate_limiter", "PhaseTimings"]
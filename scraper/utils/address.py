@@ -0,0 +1,339 @@
+"""
+Address Normalization
+Token-based street address normalizer using the USPS Publication 28
+suffix (C1), directional and secondary unit (C2) tables.
+
+Words are only abbreviated in the position they play in the address: the
+street suffix is the last street token, directionals sit just after the
+house number or after the suffix, and unit designators start the
+secondary address. "NORTHRIDGE" and "COURTLAND" are left alone, as is the
+street name in "100 NORTH ST".
+
+normalize_address() is idempotent and cached, and address_key() is the
+key lead ids (and so batch dedup) are built from.
+"""
+
+import re
+from functools import lru_cache
+from typing import Optional
+
+# Distinct raw addresses kept by the normalizer's LRU cache
+ADDRESS_CACHE_SIZE = 65_536
+
+# One pass over the uppercased address: words (keeping 1/2, 12-B, O'NEIL) and "#"
+_TOKEN_RE = re.compile(r"[A-Z0-9][A-Z0-9'/-]*|#")
+
+# USPS standard suffix abbreviation -> accepted spellings (Pub 28, Appendix C1)
+_SUFFIX_VARIANTS = {
+    "ALY": ("ALLEE", "ALLEY", "ALLY"),
+    "ANX": ("ANEX", "ANNEX", "ANNX"),
+    "ARC": ("ARCADE",),
+    "AVE": ("AV", "AVEN", "AVENU", "AVENUE", "AVN", "AVNUE"),
+    "BYU": ("BAYOO", "BAYOU"),
+    "BCH": ("BEACH",),
+    "BND": ("BEND",),
+    "BLF": ("BLUF", "BLUFF"),
+    "BLFS": ("BLUFFS",),
+    "BTM": ("BOT", "BOTTM", "BOTTOM"),
+    "BLVD": ("BOUL", "BOULEVARD", "BOULV"),
+    "BR": ("BRNCH", "BRANCH"),
+    "BRG": ("BRDGE", "BRIDGE"),
+    "BRK": ("BROOK",),
+    "BRKS": ("BROOKS",),
+    "BG": ("BURG",),
+    "BGS": ("BURGS",),
+    "BYP": ("BYPA", "BYPAS", "BYPASS", "BYPS"),
+    "CP": ("CAMP", "CMP"),
+    "CYN": ("CANYN", "CANYON", "CNYN"),
+    "CPE": ("CAPE",),
+    "CSWY": ("CAUSEWAY", "CAUSWA"),
+    "CTR": ("CEN", "CENT", "CENTER", "CENTR", "CENTRE", "CNTER", "CNTR"),
+    "CTRS": ("CENTERS",),
+    "CIR": ("CIRC", "CIRCL", "CIRCLE", "CRCL", "CRCLE"),
+    "CIRS": ("CIRCLES",),
+    "CLF": ("CLIFF",),
+    "CLFS": ("CLIFFS",),
+    "CLB": ("CLUB",),
+    "CMN": ("COMMON",),
+    "CMNS": ("COMMONS",),
+    "COR": ("CORNER",),
+    "CORS": ("CORNERS",),
+    "CRSE": ("COURSE",),
+    "CT": ("COURT",),
+    "CTS": ("COURTS",),
+    "CV": ("COVE",),
+    "CVS": ("COVES",),
+    "CRK": ("CREEK",),
+    "CRES": ("CRESCENT", "CRSENT", "CRSNT"),
+    "CRST": ("CREST",),
+    "XING": ("CROSSING", "CRSSNG"),
+    "XRD": ("CROSSROAD",),
+    "XRDS": ("CROSSROADS",),
+    "CURV": ("CURVE",),
+    "DL": ("DALE",),
+    "DM": ("DAM",),
+    "DV": ("DIV", "DIVIDE", "DVD"),
+    "DR": ("DRIV", "DRIVE", "DRV"),
+    "DRS": ("DRIVES",),
+    "EST": ("ESTATE",),
+    "ESTS": ("ESTATES",),
+    "EXPY": ("EXP", "EXPR", "EXPRESS", "EXPRESSWAY", "EXPW"),
+    "EXT": ("EXTENSION", "EXTN", "EXTNSN"),
+    "EXTS": ("EXTENSIONS",),
+    "FALL": (),
+    "FLS": ("FALLS",),
+    "FRY": ("FERRY", "FRRY"),
+    "FLD": ("FIELD",),
+    "FLDS": ("FIELDS",),
+    "FLT": ("FLAT",),
+    "FLTS": ("FLATS",),
+    "FRD": ("FORD",),
+    "FRDS": ("FORDS",),
+    "FRST": ("FOREST", "FORESTS"),
+    "FRG": ("FORG", "FORGE"),
+    "FRGS": ("FORGES",),
+    "FRK": ("FORK",),
+    "FRKS": ("FORKS",),
+    "FT": ("FORT", "FRT"),
+    "FWY": ("FREEWAY", "FREEWY", "FRWAY", "FRWY"),
+    "GDN": ("GARDEN", "GARDN", "GRDEN", "GRDN"),
+    "GDNS": ("GARDENS", "GRDNS"),
+    "GTWY": ("GATEWAY", "GATEWY", "GATWAY", "GTWAY"),
+    "GLN": ("GLEN",),
+    "GLNS": ("GLENS",),
+    "GRN": ("GREEN",),
+    "GRNS": ("GREENS",),
+    "GRV": ("GROV", "GROVE"),
+    "GRVS": ("GROVES",),
+    "HBR": ("HARB", "HARBOR", "HARBR", "HRBOR"),
+    "HBRS": ("HARBORS",),
+    "HVN": ("HAVEN",),
+    "HTS": ("HT", "HEIGHTS"),
+    "HWY": ("HIGHWAY", "HIGHWY", "HIWAY", "HIWY", "HWAY"),
+    "HL": ("HILL",),
+    "HLS": ("HILLS",),
+    "HOLW": ("HLLW", "HOLLOW", "HOLLOWS", "HOLWS"),
+    "INLT": ("INLET",),
+    "IS": ("ISLAND", "ISLND"),
+    "ISS": ("ISLANDS", "ISLNDS"),
+    "ISLE": ("ISLES",),
+    "JCT": ("JCTION", "JCTN", "JUNCTION", "JUNCTN", "JUNCTON"),
+    "JCTS": ("JCTNS", "JUNCTIONS"),
+    "KY": ("KEY",),
+    "KYS": ("KEYS",),
+    "KNL": ("KNOL", "KNOLL"),
+    "KNLS": ("KNOLLS",),
+    "LK": ("LAKE",),
+    "LKS": ("LAKES",),
+    "LAND": (),
+    "LNDG": ("LANDING", "LNDNG"),
+    "LN": ("LANE",),
+    "LGT": ("LIGHT",),
+    "LGTS": ("LIGHTS",),
+    "LF": ("LOAF",),
+    "LCK": ("LOCK",),
+    "LCKS": ("LOCKS",),
+    "LDG": ("LDGE", "LODG", "LODGE"),
+    "LOOP": ("LOOPS",),
+    "MALL": (),
+    "MNR": ("MANOR",),
+    "MNRS": ("MANORS",),
+    "MDW": ("MEADOW",),
+    "MDWS": ("MEADOWS", "MEDOWS"),
+    "MEWS": (),
+    "ML": ("MILL",),
+    "MLS": ("MILLS",),
+    "MSN": ("MISSN", "MSSN", "MISSION"),
+    "MTWY": ("MOTORWAY",),
+    "MT": ("MNT", "MOUNT"),
+    "MTN": ("MNTAIN", "MNTN", "MOUNTAIN", "MOUNTIN", "MTIN"),
+    "MTNS": ("MNTNS", "MOUNTAINS"),
+    "NCK": ("NECK",),
+    "ORCH": ("ORCHARD", "ORCHRD"),
+    "OVAL": ("OVL",),
+    "OPAS": ("OVERPASS",),
+    "PARK": ("PRK", "PARKS"),
+    "PKWY": ("PARKWAY", "PARKWY", "PKWAY", "PKY", "PARKWAYS", "PKWYS"),
+    "PASS": (),
+    "PSGE": ("PASSAGE",),
+    "PATH": ("PATHS",),
+    "PIKE": ("PIKES",),
+    "PNE": ("PINE",),
+    "PNES": ("PINES",),
+    "PL": ("PLACE",),
+    "PLN": ("PLAIN",),
+    "PLNS": ("PLAINS",),
+    "PLZ": ("PLAZA", "PLZA"),
+    "PT": ("POINT",),
+    "PTS": ("POINTS",),
+    "PRT": ("PORT",),
+    "PRTS": ("PORTS",),
+    "PR": ("PRAIRIE", "PRR"),
+    "RADL": ("RAD", "RADIAL", "RADIEL"),
+    "RAMP": (),
+    "RNCH": ("RANCH", "RANCHES", "RNCHS"),
+    "RPD": ("RAPID",),
+    "RPDS": ("RAPIDS",),
+    "RST": ("REST",),
+    "RDG": ("RDGE", "RIDGE"),
+    "RDGS": ("RIDGES",),
+    "RIV": ("RIVER", "RVR", "RIVR"),
+    "RD": ("ROAD",),
+    "RDS": ("ROADS",),
+    "RTE": ("ROUTE",),
+    "ROW": (),
+    "RUE": (),
+    "RUN": (),
+    "SHL": ("SHOAL",),
+    "SHLS": ("SHOALS",),
+    "SHR": ("SHOAR", "SHORE"),
+    "SHRS": ("SHOARS", "SHORES"),
+    "SKWY": ("SKYWAY",),
+    "SPG": ("SPNG", "SPRING", "SPRNG"),
+    "SPGS": ("SPNGS", "SPRINGS", "SPRNGS"),
+    "SPUR": ("SPURS",),
+    "SQ": ("SQR", "SQRE", "SQU", "SQUARE"),
+    "SQS": ("SQRS", "SQUARES"),
+    "STA": ("STATION", "STATN", "STN"),
+    "STRA": ("STRAV", "STRAVEN", "STRAVENUE", "STRAVN", "STRVN", "STRVNUE"),
+    "STRM": ("STREAM", "STREME"),
+    "ST": ("STREET", "STRT", "STR"),
+    "STS": ("STREETS",),
+    "SMT": ("SUMIT", "SUMITT", "SUMMIT"),
+    "TER": ("TERR", "TERRACE"),
+    "TRWY": ("THROUGHWAY",),
+    "TRCE": ("TRACE", "TRACES"),
+    "TRAK": ("TRACK", "TRACKS", "TRK", "TRKS"),
+    "TRFY": ("TRAFFICWAY",),
+    "TRL": ("TRAIL", "TRAILS", "TRLS"),
+    "TRLR": ("TRAILER", "TRLRS"),
+    "TUNL": ("TUNEL", "TUNLS", "TUNNEL", "TUNNELS", "TUNNL"),
+    "TPKE": ("TRNPK", "TURNPIKE", "TURNPK"),
+    "UPAS": ("UNDERPASS",),
+    "UN": ("UNION",),
+    "UNS": ("UNIONS",),
+    "VLY": ("VALLEY", "VALLY", "VLLY"),
+    "VLYS": ("VALLEYS",),
+    "VIA": ("VDCT", "VIADCT", "VIADUCT"),
+    "VW": ("VIEW",),
+    "VWS": ("VIEWS",),
+    "VLG": ("VILL", "VILLAG", "VILLAGE", "VILLG", "VILLIAGE"),
+    "VLGS": ("VILLAGES",),
+    "VL": ("VILLE",),
+    "VIS": ("VIST", "VISTA", "VST", "VSTA"),
+    "WALK": ("WALKS",),
+    "WALL": (),
+    "WAY": ("WY",),
+    "WAYS": (),
+    "WL": ("WELL",),
+    "WLS": ("WELLS",),
+}
+
+STREET_SUFFIXES = {
+    spelling: abbr
+    for abbr, spellings in _SUFFIX_VARIANTS.items()
+    for spelling in (abbr, *spellings)
+}
+
+DIRECTIONALS = {
+    "NORTH": "N", "SOUTH": "S", "EAST": "E", "WEST": "W",
+    "NORTHEAST": "NE", "NORTHWEST": "NW", "SOUTHEAST": "SE", "SOUTHWEST": "SW",
+    "N": "N", "S": "S", "E": "E", "W": "W", "NE": "NE", "NW": "NW", "SE": "SE", "SW": "SW",
+}
+
+# Secondary unit designators (Pub 28, Appendix C2): abbreviation, and whether a unit number follows
+UNIT_DESIGNATORS = {
+    "APARTMENT": ("APT", True), "APT": ("APT", True),
+    "BUILDING": ("BLDG", True), "BLDG": ("BLDG", True),
+    "DEPARTMENT": ("DEPT", True), "DEPT": ("DEPT", True),
+    "FLOOR": ("FL", True), "FL": ("FL", True),
+    "HANGAR": ("HNGR", True), "HNGR": ("HNGR", True),
+    "KEY": ("KEY", True),
+    "LOT": ("LOT", True),
+    "PIER": ("PIER", True),
+    "ROOM": ("RM", True), "RM": ("RM", True),
+    "SLIP": ("SLIP", True),
+    "SPACE": ("SPC", True), "SPC": ("SPC", True),
+    "STOP": ("STOP", True),
+    "SUITE": ("STE", True), "STE": ("STE", True),
+    "TRAILER": ("TRLR", True), "TRLR": ("TRLR", True),
+    "UNIT": ("UNIT", True),
+    "#": ("#", True),
+    "BASEMENT": ("BSMT", False), "BSMT": ("BSMT", False),
+    "FRONT": ("FRNT", False), "FRNT": ("FRNT", False),
+    "LOBBY": ("LBBY", False), "LBBY": ("LBBY", False),
+    "LOWER": ("LOWR", False), "LOWR": ("LOWR", False),
+    "OFFICE": ("OFC", False), "OFC": ("OFC", False),
+    "PENTHOUSE": ("PH", False), "PH": ("PH", False),
+    "REAR": ("REAR", False),
+    "SIDE": ("SIDE", False),
+    "UPPER": ("UPPR", False), "UPPR": ("UPPR", False),
+}
+
+
+def _is_unit_value(token: str) -> bool:
+    """Unit numbers carry a digit or are a single letter ("APT 4B", "STE C")."""
+    return len(token) == 1 or any(c.isdigit() for c in token)
+
+
+def _unit_start(tokens: list[str]) -> int:
+    """Index where the secondary unit begins, or len(tokens) if there is none."""
+    for i in range(2, len(tokens)):
+        designator = UNIT_DESIGNATORS.get(tokens[i])
+        if designator is None:
+            continue
+        _, ranged = designator
+        rest = [t for t in tokens[i + 1:] if t != "#"]
+        if ranged and rest and _is_unit_value(rest[0]):
+            return i
+        if not ranged and not rest:
+            return i
+    return len(tokens)
+
+
+def _normalize_street(tokens: list[str]) -> list[str]:
+    street = list(tokens)
+    # Name tokens start after the house number (which may be "123", "123-B" or "123 1/2")
+    start = 1 if street and street[0][0].isdigit() else 0
+    if start and len(street) > 1 and "/" in street[1]:
+        start = 2
+
+    end = len(street)
+    # Post-directional after a suffix: "MAIN STREET NORTH" -> "MAIN ST N"
+    if end - start >= 3 and street[end - 1] in DIRECTIONALS and street[end - 2] in STREET_SUFFIXES:
+        street[end - 1] = DIRECTIONALS[street[end - 1]]
+        end -= 1
+
+    # Suffix: only the last street token, and never the whole street name
+    if end - start >= 2 and street[end - 1] in STREET_SUFFIXES:
+        street[end - 1] = STREET_SUFFIXES[street[end - 1]]
+        end -= 1
+
+    # Pre-directional, unless it is the street name itself ("100 NORTH ST")
+    if end - start >= 2 and street[start] in DIRECTIONALS:
+        street[start] = DIRECTIONALS[street[start]]
+
+    return street
+
+
+def _normalize_unit(tokens: list[str]) -> list[str]:
+    if not tokens:
+        return []
+    designator, _ = UNIT_DESIGNATORS[tokens[0]]
+    values = [t for t in tokens[1:] if t != "#"]
+    return [designator, *values]
+
+
+@lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def normalize_address(address: Optional[str]) -> str:
+    """USPS-style street line: "123 North Main Street, Apt. #4" -> "123 N MAIN ST APT 4"."""
+    if not address:
+        return ""
+    tokens = _TOKEN_RE.findall(address.upper().replace(".", ""))
+    unit = _unit_start(tokens)
+    return " ".join(_normalize_street(tokens[:unit]) + _normalize_unit(tokens[unit:]))
+
+
+def address_key(address: Optional[str], state_abbr: Optional[str]) -> str:
+    """Canonical "ADDRESS|ST" key that lead ids are hashed from."""
+    return f"{normalize_address(address)}|{(state_abbr or '').upper()}"
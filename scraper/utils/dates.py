@@ -0,0 +1,78 @@
+"""
+Sale Date Parsing
+A source's sale dates nearly always share one layout, so the strptime
+format that last worked is remembered per source and tried first. Known
+auction-site layouts are tried next, and dateutil's generic parser only
+runs when neither matches.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from dateutil import parser as dateutil_parser
+
+# Layouts seen on county calendars and auction sites, most common first
+DATE_FORMATS = (
+    "%m/%d/%Y",
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%m/%d/%Y %I:%M %p",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+    "%b %d %Y",
+    "%a, %b %d, %Y",
+    "%A, %B %d, %Y",
+    "%d %b %Y",
+    "%m-%d-%Y",
+)
+
+# Learned format per source key, shared by every scraper in the process
+_learned_formats: dict[str, str] = {}
+
+
+def _strptime(value: str, fmt: str) -> Optional[datetime]:
+    try:
+        return datetime.strptime(value, fmt)
+    except ValueError:
+        return None
+
+
+def parse_date_string(value: str, source: Optional[str] = None) -> Optional[str]:
+    """YYYY-MM-DD for a date string, or None if no parser can read it.
+
+    Tries the source's learned format, then DATE_FORMATS (learning the one
+    that matches), then dateutil.
+    """
+    value = " ".join(value.split())
+    if not value:
+        return None
+
+    learned = _learned_formats.get(source) if source else None
+    if learned:
+        parsed = _strptime(value, learned)
+        if parsed:
+            return parsed.strftime("%Y-%m-%d")
+
+    for fmt in DATE_FORMATS:
+        if fmt == learned:
+            continue
+        parsed = _strptime(value, fmt)
+        if parsed:
+            if source:
+                _learned_formats[source] = fmt
+            return parsed.strftime("%Y-%m-%d")
+
+    try:
+        return dateutil_parser.parse(value).strftime("%Y-%m-%d")
+    except (ValueError, OverflowError):
+        return None
+
+
+def learned_format(source: str) -> Optional[str]:
+    return _learned_formats.get(source)
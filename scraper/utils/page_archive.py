@@ -0,0 +1,248 @@
+"""
+Raw Page Archive
+Every fetched page is stored once, zstd-compressed and keyed by the SHA-256
+of its body, and linked to the scrape job through raw_scraped_data. Bodies
+live either inline in raw_page_blobs.data ("db") or in append-only local
+segment files with an offset index ("segment"), selected by ARCHIVE_BACKEND.
+"""
+
+import asyncio
+import fcntl
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Union
+from uuid import UUID
+
+import structlog
+
+from ..config import config
+
+logger = structlog.get_logger()
+
+
+def content_hash(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+def compress(body: bytes, level: Optional[int] = None) -> bytes:
+    import zstandard
+
+    return zstandard.ZstdCompressor(level=level or config.scraper.archive_zstd_level).compress(body)
+
+
+def decompress(blob: bytes) -> bytes:
+    import zstandard
+
+    return zstandard.ZstdDecompressor().decompress(blob)
+
+
+class SegmentStore:
+    """Append-only segment files plus a tab-separated offset index.
+
+    Layout under `root`:
+        segment-000001.zst ...   concatenated zstd frames
+        index                    sha256 <TAB> segment <TAB> offset <TAB> length
+
+    Appends take an exclusive flock, so several workers can share one
+    archive directory. Segments roll over at ARCHIVE_SEGMENT_BYTES.
+    """
+
+    def __init__(self, root: Optional[str] = None, segment_bytes: Optional[int] = None):
+        self.root = Path(root or config.scraper.archive_dir)
+        self.segment_bytes = segment_bytes or config.scraper.archive_segment_bytes
+        self._index: Optional[dict[str, tuple[str, int, int]]] = None
+        self._index_size = 0
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / "index"
+
+    def _refresh_index(self) -> dict[str, tuple[str, int, int]]:
+        """Load index lines appended since the last read (by this or another process)."""
+        if self._index is None:
+            self._index, self._index_size = {}, 0
+        if not self.index_path.exists():
+            return self._index
+
+        with open(self.index_path, "rb") as f:
+            f.seek(self._index_size)
+            data = f.read()
+        # Only consume complete lines; a concurrent append may be mid-write
+        complete = data[:data.rfind(b"\n") + 1]
+        self._index_size += len(complete)
+        for line in complete.decode().splitlines():
+            sha, segment, offset, length = line.split("\t")
+            self._index[sha] = (segment, int(offset), int(length))
+        return self._index
+
+    def locate(self, sha: str) -> Optional[tuple[str, int, int]]:
+        index = self._refresh_index()
+        return index.get(sha)
+
+    def append(self, sha: str, blob: bytes) -> tuple[str, int, int]:
+        """Store a compressed blob unless the index already has it; returns its location."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / ".lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                existing = self.locate(sha)
+                if existing:
+                    return existing
+
+                segment = self._current_segment(len(blob))
+                with open(self.root / segment, "ab") as f:
+                    offset = f.seek(0, os.SEEK_END)
+                    f.write(blob)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                with open(self.index_path, "a") as index:
+                    index.write(f"{sha}\t{segment}\t{offset}\t{len(blob)}\n")
+                self._refresh_index()
+                return segment, offset, len(blob)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def read(self, segment: str, offset: int, length: int) -> bytes:
+        with open(self.root / segment, "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+
+    def _current_segment(self, incoming: int) -> str:
+        segments = sorted(self.root.glob("segment-*.zst"))
+        if segments:
+            latest = segments[-1]
+            if latest.stat().st_size + incoming <= self.segment_bytes:
+                return latest.name
+            number = int(latest.stem.split("-")[1]) + 1
+        else:
+            number = 1
+        return f"segment-{number:06d}.zst"
+
+
+class PageArchive:
+    """Content-addressed page store shared by every job on a worker."""
+
+    # Hashes known to be stored, so repeat pages skip the blob lookup
+    KNOWN_HASHES = 10_000
+
+    def __init__(self, db_pool: Any, backend: Optional[str] = None):
+        self.db_pool = db_pool
+        self.backend = backend or config.scraper.archive_backend
+        if self.backend not in ("db", "segment"):
+            raise ValueError(f"Unknown archive backend: {self.backend}")
+        self.segments = SegmentStore() if self.backend == "segment" else None
+        self._known: OrderedDict[str, None] = OrderedDict()
+        self.stats = {"pages": 0, "new_blobs": 0, "bytes_in": 0, "bytes_stored": 0}
+        self.logger = logger.bind(component="page_archive", backend=self.backend)
+
+    def for_job(self, job_id: Optional[UUID], source_id: Optional[UUID]) -> "JobPageArchive":
+        return JobPageArchive(self, job_id, source_id)
+
+    async def store(
+        self,
+        url: str,
+        content: Union[str, bytes],
+        job_id: Optional[UUID] = None,
+        source_id: Optional[UUID] = None,
+        content_type: str = "html",
+    ) -> str:
+        """Archive a fetched body and link it to the job; returns its SHA-256."""
+        body = content.encode() if isinstance(content, str) else content
+        sha = content_hash(body)
+        self.stats["pages"] += 1
+        self.stats["bytes_in"] += len(body)
+
+        async with self.db_pool.acquire() as conn:
+            if sha not in self._known:
+                stored = await conn.fetchval(
+                    "SELECT 1 FROM raw_page_blobs WHERE content_sha256 = $1", sha
+                )
+                if not stored:
+                    await self._store_blob(conn, sha, body)
+                self._remember(sha)
+
+            await conn.execute(
+                """
+                INSERT INTO raw_scraped_data (job_id, source_id, page_url, content_sha256, content_type)
+                VALUES ($1, $2, $3, $4, $5)
+                """,
+                job_id,
+                source_id,
+                url,
+                sha,
+                content_type,
+            )
+        return sha
+
+    async def _store_blob(self, conn, sha: str, body: bytes):
+        blob = await asyncio.to_thread(compress, body)
+        data = segment = offset = None
+        if self.segments:
+            segment, offset, _ = await asyncio.to_thread(self.segments.append, sha, blob)
+        else:
+            data = blob
+
+        inserted = await conn.fetchval(
+            """
+            INSERT INTO raw_page_blobs
+                (content_sha256, size_bytes, compressed_bytes, storage, data, segment, segment_offset)
+            VALUES ($1, $2, $3, $4, $5, $6, $7)
+            ON CONFLICT (content_sha256) DO NOTHING
+            RETURNING 1
+            """,
+            sha,
+            len(body),
+            len(blob),
+            self.backend,
+            data,
+            segment,
+            offset,
+        )
+        if inserted:
+            self.stats["new_blobs"] += 1
+            self.stats["bytes_stored"] += len(blob)
+
+    async def load(self, sha: str, conn: Any = None) -> Optional[bytes]:
+        """Decompressed body for a hash, from whichever backend stored it."""
+        if conn is None:
+            async with self.db_pool.acquire() as conn:
+                return await self.load(sha, conn)
+
+        row = await conn.fetchrow(
+            """
+            SELECT storage, data, segment, segment_offset, compressed_bytes
+            FROM raw_page_blobs WHERE content_sha256 = $1
+            """,
+            sha,
+        )
+        if row is None:
+            return None
+        if row["storage"] == "db":
+            blob = row["data"]
+        else:
+            store = self.segments or SegmentStore()
+            blob = await asyncio.to_thread(
+                store.read, row["segment"], row["segment_offset"], row["compressed_bytes"]
+            )
+        return await asyncio.to_thread(decompress, blob)
+
+    def _remember(self, sha: str):
+        self._known[sha] = None
+        self._known.move_to_end(sha)
+        while len(self._known) > self.KNOWN_HASHES:
+            self._known.popitem(last=False)
+
+
+class JobPageArchive:
+    """A PageArchive bound to one job, handed to its scraper."""
+
+    def __init__(self, archive: PageArchive, job_id: Optional[UUID], source_id: Optional[UUID]):
+        self.archive = archive
+        self.job_id = job_id
+        self.source_id = source_id
+
+    async def store(self, url: str, content: Union[str, bytes], content_type: str = "html") -> str:
+        return await self.archive.store(url, content, self.job_id, self.source_id, content_type)
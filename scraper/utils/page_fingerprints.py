@@ -0,0 +1,141 @@
+"""
+Page Fingerprints
+Per-URL ETag, Last-Modified and normalized-content hash from the last
+successful scrape, so unchanged listing pages skip parsing and persistence.
+Paginated pages also keep their next-page link, so a walk can continue past
+a 304 that has no body to read it from.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+# Markup that changes on every render without the listings changing
+_VOLATILE_RE = re.compile(
+    r"<script\b.*?</script>|<style\b.*?</style>|<noscript\b.*?</noscript>|<!--.*?-->"
+    r"|\snonce=\"[^\"]*\"|<input[^>]+name=\"[^\"]*(?:csrf|token|viewstate|eventvalidation)[^\"]*\"[^>]*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalized_hash(content: Any) -> str:
+    """SHA-256 of a page with scripts, comments, tokens and whitespace runs removed."""
+    if isinstance(content, bytes):
+        content = content.decode("utf-8", errors="replace")
+    normalized = _WHITESPACE_RE.sub(" ", _VOLATILE_RE.sub("", content)).strip()
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+@dataclass
+class Fingerprint:
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+    next_url: Optional[str] = None
+
+
+UPSERT_FINGERPRINTS_SQL = """
+    INSERT INTO page_fingerprints (url, source, etag, last_modified, content_hash, next_url)
+    SELECT * FROM unnest($1::text[], $2::text[], $3::text[], $4::text[], $5::text[], $6::text[])
+    ON CONFLICT (url) DO UPDATE SET
+        source = EXCLUDED.source,
+        etag = COALESCE(EXCLUDED.etag, page_fingerprints.etag),
+        last_modified = COALESCE(EXCLUDED.last_modified, page_fingerprints.last_modified),
+        content_hash = COALESCE(EXCLUDED.content_hash, page_fingerprints.content_hash),
+        -- The link belongs to the body: replace it (even with NULL) only when the body was read
+        next_url = CASE
+            WHEN EXCLUDED.content_hash IS NOT NULL THEN EXCLUDED.next_url
+            ELSE page_fingerprints.next_url
+        END,
+        checked_at = NOW(),
+        changed_at = CASE
+            WHEN EXCLUDED.content_hash IS NOT NULL
+                 AND EXCLUDED.content_hash IS DISTINCT FROM page_fingerprints.content_hash
+            THEN NOW()
+            ELSE page_fingerprints.changed_at
+        END
+"""
+
+
+class PageFingerprints:
+    """page_fingerprints table access shared by every job on a worker."""
+
+    def __init__(self, db_pool: Any):
+        self.db_pool = db_pool
+
+    def for_job(self, source: str) -> "JobFingerprints":
+        return JobFingerprints(self, source)
+
+    async def fetch(self, url: str) -> Optional[Fingerprint]:
+        async with self.db_pool.acquire() as conn:
+            row = await conn.fetchrow(
+                "SELECT etag, last_modified, content_hash, next_url FROM page_fingerprints"
+                " WHERE url = $1",
+                url,
+            )
+        return Fingerprint(**dict(row)) if row else None
+
+    async def save(self, source: str, fingerprints: dict[str, Fingerprint]):
+        if not fingerprints:
+            return
+        urls = list(fingerprints)
+        async with self.db_pool.acquire() as conn:
+            await conn.execute(
+                UPSERT_FINGERPRINTS_SQL,
+                urls,
+                [source] * len(urls),
+                [fingerprints[url].etag for url in urls],
+                [fingerprints[url].last_modified for url in urls],
+                [fingerprints[url].content_hash for url in urls],
+                [fingerprints[url].next_url for url in urls],
+            )
+
+
+class JobFingerprints:
+    """One job's view of the store.
+
+    Lookups return the fingerprints from the last successful run; what this
+    run sees is staged and only written by commit(), after its leads are
+    persisted, so a failed run never masks pages it didn't save.
+    """
+
+    def __init__(self, store: PageFingerprints, source: str):
+        self.store = store
+        self.source = source
+        self._previous: dict[str, Optional[Fingerprint]] = {}
+        self._staged: dict[str, Fingerprint] = {}
+
+    async def get(self, url: str) -> Optional[Fingerprint]:
+        if url not in self._previous:
+            try:
+                self._previous[url] = await self.store.fetch(url)
+            except Exception as e:
+                logger.warning("Fingerprint lookup failed", url=url, error=str(e))
+                self._previous[url] = None
+        return self._previous[url]
+
+    def stage(self, url: str, **fields: Optional[str]):
+        staged = self._staged.setdefault(url, Fingerprint())
+        for name, value in fields.items():
+            if value is not None:
+                setattr(staged, name, value)
+
+    def fork(self) -> "JobFingerprints":
+        """A separately staged view for one part of a fan-out job; see adopt()."""
+        return JobFingerprints(self.store, self.source)
+
+    def adopt(self, child: "JobFingerprints"):
+        """Take over a fork's staged fingerprints once its part of the job succeeded."""
+        self._staged.update(child._staged)
+        child._staged = {}
+
+    async def commit(self):
+        await self.store.save(self.source, self._staged)
+        self._staged = {}
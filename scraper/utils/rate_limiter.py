@@ -0,0 +1,162 @@
+"""
+Distributed Rate Limiter
+Per-domain token buckets shared by every worker through Redis.
+"""
+
+import asyncio
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
+import structlog
+
+from ..config import config
+
+logger = structlog.get_logger()
+
+
+# Atomic token-bucket reservation. Tokens may go negative: each caller
+# reserves the next free slot and is told how long to wait for it, so
+# concurrent workers queue fairly without retry loops. Uses the Redis
+# clock so worker clock skew doesn't matter.
+TOKEN_BUCKET_LUA = """
+local key = KEYS[1]
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local state = redis.call('HMGET', key, 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+
+tokens = math.min(capacity, tokens + (now - ts) * rate) - 1
+
+local wait = 0
+if tokens < 0 then
+    wait = -tokens / rate
+end
+
+redis.call('HSET', key, 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', key, math.ceil((capacity - tokens) / rate * 1000) + 1000)
+
+return tostring(wait)
+"""
+
+
+def domain_for(url: str) -> str:
+    """Rate-limit key for a URL: its host without a leading www."""
+    host = urlparse(url).netloc.lower() or url.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class LocalTokenBucket:
+    """In-process token bucket with the same reservation semantics as the Lua script."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a token and return the seconds to wait before using it."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate) - 1
+        self.updated = now
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+class RateLimiter:
+    """Per-domain rate limiter backed by Redis, with an in-process fallback."""
+
+    REDIS_RETRY_SECONDS = 30
+
+    def __init__(self, redis_url: Optional[str] = None, burst: int = 1):
+        self.redis_url = redis_url or config.redis.url
+        self.burst = burst
+        self._redis = None
+        self._script = None
+        self._redis_retry_at = 0.0
+        self._connect_lock = asyncio.Lock()
+        self._local: dict[str, LocalTokenBucket] = {}
+        self.logger = logger.bind(component="rate_limiter")
+
+    async def acquire(self, domain: str, rate_per_minute: float) -> float:
+        """Wait until a request to `domain` is allowed. Returns seconds waited."""
+        rate = max(rate_per_minute, 0.001) / 60.0
+
+        wait = await self._reserve_redis(domain, rate)
+        if wait is None:
+            wait = self._reserve_local(domain, rate)
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    async def _reserve_redis(self, domain: str, rate: float) -> Optional[float]:
+        """Reserve a token in Redis, or None if Redis is unavailable."""
+        if not await self._connect():
+            return None
+
+        try:
+            wait = await self._script(keys=[f"ratelimit:{domain}"], args=[rate, self.burst])
+            return float(wait)
+        except Exception as e:
+            self.logger.warning("Redis rate limiter unavailable, using local buckets", error=str(e))
+            await self._disconnect()
+            return None
+
+    def _reserve_local(self, domain: str, rate: float) -> float:
+        bucket = self._local.get(domain)
+        if bucket is None or bucket.rate != rate:
+            bucket = self._local[domain] = LocalTokenBucket(rate, self.burst)
+        return bucket.reserve()
+
+    async def _connect(self) -> bool:
+        if self._redis is not None:
+            return True
+        if time.monotonic() < self._redis_retry_at:
+            return False
+
+        async with self._connect_lock:
+            if self._redis is not None:
+                return True
+            if time.monotonic() < self._redis_retry_at:
+                return False
+            return await self._open_redis()
+
+    async def _open_redis(self) -> bool:
+        try:
+            import redis.asyncio as redis
+
+            client = redis.from_url(self.redis_url, socket_connect_timeout=2, socket_timeout=2)
+            await client.ping()
+            self._script = client.register_script(TOKEN_BUCKET_LUA)
+            self._redis = client
+            return True
+        except Exception as e:
+            self.logger.warning("Redis rate limiter unavailable, using local buckets", error=str(e))
+            self._redis_retry_at = time.monotonic() + self.REDIS_RETRY_SECONDS
+            return False
+
+    async def _disconnect(self):
+        client, self._redis, self._script = self._redis, None, None
+        self._redis_retry_at = time.monotonic() + self.REDIS_RETRY_SECONDS
+        if client is not None:
+            try:
+                await client.aclose()
+            except Exception:
+                pass
+
+
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Process-wide rate limiter shared by all scrapers."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter()
+    return _rate_limiter
@@ -0,0 +1,47 @@
+"""
+Phase Timings
+Wall-clock seconds a scrape job spends in each phase, stored on
+scrape_jobs.timings and rolled up per source by scrape_phase_timings.
+
+Phases:
+    queue_wait        claimable -> claimed by a worker
+    rate_limit_wait   waiting on the fleet-wide per-domain request budget
+    browser_acquire   getting a browser context (pool or fresh launch)
+    navigation        page.goto, or the plain HTTP GET when HTTP-first
+    selector_wait     waiting for listing markup to render
+    parse             listing page parsing (inline or in the parse pool)
+    persist           lead upserts and fingerprint commits
+
+Phases overlap when a scraper fans out, so they can sum to more than the
+job's wall-clock time.
+"""
+
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class PhaseTimings:
+    """Accumulated seconds and call counts per phase for one job."""
+
+    def __init__(self):
+        self.seconds: defaultdict[str, float] = defaultdict(float)
+        self.counts: Counter = Counter()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block (sync or containing awaits) under `name`."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def add(self, name: str, seconds: float):
+        self.seconds[name] += max(0.0, seconds)
+        self.counts[name] += 1
+
+    def as_dict(self) -> dict[str, float]:
+        """Seconds per phase, rounded to milliseconds (the scrape_jobs.timings shape)."""
+        return {name: round(seconds, 3) for name, seconds in self.seconds.items()}
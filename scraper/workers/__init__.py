@@ -1,4 +1,14 @@
 """Worker processes."""
 from .job_worker import JobWorker, JobScheduler, run_worker, run_scheduler
+from .queue import JobQueue, PostgresJobQueue, RedisStreamJobQueue, create_job_queue
 
-__all__ = ["JobWorker", "JobScheduler", "run_worker", "run_scheduler"]
+__all__ = [
+    "JobWorker",
+    "JobScheduler",
+    "run_worker",
+    "run_scheduler",
+    "JobQueue",
+    "PostgresJobQueue",
+    "RedisStreamJobQueue",
+    "create_job_queue",
+]
@@ -6,16 +6,39 @@ Continuously processes scrape jobs from the queue.
 import asyncio
 import signal
 import sys
+from contextlib import aclosing
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Mapping, Optional
 from uuid import UUID
 
 import asyncpg
 import structlog
 
 from ..config import config
-from ..scrapers.base import ScrapeResult, ForeclosureLead
+from ..scrapers.base import (
+    BaseScraper,
+    Crawl4AIScraper,
+    PlaywrightScraper,
+    ScrapeResult,
+    close_http_client,
+    start_crawler,
+)
+from ..scrapers.browser_pool import BrowserPool
+from ..scrapers.leads import LeadBatch
+from ..scrapers.parsing import get_parse_pool, shutdown_parse_pool
 from ..scrapers.auction_com import AuctionComScraper, RealAuctionScraper
+from ..sources.registry import US_STATES
+from ..utils.page_archive import PageArchive
+from ..utils.page_fingerprints import PageFingerprints
+from ..utils.timings import PhaseTimings
+from .queue import (
+    JobQueue,
+    RedisStreamJobQueue,
+    create_job_queue,
+    fail_job,
+    idle_timeout,
+    next_job_due_in,
+)
 
 logger = structlog.get_logger()
 
@@ -27,6 +50,75 @@ SCRAPERS = {
     # Add more scrapers as they're implemented
 }
 
+# Jobs without a (known) source scraper class, e.g. county jobs, run this one
+DEFAULT_SCRAPER = "AuctionComScraper"
+
+
+# Columns written for each scraped lead, in COPY/record order
+LEAD_COLUMNS = (
+    "id", "property_address", "city", "state", "state_abbr",
+    "zip_code", "parcel_id", "owner_name", "case_number",
+    "sale_date", "sale_amount", "lender_name", "trustee_name",
+    "foreclosure_type", "source", "source_type", "batch_id",
+)
+
+# Existing leads only pick up fresh sale info and provenance; skip-trace and
+# workflow columns are owned by other pipelines and never overwritten here.
+_LEAD_CONFLICT_SQL = """
+    ON CONFLICT (id) DO UPDATE SET
+        sale_date = COALESCE(EXCLUDED.sale_date, foreclosure_leads.sale_date),
+        sale_amount = COALESCE(EXCLUDED.sale_amount, foreclosure_leads.sale_amount),
+        source = EXCLUDED.source,
+        batch_id = EXCLUDED.batch_id,
+        last_updated = NOW()
+    RETURNING (xmax = 0) AS inserted
+"""
+
+UPSERT_LEAD_SQL = f"""
+    INSERT INTO foreclosure_leads ({", ".join(LEAD_COLUMNS)}, scraped_at)
+    VALUES ({", ".join(f"${i}" for i in range(1, len(LEAD_COLUMNS) + 1))}, NOW())
+    {_LEAD_CONFLICT_SQL}
+"""
+
+BULK_UPSERT_LEADS_SQL = f"""
+    WITH upserted AS (
+        INSERT INTO foreclosure_leads ({", ".join(LEAD_COLUMNS)}, scraped_at)
+        SELECT {", ".join(LEAD_COLUMNS)}, NOW() FROM foreclosure_leads_stage
+        {_LEAD_CONFLICT_SQL}
+    )
+    SELECT
+        COUNT(*) FILTER (WHERE inserted) AS new_count,
+        COUNT(*) FILTER (WHERE NOT inserted) AS updated_count
+    FROM upserted
+"""
+
+
+async def upsert_leads(
+    conn: asyncpg.Connection,
+    leads: LeadBatch,
+    upsert_sql: str = BULK_UPSERT_LEADS_SQL,
+) -> tuple[int, int]:
+    """Upsert a batch of leads in one statement. Returns (new_count, updated_count)."""
+    leads = leads.dedup()
+    if not len(leads):
+        return 0, 0
+
+    async with conn.transaction():
+        await conn.execute(
+            f"""
+            CREATE TEMP TABLE foreclosure_leads_stage ON COMMIT DROP AS
+            SELECT {", ".join(LEAD_COLUMNS)} FROM foreclosure_leads WITH NO DATA
+            """
+        )
+        await conn.copy_records_to_table(
+            "foreclosure_leads_stage",
+            records=leads.records(LEAD_COLUMNS),
+            columns=LEAD_COLUMNS,
+        )
+        row = await conn.fetchrow(upsert_sql)
+
+    return row["new_count"], row["updated_count"]
+
 
 class JobWorker:
     """Worker that processes scrape jobs from the queue."""
@@ -35,7 +127,15 @@ class JobWorker:
         self.worker_id = config.scraper.worker_id
         self.running = True
         self.db_pool: Optional[asyncpg.Pool] = None
-        self.current_job_id: Optional[UUID] = None
+        self.queue: Optional[JobQueue] = None
+        self.browser_pool = BrowserPool()
+        self.crawler = None  # shared AsyncWebCrawler, started on first Crawl4AI job
+        self.page_archive: Optional[PageArchive] = None
+        self.fingerprints: Optional[PageFingerprints] = None
+        self._crawler_lock = asyncio.Lock()
+        self.max_concurrent_jobs = max(1, config.scraper.max_concurrent_jobs)
+        self.current_jobs: dict[UUID, asyncio.Task] = {}
+        self._wakeup = asyncio.Event()
         self.logger = logger.bind(worker_id=self.worker_id)
 
     async def start(self):
@@ -47,31 +147,57 @@ class JobWorker:
         for sig in (signal.SIGTERM, signal.SIGINT):
             loop.add_signal_handler(sig, self.shutdown)
 
-        # Connect to database
+        # Connect to database (one connection per in-flight job plus headroom)
         self.db_pool = await asyncpg.create_pool(
             config.database.connection_string,
             min_size=2,
-            max_size=10,
+            max_size=max(10, self.max_concurrent_jobs + 2),
         )
 
-        # Main worker loop
+        self.logger.info("Worker pool ready", max_concurrent_jobs=self.max_concurrent_jobs)
+
+        self.queue = create_job_queue(self.db_pool, self.worker_id)
+        await self.queue.start(self._wakeup.set)
+
+        if config.scraper.archive_backend != "none":
+            self.page_archive = PageArchive(self.db_pool)
+        if config.scraper.conditional_fetch:
+            self.fingerprints = PageFingerprints(self.db_pool)
+
+        # Warm the shared browsers; scrapers launch on demand if this fails
+        try:
+            await self.browser_pool.start()
+        except Exception as e:
+            self.logger.warning("Browser pool warm-up failed", error=str(e))
+        heartbeat = asyncio.create_task(self.heartbeat_loop(), name="job-heartbeat")
+        get_parse_pool()  # Shared by every job; parse processes start with the first big page
+
+        # Main worker loop: keep up to max_concurrent_jobs scrapes in flight
         while self.running:
             try:
-                job_id = await self.claim_next_job()
+                await self.fill_slots()
 
-                if job_id:
-                    self.current_job_id = job_id
-                    await self.process_job(job_id)
-                    self.current_job_id = None
-                else:
-                    # No jobs available, wait before checking again
-                    await asyncio.sleep(10)
+                # Sleep until a slot frees up, the queue signals new work, or the safety-net poll
+                await self.wait_for_work(await self.queue.wait_timeout())
 
             except Exception as e:
                 self.logger.exception("Worker loop error", error=str(e))
-                await asyncio.sleep(30)  # Back off on errors
+                await self.wait_for_work(30)  # Back off on errors
+
+        # Drain in-flight jobs before releasing the pool (leases stay fresh meanwhile)
+        await self.drain()
+        heartbeat.cancel()
 
         # Cleanup
+        self.logger.info("Browser pool stats", **self.browser_pool.stats.as_dict())
+        if self.page_archive:
+            self.logger.info("Page archive stats", **self.page_archive.stats)
+        await self.browser_pool.close()
+        if self.crawler:
+            await self.crawler.__aexit__(None, None, None)
+        await close_http_client()
+        shutdown_parse_pool()
+        await self.queue.close()
         if self.db_pool:
             await self.db_pool.close()
 
@@ -79,56 +205,104 @@ class JobWorker:
 
     def shutdown(self):
         """Handle shutdown signal."""
-        self.logger.info("Shutdown signal received")
+        self.logger.info("Shutdown signal received", in_flight=len(self.current_jobs))
         self.running = False
+        self._wakeup.set()
 
-    async def claim_next_job(self) -> Optional[UUID]:
-        """Claim the next pending job from the queue."""
-        async with self.db_pool.acquire() as conn:
-            job_id = await conn.fetchval(
-                "SELECT get_next_scrape_job($1)",
-                self.worker_id
+    async def wait_for_work(self, timeout: float):
+        """Sleep until a job finishes, the worker is woken up, or the timeout elapses."""
+        wakeup = asyncio.create_task(self._wakeup.wait())
+        try:
+            await asyncio.wait(
+                [wakeup, *self.current_jobs.values()],
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED,
             )
-            return job_id
+        finally:
+            wakeup.cancel()
+        self._wakeup.clear()
+
+    async def fill_slots(self):
+        """Claim enough jobs in one round-trip to fill every free slot."""
+        free_slots = self.max_concurrent_jobs - len(self.current_jobs)
+        if not self.running or free_slots <= 0:
+            return
 
-    async def process_job(self, job_id: UUID):
-        """Process a single scrape job."""
-        self.logger.info("Processing job", job_id=str(job_id))
+        for job in await self.queue.claim(free_slots):
+            self.start_job(job)
 
-        try:
-            # Get job details
-            async with self.db_pool.acquire() as conn:
-                job = await conn.fetchrow(
-                    """
-                    SELECT j.*, s.scraper_class, s.name as source_name,
-                           c.name as county_name
-                    FROM scrape_jobs j
-                    LEFT JOIN scrape_sources s ON j.source_id = s.id
-                    LEFT JOIN counties c ON j.county_id = c.id
-                    WHERE j.id = $1
-                    """,
-                    job_id
-                )
+    def start_job(self, job: Mapping[str, Any]):
+        """Run a claimed job as a background task occupying one slot."""
+        job_id = job["id"]
+        task = asyncio.create_task(self.process_job(job), name=f"scrape-job-{job_id}")
+        self.current_jobs[job_id] = task
+        task.add_done_callback(lambda _: self.current_jobs.pop(job_id, None))
+
+    async def drain(self):
+        """Wait for in-flight jobs to finish after shutdown."""
+        if not self.current_jobs:
+            return
 
-            if not job:
-                self.logger.error("Job not found", job_id=str(job_id))
-                return
+        self.logger.info("Draining in-flight jobs", count=len(self.current_jobs))
+        await asyncio.gather(*self.current_jobs.values(), return_exceptions=True)
+
+    async def heartbeat_loop(self):
+        """Periodically renew the lease on every in-flight job."""
+        while True:
+            await asyncio.sleep(config.scraper.heartbeat_interval)
+            self.logger.debug("Browser pool stats", **self.browser_pool.stats.as_dict())
+            if not self.current_jobs:
+                continue
+            try:
+                await self.renew_leases()
+            except Exception as e:
+                self.logger.warning("Heartbeat failed", error=str(e))
+
+    async def renew_leases(self):
+        """Extend ownership of every in-flight job, cancelling any this worker lost."""
+        lost = await self.queue.renew(list(self.current_jobs))
+        for job_id in lost:
+            self.logger.warning("Lease lost for in-flight job, cancelling it", job_id=str(job_id))
+            task = self.current_jobs.get(job_id)
+            if task:
+                task.cancel()
+
+    async def process_job(self, job: Mapping[str, Any]):
+        """Process a single claimed scrape job."""
+        job_id = job["id"]
+        self.logger.info("Processing job", job_id=str(job_id))
 
+        timings = PhaseTimings()
+        if job.get("queue_wait_seconds") is not None:
+            timings.add("queue_wait", job["queue_wait_seconds"])
+
+        try:
             # Determine which scraper to use
             scraper_class_name = job["scraper_class"]
             if not scraper_class_name or scraper_class_name not in SCRAPERS:
                 # Default to AuctionComScraper for nationwide scraping
-                scraper_class_name = "AuctionComScraper"
+                scraper_class_name = DEFAULT_SCRAPER
 
             scraper_class = SCRAPERS[scraper_class_name]
 
-            # Create scraper instance
+            # Create scraper instance; browser scrapers share the worker's pool
+            scraper_kwargs = {"timings": timings}
+            if issubclass(scraper_class, PlaywrightScraper):
+                scraper_kwargs["browser_pool"] = self.browser_pool
+            elif issubclass(scraper_class, Crawl4AIScraper):
+                scraper_kwargs["crawler"] = await self.get_crawler()
+
+            if self.page_archive:
+                scraper_kwargs["page_archive"] = self.page_archive.for_job(job_id, job.get("source_id"))
+            if self.fingerprints:
+                scraper_kwargs["fingerprints"] = self.fingerprints.for_job(scraper_class_name)
+
             scraper = scraper_class(
                 state_abbr=job["state_abbr"],
                 county_id=job["county_id"],
+                **scraper_kwargs,
             )
 
-            # Execute scrape
             self.logger.info(
                 "Executing scraper",
                 scraper=scraper_class_name,
@@ -136,195 +310,133 @@ class JobWorker:
                 county=job.get("county_name"),
             )
 
-            result = await scraper.scrape()
+            # Execute scrape, persisting leads in micro-batches as they stream in
+            result = await self.run_scraper(scraper)
 
-            # Save results
-            await self.save_results(job_id, result)
+            # Pages seen this run only count as "unchanged" next time once their leads are saved
+            if result.success and scraper.fingerprints:
+                with timings.phase("persist"):
+                    await scraper.fingerprints.commit()
 
-            # Update job status
-            await self.complete_job(job_id, result)
+            result.timings = timings.as_dict()
+            self.logger.info("Job timings", job_id=str(job_id), **result.timings)
+
+            # Update job status; leads already saved stay saved when a failed scrape is retried
+            if result.success:
+                await self.complete_job(job_id, result)
+            else:
+                self.logger.warning("Scrape failed", job_id=str(job_id), error=result.error)
+                await self.fail_job(job_id, result.error or "scrape failed", result.timings)
 
         except Exception as e:
             self.logger.exception("Job processing failed", job_id=str(job_id), error=str(e))
-            await self.fail_job(job_id, str(e))
-
-    async def save_results(self, job_id: UUID, result: ScrapeResult):
-        """Save scraped leads to the database."""
-        if not result.leads:
-            return
-
-        self.logger.info(f"Saving {len(result.leads)} leads")
-
-        async with self.db_pool.acquire() as conn:
-            new_count = 0
-            updated_count = 0
-
-            for lead in result.leads:
-                try:
-                    # Upsert lead
-                    existing = await conn.fetchval(
-                        "SELECT id FROM foreclosure_leads WHERE id = $1",
-                        lead.id
-                    )
-
-                    if existing:
-                        # Update existing lead
-                        await conn.execute(
-                            """
-                            UPDATE foreclosure_leads SET
-                                sale_date = COALESCE($2, sale_date),
-                                sale_amount = COALESCE($3, sale_amount),
-                                source = $4,
-                                batch_id = $5,
-                                last_updated = NOW()
-                            WHERE id = $1
-                            """,
-                            lead.id,
-                            lead.sale_date,
-                            lead.sale_amount,
-                            lead.source,
-                            lead.batch_id,
-                        )
-                        updated_count += 1
-                    else:
-                        # Insert new lead
-                        await conn.execute(
-                            """
-                            INSERT INTO foreclosure_leads (
-                                id, property_address, city, state, state_abbr,
-                                zip_code, parcel_id, owner_name, case_number,
-                                sale_date, sale_amount, lender_name, trustee_name,
-                                foreclosure_type, source, source_type, batch_id,
-                                scraped_at
-                            ) VALUES (
-                                $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11,
-                                $12, $13, $14, $15, $16, $17, NOW()
-                            )
-                            """,
-                            lead.id,
-                            lead.property_address,
-                            lead.city,
-                            lead.state,
-                            lead.state_abbr,
-                            lead.zip_code,
-                            lead.parcel_id,
-                            lead.owner_name,
-                            lead.case_number,
-                            lead.sale_date,
-                            lead.sale_amount,
-                            lead.lender_name,
-                            lead.trustee_name,
-                            lead.foreclosure_type,
-                            lead.source,
-                            lead.source_type,
-                            lead.batch_id,
-                        )
-                        new_count += 1
-
-                except Exception as e:
-                    self.logger.warning(
-                        "Failed to save lead",
-                        lead_id=lead.id,
-                        error=str(e)
-                    )
-
-            result.new_count = new_count
-            result.updated_count = updated_count
-
+            await self.fail_job(job_id, str(e), timings.as_dict())
+
+    async def get_crawler(self):
+        """Shared Crawl4AI crawler, kept open for the worker's lifetime."""
+        async with self._crawler_lock:
+            if self.crawler is None:
+                self.crawler = await start_crawler()
+        return self.crawler
+
+    async def run_scraper(self, scraper: BaseScraper) -> ScrapeResult:
+        """Drain a scraper's lead stream, persisting every persist_batch_size leads.
+
+        Partial results survive a scrape that dies part-way through.
+        """
+        batch_size = max(1, config.scraper.persist_batch_size)
+        batch = LeadBatch()
+        found = new_count = updated_count = 0
+
+        async with aclosing(scraper.scrape_stream()) as leads:
+            async for lead in leads:
+                batch.append(lead)
+                found += 1
+                if len(batch) >= batch_size:
+                    with scraper.timings.phase("persist"):
+                        new, updated = await self.save_leads(batch)
+                    new_count += new
+                    updated_count += updated
+                    batch = LeadBatch()
+
+        if len(batch):
+            with scraper.timings.phase("persist"):
+                new, updated = await self.save_leads(batch)
+            new_count += new
+            updated_count += updated
+
+        result = scraper.stream_result or ScrapeResult(success=True)
+        result.total_found = found
+        result.new_count = new_count
+        result.updated_count = updated_count
+        result.unchanged_pages = result.unchanged_pages or scraper.unchanged_pages
+        result.unparseable_dates = result.unparseable_dates or dict(scraper.unparseable_dates)
+
+        if found:
             self.logger.info(
                 "Leads saved",
                 new=new_count,
                 updated=updated_count,
             )
-
-    async def complete_job(self, job_id: UUID, result: ScrapeResult):
-        """Mark job as completed."""
-        async with self.db_pool.acquire() as conn:
-            await conn.execute(
-                """
-                UPDATE scrape_jobs SET
-                    status = 'completed',
-                    completed_at = NOW(),
-                    leads_found = $2,
-                    leads_new = $3,
-                    leads_updated = $4
-                WHERE id = $1
-                """,
-                job_id,
-                result.total_found,
-                result.new_count,
-                result.updated_count,
+        if result.unchanged_pages:
+            self.logger.info("Skipped unchanged pages", pages=result.unchanged_pages)
+        if result.unparseable_dates:
+            self.logger.warning(
+                "Unparseable sale dates",
+                count=sum(result.unparseable_dates.values()),
+                samples=list(result.unparseable_dates)[:5],
             )
+        if result.errors:
+            self.logger.warning("Scrape incomplete", errors=result.errors)
+        return result
 
-            # Update county stats if applicable
-            if result.total_found > 0:
-                await conn.execute(
-                    """
-                    UPDATE counties SET
-                        last_scraped_at = NOW(),
-                        last_successful_scrape = NOW(),
-                        consecutive_failures = 0,
-                        total_leads_found = total_leads_found + $2,
-                        leads_this_month = leads_this_month + $2
-                    WHERE id = (SELECT county_id FROM scrape_jobs WHERE id = $1)
-                    """,
-                    job_id,
-                    result.new_count,
+    async def save_leads(self, leads: LeadBatch) -> tuple[int, int]:
+        """Upsert a batch of leads. Returns (new_count, updated_count)."""
+        async with self.db_pool.acquire() as conn:
+            try:
+                return await upsert_leads(conn, leads)
+            except asyncpg.PostgresError as e:
+                # One bad row aborts the set-based statement; isolate it row by row
+                self.logger.warning("Bulk upsert failed, retrying per lead", error=str(e))
+                return await self.save_leads_individually(conn, leads)
+
+    async def save_leads_individually(
+        self, conn: asyncpg.Connection, leads: LeadBatch
+    ) -> tuple[int, int]:
+        """Upsert leads one at a time, skipping rows the database rejects."""
+        new_count = 0
+        updated_count = 0
+
+        for record in leads.dedup().records(LEAD_COLUMNS):
+            try:
+                inserted = await conn.fetchval(UPSERT_LEAD_SQL, *record)
+                if inserted:
+                    new_count += 1
+                else:
+                    updated_count += 1
+            except asyncpg.PostgresError as e:
+                self.logger.warning(
+                    "Failed to save lead",
+                    lead_id=record[0],
+                    error=str(e)
                 )
 
-    async def fail_job(self, job_id: UUID, error: str):
-        """Mark job as failed and schedule retry if applicable."""
-        async with self.db_pool.acquire() as conn:
-            job = await conn.fetchrow(
-                "SELECT attempt_number, max_attempts FROM scrape_jobs WHERE id = $1",
-                job_id
-            )
+        return new_count, updated_count
 
-            if job and job["attempt_number"] < job["max_attempts"]:
-                # Schedule retry with exponential backoff
-                retry_delay = 60 * (2 ** job["attempt_number"])  # 1m, 2m, 4m, etc.
-                await conn.execute(
-                    """
-                    UPDATE scrape_jobs SET
-                        status = 'pending',
-                        attempt_number = attempt_number + 1,
-                        next_retry_at = NOW() + ($2 || ' seconds')::INTERVAL,
-                        error_message = $3
-                    WHERE id = $1
-                    """,
-                    job_id,
-                    str(retry_delay),
-                    error,
-                )
-                self.logger.info(
-                    "Job scheduled for retry",
-                    job_id=str(job_id),
-                    retry_delay=retry_delay,
-                )
-            else:
-                # Max retries exceeded
-                await conn.execute(
-                    """
-                    UPDATE scrape_jobs SET
-                        status = 'failed',
-                        completed_at = NOW(),
-                        error_message = $2
-                    WHERE id = $1
-                    """,
-                    job_id,
-                    error,
-                )
+    async def complete_job(self, job_id: UUID, result: ScrapeResult):
+        """Mark job as completed."""
+        await self.queue.complete(
+            job_id,
+            result.total_found,
+            result.new_count,
+            result.updated_count,
+            result.timings,
+            "; ".join(result.errors) or None,
+        )
 
-                # Increment county failure count
-                await conn.execute(
-                    """
-                    UPDATE counties SET
-                        consecutive_failures = consecutive_failures + 1,
-                        last_scraped_at = NOW()
-                    WHERE id = (SELECT county_id FROM scrape_jobs WHERE id = $1)
-                    """,
-                    job_id,
-                )
+    async def fail_job(self, job_id: UUID, error: str, timings: Optional[dict[str, float]] = None):
+        """Mark job as failed and schedule retry if applicable."""
+        await self.queue.fail(job_id, error, timings)
 
 
 class JobScheduler:
@@ -333,73 +445,151 @@ class JobScheduler:
     def __init__(self):
         self.db_pool: Optional[asyncpg.Pool] = None
         self.running = True
+        self.dispatcher: Optional[asyncio.Task] = None
+        self._stopped = asyncio.Event()
         self.logger = logger.bind(component="scheduler")
 
     async def start(self):
         """Start the job scheduler."""
         self.logger.info("Starting job scheduler")
 
+        loop = asyncio.get_event_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self.shutdown)
+
         self.db_pool = await asyncpg.create_pool(
             config.database.connection_string,
             min_size=1,
             max_size=5,
         )
 
+        # With the Redis backend, the scheduler also feeds the job stream
+        if config.scraper.queue_backend.lower() == "redis":
+            self.dispatcher = asyncio.create_task(self.dispatch_loop(), name="job-dispatcher")
+
         while self.running:
             try:
+                await self.reap_expired_leases()
                 await self.schedule_due_counties()
                 await self.schedule_nationwide_sources()
-                await asyncio.sleep(300)  # Check every 5 minutes
+                await self.sleep(300)  # Check every 5 minutes
 
             except Exception as e:
                 self.logger.exception("Scheduler error", error=str(e))
-                await asyncio.sleep(60)
+                await self.sleep(60)
 
-    async def schedule_due_counties(self):
-        """Schedule jobs for counties that are due for scraping."""
-        async with self.db_pool.acquire() as conn:
-            # Find counties due for scraping
-            due_counties = await conn.fetch(
-                """
-                SELECT id, name, state_abbr
-                FROM counties
-                WHERE is_active = TRUE
-                  AND has_online_records = TRUE
-                  AND (next_scheduled_scrape IS NULL OR next_scheduled_scrape <= NOW())
-                  AND consecutive_failures < 5
-                ORDER BY next_scheduled_scrape NULLS FIRST
-                LIMIT 100
-                """
-            )
+        # Stop the dispatcher before releasing the pool it dispatches from
+        if self.dispatcher:
+            self.dispatcher.cancel()
+            try:
+                await self.dispatcher
+            except asyncio.CancelledError:
+                pass
+            self.dispatcher = None
+        await self.db_pool.close()
 
-            for county in due_counties:
-                # Check if there's already a pending job for this county
-                existing = await conn.fetchval(
+        self.logger.info("Job scheduler stopped")
+
+    def shutdown(self):
+        """Handle shutdown signal."""
+        self.logger.info("Shutdown signal received")
+        self.running = False
+        self._stopped.set()
+
+    async def sleep(self, seconds: float):
+        """Sleep for `seconds`, or until the scheduler is shut down."""
+        try:
+            await asyncio.wait_for(self._stopped.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def dispatch_loop(self):
+        """Move claimable scrape_jobs rows into the Redis stream as they become due."""
+        queue = RedisStreamJobQueue(self.db_pool, f"{config.scraper.worker_id}-dispatcher")
+        wakeup = asyncio.Event()
+        listener: Optional[asyncpg.Connection] = None
+
+        try:
+            await queue.connect()
+            while self.running:
+                try:
+                    if listener is None or listener.is_closed():
+                        listener = await asyncpg.connect(config.database.connection_string)
+                        await listener.add_listener(
+                            config.scraper.queue_notify_channel,
+                            lambda *args: wakeup.set(),
+                        )
+
+                    async with self.db_pool.acquire() as conn:
+                        dispatched = await queue.dispatch(conn)
+                        due_in = None if dispatched else await next_job_due_in(conn)
+
+                    if dispatched:
+                        self.logger.debug("Dispatched jobs to stream", count=dispatched)
+
+                except Exception as e:
+                    self.logger.exception("Dispatch error", error=str(e))
+                    dispatched, due_in = 0, None
+
+                # Keep topping up while the table has a backlog; otherwise wait for
+                # NOTIFY or the next deferred job, whichever comes first
+                timeout = 5 if dispatched else idle_timeout(config.scraper.queue_poll_interval, due_in)
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+                wakeup.clear()
+        finally:
+            if listener is not None and not listener.is_closed():
+                await listener.close()
+            await queue.close()
+
+    async def reap_expired_leases(self):
+        """Requeue running jobs whose worker stopped heartbeating."""
+        async with self.db_pool.acquire() as conn:
+            async with conn.transaction():
+                # Jobs claimed before leases existed fall back to started_at
+                expired = await conn.fetch(
                     """
-                    SELECT id FROM scrape_jobs
-                    WHERE county_id = $1 AND status IN ('pending', 'running')
+                    SELECT id, worker_id FROM scrape_jobs
+                    WHERE status = 'running'
+                      AND COALESCE(
+                          lease_expires_at,
+                          started_at + make_interval(secs => $1)
+                      ) < NOW()
+                    FOR UPDATE SKIP LOCKED
                     """,
-                    county["id"]
+                    config.scraper.job_lease_seconds,
                 )
 
-                if not existing:
-                    await conn.execute(
-                        "SELECT schedule_county_scrape($1)",
-                        county["id"]
+                for job in expired:
+                    retry_delay = await fail_job(
+                        conn,
+                        job["id"],
+                        f"Lease expired: worker {job['worker_id']} stopped heartbeating",
                     )
-                    self.logger.debug(
-                        "Scheduled county scrape",
-                        county=county["name"],
-                        state=county["state_abbr"],
+                    self.logger.warning(
+                        "Reaped stale job",
+                        job_id=str(job["id"]),
+                        worker_id=job["worker_id"],
+                        requeued=retry_delay is not None,
                     )
 
+    async def schedule_due_counties(self):
+        """Schedule jobs for every county that is due for scraping."""
+        async with self.db_pool.acquire() as conn:
+            scheduled = await conn.fetchval("SELECT schedule_due_county_scrapes()")
+
+        if scheduled:
+            self.logger.info("Scheduled county scrapes", count=scheduled)
+
     async def schedule_nationwide_sources(self):
-        """Schedule jobs for nationwide aggregator sources."""
+        """Fan nationwide aggregator sources out over every state."""
         async with self.db_pool.acquire() as conn:
             # Get active nationwide sources
             sources = await conn.fetch(
                 """
-                SELECT id, name, scraper_class
+                SELECT id, name, scraper_class, rate_limit_requests
                 FROM scrape_sources
                 WHERE is_active = TRUE
                   AND 'ALL' = ANY(states_covered)
@@ -419,24 +609,53 @@ class JobScheduler:
                 )
 
                 if not existing:
-                    # Schedule for each state
-                    from ..sources.registry import US_STATES
-                    for state_abbr in list(US_STATES.keys())[:10]:  # Start with 10 states
-                        await conn.execute(
-                            """
-                            INSERT INTO scrape_jobs (source_id, state_abbr, job_type, priority)
-                            VALUES ($1, $2, 'scheduled', 5)
-                            """,
-                            source["id"],
-                            state_abbr,
+                    plan = plan_source_fanout(source["rate_limit_requests"])
+                    states = [state_abbr for state_abbr, _ in plan]
+                    offsets = [offset for _, offset in plan]
+
+                    # One multi-row insert, staggered relative to the DB clock
+                    await conn.execute(
+                        """
+                        INSERT INTO scrape_jobs (
+                            source_id, state_abbr, job_type, priority, scheduled_for
                         )
+                        SELECT $1, plan.state_abbr, 'scheduled', 5,
+                               NOW() + make_interval(secs => plan.offset_seconds)
+                        FROM unnest($2::text[], $3::float8[])
+                            AS plan(state_abbr, offset_seconds)
+                        """,
+                        source["id"],
+                        states,
+                        offsets,
+                    )
 
                     self.logger.info(
                         "Scheduled nationwide source",
                         source=source["name"],
+                        states=len(states),
+                        spread_minutes=round(offsets[-1] / 60, 1) if offsets else 0,
                     )
 
 
+def plan_source_fanout(
+    rate_limit: Optional[int],
+    states: Optional[list[str]] = None,
+    requests_per_job: Optional[int] = None,
+) -> list[tuple[str, float]]:
+    """Spread one source's state jobs so the whole fleet stays within its rate limit.
+
+    Each state job is assumed to issue `requests_per_job` requests, so
+    consecutive jobs are spaced `requests_per_job * 60 / rate_limit`
+    seconds apart. Returns (state_abbr, offset_seconds) pairs.
+    """
+    rate_limit = rate_limit if rate_limit and rate_limit > 0 else config.scraper.default_rate_limit
+    requests_per_job = requests_per_job or config.scraper.fanout_requests_per_job
+    states = states if states is not None else list(US_STATES.keys())
+
+    spacing = requests_per_job * 60.0 / rate_limit
+    return [(state_abbr, i * spacing) for i, state_abbr in enumerate(states)]
+
+
 async def run_worker():
     """Entry point for running the job worker."""
     worker = JobWorker()
@@ -454,5 +673,9 @@ if __name__ == "__main__":
 
     if len(sys.argv) > 1 and sys.argv[1] == "scheduler":
         asyncio.run(run_scheduler())
+    elif len(sys.argv) > 1 and sys.argv[1] == "reparse":
+        from .reparse import run_reparse
+
+        asyncio.run(run_reparse(sys.argv[2:]))
     else:
         asyncio.run(run_worker())
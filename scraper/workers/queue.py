@@ -0,0 +1,677 @@
+"""
+Scrape Job Queues
+Pluggable backends that JobWorker claims jobs from and reports outcomes to.
+"""
+
+import asyncio
+import json
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Mapping, Optional
+from uuid import UUID
+
+import asyncpg
+import structlog
+
+from ..config import config
+
+logger = structlog.get_logger()
+
+# Floor on idle sleeps, so a job due any moment doesn't spin the claim loop
+MIN_IDLE_TIMEOUT = 0.5
+
+
+class LeaseLost(Exception):
+    """A job outcome arrived from a worker that no longer owns the job."""
+
+
+def encode_timings(timings: Optional[dict[str, float]]) -> Optional[str]:
+    """Phase timings as a JSONB parameter (None leaves the column untouched)."""
+    return json.dumps(timings) if timings else None
+
+
+async def complete_job(
+    conn: asyncpg.Connection,
+    job_id: UUID,
+    leads_found: int,
+    leads_new: int,
+    leads_updated: int,
+    timings: Optional[dict[str, float]] = None,
+    worker_id: Optional[str] = None,
+    error: Optional[str] = None,
+):
+    """Mark job as completed and roll its counts into the county stats.
+
+    `error` records non-fatal failures of a run that still saved its leads.
+    With `worker_id`, only a running job still owned by that worker is
+    updated; otherwise LeaseLost is raised and nothing is written.
+    """
+    status = await conn.execute(
+        """
+        UPDATE scrape_jobs SET
+            status = 'completed',
+            completed_at = NOW(),
+            lease_expires_at = NULL,
+            leads_found = $2,
+            leads_new = $3,
+            leads_updated = $4,
+            timings = COALESCE($5::jsonb, timings),
+            error_message = $7
+        WHERE id = $1
+          AND ($6::text IS NULL OR (worker_id = $6 AND status = 'running'))
+        """,
+        job_id,
+        leads_found,
+        leads_new,
+        leads_updated,
+        encode_timings(timings),
+        worker_id,
+        error,
+    )
+    if worker_id and status == "UPDATE 0":
+        raise LeaseLost(job_id)
+
+    # Update county stats if applicable
+    if leads_found > 0:
+        await conn.execute(
+            """
+            UPDATE counties SET
+                last_scraped_at = NOW(),
+                last_successful_scrape = NOW(),
+                consecutive_failures = 0,
+                total_leads_found = total_leads_found + $2,
+                leads_this_month = leads_this_month + $2
+            WHERE id = (SELECT county_id FROM scrape_jobs WHERE id = $1)
+            """,
+            job_id,
+            leads_new,
+        )
+
+
+async def fail_job(
+    conn: asyncpg.Connection,
+    job_id: UUID,
+    error: str,
+    timings: Optional[dict[str, float]] = None,
+    worker_id: Optional[str] = None,
+) -> Optional[int]:
+    """Fail a job, requeueing it with exponential backoff while attempts remain.
+
+    Returns the retry delay in seconds, or None if the job failed for good.
+    With `worker_id`, raises LeaseLost unless that worker still owns the
+    running job.
+    """
+    job = await conn.fetchrow(
+        "SELECT attempt_number, max_attempts, worker_id, status FROM scrape_jobs WHERE id = $1",
+        job_id
+    )
+    if worker_id and (job is None or job["worker_id"] != worker_id or job["status"] != "running"):
+        raise LeaseLost(job_id)
+
+    if job and job["attempt_number"] < job["max_attempts"]:
+        # Schedule retry with exponential backoff
+        retry_delay = 60 * (2 ** job["attempt_number"])  # 1m, 2m, 4m, etc.
+        status = await conn.execute(
+            """
+            UPDATE scrape_jobs SET
+                status = 'pending',
+                worker_id = NULL,
+                lease_expires_at = NULL,
+                attempt_number = attempt_number + 1,
+                next_retry_at = NOW() + ($2 || ' seconds')::INTERVAL,
+                error_message = $3,
+                timings = COALESCE($4::jsonb, timings)
+            WHERE id = $1
+              AND ($5::text IS NULL OR (worker_id = $5 AND status = 'running'))
+            """,
+            job_id,
+            str(retry_delay),
+            error,
+            encode_timings(timings),
+            worker_id,
+        )
+        if worker_id and status == "UPDATE 0":
+            raise LeaseLost(job_id)
+        return retry_delay
+
+    # Max retries exceeded
+    status = await conn.execute(
+        """
+        UPDATE scrape_jobs SET
+            status = 'failed',
+            completed_at = NOW(),
+            lease_expires_at = NULL,
+            error_message = $2,
+            timings = COALESCE($3::jsonb, timings)
+        WHERE id = $1
+          AND ($4::text IS NULL OR (worker_id = $4 AND status = 'running'))
+        """,
+        job_id,
+        error,
+        encode_timings(timings),
+        worker_id,
+    )
+    if worker_id and status == "UPDATE 0":
+        raise LeaseLost(job_id)
+
+    # Increment county failure count
+    await conn.execute(
+        """
+        UPDATE counties SET
+            consecutive_failures = consecutive_failures + 1,
+            last_scraped_at = NOW()
+        WHERE id = (SELECT county_id FROM scrape_jobs WHERE id = $1)
+        """,
+        job_id,
+    )
+    return None
+
+
+async def claim_from_table(conn: asyncpg.Connection, owner: str, limit: int, lease_seconds: int) -> list[asyncpg.Record]:
+    """Claim up to `limit` pending scrape_jobs rows, joined with source and county."""
+    return await conn.fetch(
+        "SELECT * FROM get_next_scrape_jobs($1, $2, $3)",
+        owner,
+        limit,
+        lease_seconds,
+    )
+
+
+async def next_job_due_in(conn: asyncpg.Connection) -> Optional[float]:
+    """Seconds until the earliest deferred pending job becomes claimable, or None.
+
+    Jobs held back by scheduled_for / next_retry_at send no NOTIFY when they
+    come due, so idle loops sleep at most this long.
+    """
+    return await conn.fetchval("SELECT next_scrape_job_due_in()")
+
+
+def idle_timeout(poll_interval: float, due_in: Optional[float]) -> float:
+    """The poll interval, shortened to wake for the next deferred job."""
+    if due_in is None:
+        return poll_interval
+    return min(poll_interval, max(due_in, MIN_IDLE_TIMEOUT))
+
+
+class JobQueue(ABC):
+    """Where a worker claims scrape jobs and reports their outcome.
+
+    Claimed jobs are mappings with the columns returned by
+    get_next_scrape_jobs (id, state_abbr, county_id, scraper_class, ...).
+    """
+
+    def __init__(self, db_pool: asyncpg.Pool, worker_id: str):
+        self.db_pool = db_pool
+        self.worker_id = worker_id
+        self.logger = logger.bind(worker_id=worker_id, queue=type(self).__name__)
+
+    @property
+    def poll_interval(self) -> float:
+        """Safety-net seconds between claim attempts while idle."""
+        return config.scraper.queue_poll_interval
+
+    async def wait_timeout(self) -> float:
+        """Seconds to sleep while idle before trying to claim again."""
+        return self.poll_interval
+
+    @abstractmethod
+    async def start(self, wakeup: Callable[[], None]):
+        """Connect, calling `wakeup` whenever new jobs may be claimable."""
+
+    @abstractmethod
+    async def close(self):
+        """Flush pending writes and release connections."""
+
+    @abstractmethod
+    async def claim(self, limit: int) -> list[Mapping[str, Any]]:
+        """Claim up to `limit` jobs for this worker."""
+
+    @abstractmethod
+    async def renew(self, job_ids: list[UUID]) -> set[UUID]:
+        """Extend ownership of in-flight jobs. Returns the ids no longer owned."""
+
+    @abstractmethod
+    async def complete(
+        self, job_id: UUID, leads_found: int, leads_new: int, leads_updated: int,
+        timings: Optional[dict[str, float]] = None, error: Optional[str] = None,
+    ):
+        """Record a finished job, with its seconds per phase and any non-fatal errors."""
+
+    @abstractmethod
+    async def fail(self, job_id: UUID, error: str, timings: Optional[dict[str, float]] = None):
+        """Record a failed job, requeueing it if attempts remain."""
+
+
+class PostgresJobQueue(JobQueue):
+    """Queue backed directly by the scrape_jobs table, woken by LISTEN/NOTIFY."""
+
+    def __init__(self, db_pool: asyncpg.Pool, worker_id: str):
+        super().__init__(db_pool, worker_id)
+        self.listener_conn: Optional[asyncpg.Connection] = None
+        self._wakeup: Callable[[], None] = lambda: None
+
+    @property
+    def poll_interval(self) -> float:
+        """Short only while NOTIFY is unavailable."""
+        if self.listener_conn is None or self.listener_conn.is_closed():
+            return 10
+        return config.scraper.queue_poll_interval
+
+    async def wait_timeout(self) -> float:
+        """The poll interval, or less if a deferred job comes due sooner."""
+        try:
+            async with self.db_pool.acquire() as conn:
+                due_in = await next_job_due_in(conn)
+        except (OSError, asyncpg.PostgresError) as e:
+            self.logger.warning("Next due job lookup failed", error=str(e))
+            due_in = None
+        return idle_timeout(self.poll_interval, due_in)
+
+    async def start(self, wakeup: Callable[[], None]):
+        self._wakeup = wakeup
+        await self.start_listener()
+
+    async def close(self):
+        """Close the LISTEN connection."""
+        if self.listener_conn and not self.listener_conn.is_closed():
+            self.listener_conn.remove_termination_listener(self.on_listener_terminated)
+            await self.listener_conn.close()
+        self.listener_conn = None
+
+    async def start_listener(self):
+        """Open a dedicated connection that LISTENs for newly pending jobs."""
+        try:
+            self.listener_conn = await asyncpg.connect(config.database.connection_string)
+            await self.listener_conn.add_listener(
+                config.scraper.queue_notify_channel, self.on_job_notification
+            )
+            self.listener_conn.add_termination_listener(self.on_listener_terminated)
+            self.logger.info("Listening for job notifications")
+        except (OSError, asyncpg.PostgresError) as e:
+            # Fall back to short polling until the listener can reconnect
+            self.logger.warning("Job listener unavailable, polling instead", error=str(e))
+            self.listener_conn = None
+
+    def on_job_notification(self, connection, pid, channel, payload):
+        """Wake the worker loop when a job becomes claimable."""
+        self._wakeup()
+
+    def on_listener_terminated(self, connection):
+        """Drop the dead listener; the next claim reconnects it."""
+        self.logger.warning("Job listener connection lost")
+        self.listener_conn = None
+        self._wakeup()
+
+    async def claim(self, limit: int) -> list[asyncpg.Record]:
+        if self.listener_conn is None or self.listener_conn.is_closed():
+            await self.start_listener()
+
+        async with self.db_pool.acquire() as conn:
+            return await claim_from_table(conn, self.worker_id, limit, config.scraper.job_lease_seconds)
+
+    async def renew(self, job_ids: list[UUID]) -> set[UUID]:
+        async with self.db_pool.acquire() as conn:
+            renewed = await conn.fetch(
+                """
+                UPDATE scrape_jobs SET
+                    heartbeat_at = NOW(),
+                    lease_expires_at = NOW() + make_interval(secs => $3)
+                WHERE id = ANY($1::uuid[])
+                  AND worker_id = $2
+                  AND status = 'running'
+                RETURNING id
+                """,
+                job_ids,
+                self.worker_id,
+                config.scraper.job_lease_seconds,
+            )
+        return set(job_ids) - {row["id"] for row in renewed}
+
+    async def complete(
+        self, job_id: UUID, leads_found: int, leads_new: int, leads_updated: int,
+        timings: Optional[dict[str, float]] = None, error: Optional[str] = None,
+    ):
+        try:
+            async with self.db_pool.acquire() as conn:
+                await complete_job(
+                    conn, job_id, leads_found, leads_new, leads_updated, timings, self.worker_id, error,
+                )
+        except LeaseLost:
+            self.logger.warning("Lease lost, dropping job result", job_id=str(job_id))
+
+    async def fail(self, job_id: UUID, error: str, timings: Optional[dict[str, float]] = None):
+        try:
+            async with self.db_pool.acquire() as conn:
+                retry_delay = await fail_job(conn, job_id, error, timings, self.worker_id)
+        except LeaseLost:
+            self.logger.warning("Lease lost, dropping job failure", job_id=str(job_id))
+            return
+
+        if retry_delay is not None:
+            self.logger.info(
+                "Job scheduled for retry",
+                job_id=str(job_id),
+                retry_delay=retry_delay,
+            )
+
+
+class JobAuditWriter:
+    """Buffers scrape_jobs status writes and flushes them to Postgres in batches."""
+
+    def __init__(self, db_pool: asyncpg.Pool, interval: float):
+        self.db_pool = db_pool
+        self.interval = interval
+        self._leases: dict[UUID, str] = {}
+        self._completed: list[tuple[UUID, int, int, int, Optional[dict], str, Optional[str]]] = []
+        self._failed: list[tuple[UUID, str, Optional[dict], str]] = []
+        self._task: Optional[asyncio.Task] = None
+        self.logger = logger.bind(component="job_audit")
+
+    def start(self):
+        self._task = asyncio.create_task(self._flush_loop(), name="job-audit-writer")
+
+    async def close(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+
+    def leased(self, job_ids: list[UUID], worker_id: str):
+        for job_id in job_ids:
+            self._leases[job_id] = worker_id
+
+    def completed(
+        self, job_id: UUID, leads_found: int, leads_new: int, leads_updated: int,
+        timings: Optional[dict[str, float]], worker_id: str, error: Optional[str] = None,
+    ):
+        self._completed.append((job_id, leads_found, leads_new, leads_updated, timings, worker_id, error))
+
+    def failed(self, job_id: UUID, error: str, timings: Optional[dict[str, float]], worker_id: str):
+        self._failed.append((job_id, error, timings, worker_id))
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                self.logger.warning("Job audit flush failed", error=str(e))
+
+    async def flush(self):
+        """Write everything buffered so far in one transaction."""
+        leases, self._leases = self._leases, {}
+        completed, self._completed = self._completed, []
+        failed, self._failed = self._failed, []
+        if not (leases or completed or failed):
+            return
+
+        try:
+            async with self.db_pool.acquire() as conn:
+                async with conn.transaction():
+                    if leases:
+                        await conn.execute(
+                            """
+                            UPDATE scrape_jobs j SET
+                                worker_id = l.worker_id,
+                                heartbeat_at = NOW(),
+                                lease_expires_at = NOW() + make_interval(secs => $3)
+                            FROM unnest($1::uuid[], $2::text[]) AS l(id, worker_id)
+                            WHERE j.id = l.id AND j.status = 'running'
+                            """,
+                            list(leases),
+                            list(leases.values()),
+                            config.scraper.job_lease_seconds,
+                        )
+                    # A guarded write that matches no row is a no-op, so the transaction stays usable
+                    for job_id, leads_found, leads_new, leads_updated, timings, worker_id, error in completed:
+                        try:
+                            await complete_job(
+                                conn, job_id, leads_found, leads_new, leads_updated, timings, worker_id, error,
+                            )
+                        except LeaseLost:
+                            self.logger.warning("Lease lost, dropping job result", job_id=str(job_id))
+                    for job_id, error, timings, worker_id in failed:
+                        try:
+                            await fail_job(conn, job_id, error, timings, worker_id)
+                        except LeaseLost:
+                            self.logger.warning("Lease lost, dropping job failure", job_id=str(job_id))
+        except Exception:
+            # Keep the batch for the next flush; newer lease owners win
+            self._leases = {**leases, **self._leases}
+            self._completed = completed + self._completed
+            self._failed = failed + self._failed
+            raise
+
+
+def encode_job(job: Mapping[str, Any]) -> dict[str, str]:
+    """Serialize a claimed job row into Redis stream fields."""
+    return {"job": json.dumps(dict(job), default=str)}
+
+
+def decode_job(fields: Mapping[str, str]) -> dict[str, Any]:
+    """Inverse of encode_job."""
+    job = json.loads(fields["job"])
+    for key in ("id", "source_id", "county_id"):
+        if job.get(key):
+            job[key] = UUID(job[key])
+    return job
+
+
+class RedisStreamJobQueue(JobQueue):
+    """Queue backed by a Redis Stream consumer group.
+
+    The scheduler moves claimable scrape_jobs rows into the stream with
+    dispatch(). Workers read through the consumer group, so claims, heartbeats
+    and acks never touch Postgres. Entries whose consumer stops heartbeating
+    are reclaimed with XAUTOCLAIM after the job lease. scrape_jobs stays the
+    durable record; the audit writer updates it in batches.
+
+    While a job is in the stream (waiting or pending) Redis is responsible
+    for it, so the dispatcher keeps its scrape_jobs lease renewed and the
+    Postgres lease reaper never requeues it behind Redis's back. A job is
+    only delivered twice if Redis loses the entry or the dispatcher stops.
+    """
+
+    def __init__(self, db_pool: asyncpg.Pool, worker_id: str):
+        super().__init__(db_pool, worker_id)
+        self.stream = config.redis.job_stream
+        self.group = config.redis.job_group
+        self.redis = None
+        self.audit = JobAuditWriter(db_pool, config.redis.audit_flush_interval)
+        self._entries: dict[UUID, str] = {}
+        self._watcher: Optional[asyncio.Task] = None
+        self._stream_leases_renewed = 0.0
+
+    @property
+    def lease_ms(self) -> int:
+        return config.scraper.job_lease_seconds * 1000
+
+    async def connect(self):
+        """Open the Redis client and make sure the consumer group exists."""
+        import redis.asyncio as redis
+        from redis.exceptions import ResponseError
+
+        self.redis = redis.from_url(config.redis.url, decode_responses=True)
+        try:
+            await self.redis.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def start(self, wakeup: Callable[[], None]):
+        await self.connect()
+        self.audit.start()
+        self._watcher = asyncio.create_task(self._watch_stream(wakeup), name="job-stream-watcher")
+
+    async def close(self):
+        if self._watcher:
+            self._watcher.cancel()
+            self._watcher = None
+        await self.audit.close()
+        if self.redis is not None:
+            await self.redis.aclose()
+            self.redis = None
+
+    async def _watch_stream(self, wakeup: Callable[[], None]):
+        """Wake the worker when entries are appended (XREAD doesn't consume them)."""
+        last_id = "$"
+        while True:
+            try:
+                response = await self.redis.xread(
+                    {self.stream: last_id},
+                    count=100,
+                    block=int(self.poll_interval * 1000),
+                )
+                if response:
+                    last_id = response[0][1][-1][0]
+                    wakeup()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning("Job stream watch failed", error=str(e))
+                await asyncio.sleep(5)
+
+    async def claim(self, limit: int) -> list[dict[str, Any]]:
+        # Reclaim entries from consumers that stopped heartbeating first
+        reclaimed = await self.redis.xautoclaim(
+            self.stream,
+            self.group,
+            self.worker_id,
+            min_idle_time=self.lease_ms,
+            start_id="0-0",
+            count=limit,
+        )
+        entries = [entry for entry in reclaimed[1] if entry and entry[1]]
+
+        if len(entries) < limit:
+            response = await self.redis.xreadgroup(
+                self.group,
+                self.worker_id,
+                {self.stream: ">"},
+                count=limit - len(entries),
+            )
+            for _, stream_entries in response or []:
+                entries.extend(stream_entries)
+
+        jobs = []
+        for entry_id, fields in entries:
+            job = decode_job(fields)
+            if job["id"] in self._entries:
+                continue  # already running here
+            # Time spent in the stream, on top of the table wait measured at dispatch
+            stream_wait = max(0.0, time.time() - int(entry_id.split("-")[0]) / 1000)
+            job["queue_wait_seconds"] = (job.get("queue_wait_seconds") or 0) + stream_wait
+            self._entries[job["id"]] = entry_id
+            jobs.append(job)
+
+        if jobs:
+            self.audit.leased([job["id"] for job in jobs], self.worker_id)
+        return jobs
+
+    async def renew(self, job_ids: list[UUID]) -> set[UUID]:
+        # Only touch entries this consumer still owns; XCLAIM would steal others
+        owned = await self.redis.xpending_range(
+            self.stream,
+            self.group,
+            min="-",
+            max="+",
+            count=max(len(self._entries), 1) * 2,
+            consumername=self.worker_id,
+        )
+        owned_ids = {entry["message_id"] for entry in owned}
+        renewing = {
+            job_id: entry_id
+            for job_id, entry_id in self._entries.items()
+            if job_id in job_ids and entry_id in owned_ids
+        }
+
+        if renewing:
+            # Re-claiming to ourselves resets the entry's idle time
+            await self.redis.xclaim(
+                self.stream,
+                self.group,
+                self.worker_id,
+                min_idle_time=0,
+                message_ids=list(renewing.values()),
+                justid=True,
+            )
+            self.audit.leased(list(renewing), self.worker_id)
+
+        lost = set(job_ids) - set(renewing)
+        for job_id in lost:
+            # Another consumer owns the entry now; never ack it from here
+            self._entries.pop(job_id, None)
+        return lost
+
+    async def _ack(self, job_id: UUID):
+        entry_id = self._entries.pop(job_id, None)
+        if entry_id is None:
+            return
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.xack(self.stream, self.group, entry_id)
+            pipe.xdel(self.stream, entry_id)
+            await pipe.execute()
+
+    async def complete(
+        self, job_id: UUID, leads_found: int, leads_new: int, leads_updated: int,
+        timings: Optional[dict[str, float]] = None, error: Optional[str] = None,
+    ):
+        await self._ack(job_id)
+        self.audit.completed(job_id, leads_found, leads_new, leads_updated, timings, self.worker_id, error)
+
+    async def fail(self, job_id: UUID, error: str, timings: Optional[dict[str, float]] = None):
+        # Retry/backoff lives in scrape_jobs; the scheduler re-dispatches when due
+        await self._ack(job_id)
+        self.audit.failed(job_id, error, timings, self.worker_id)
+
+    async def renew_stream_leases(self, conn: asyncpg.Connection) -> int:
+        """Extend the scrape_jobs lease of every job still in the stream."""
+        entries = await self.redis.xrange(self.stream, "-", "+")
+        job_ids = [decode_job(fields)["id"] for _, fields in entries]
+        if not job_ids:
+            return 0
+        status = await conn.execute(
+            """
+            UPDATE scrape_jobs SET
+                heartbeat_at = NOW(),
+                lease_expires_at = NOW() + make_interval(secs => $2)
+            WHERE id = ANY($1::uuid[])
+              AND status = 'running'
+            """,
+            job_ids,
+            config.redis.dispatch_lease_seconds,
+        )
+        return int(status.split()[-1])
+
+    async def dispatch(self, conn: asyncpg.Connection) -> int:
+        """Move claimable scrape_jobs rows into the stream, up to the backlog cap.
+
+        Also renews the leases of jobs already in the stream, once per heartbeat interval.
+        """
+        if time.monotonic() - self._stream_leases_renewed >= config.scraper.heartbeat_interval:
+            await self.renew_stream_leases(conn)
+            self._stream_leases_renewed = time.monotonic()
+
+        room = config.redis.stream_max_backlog - await self.redis.xlen(self.stream)
+        if room <= 0:
+            return 0
+
+        jobs = await claim_from_table(conn, self.worker_id, room, config.redis.dispatch_lease_seconds)
+        if not jobs:
+            return 0
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for job in jobs:
+                pipe.xadd(self.stream, encode_job(job))
+            await pipe.execute()
+        return len(jobs)
+
+
+def create_job_queue(db_pool: asyncpg.Pool, worker_id: str) -> JobQueue:
+    """Build the queue backend selected by config.scraper.queue_backend."""
+    backend = config.scraper.queue_backend.lower()
+    if backend == "redis":
+        return RedisStreamJobQueue(db_pool, worker_id)
+    if backend == "postgres":
+        return PostgresJobQueue(db_pool, worker_id)
+    raise ValueError(f"Unknown queue backend: {config.scraper.queue_backend}")
@@ -0,0 +1,389 @@
+"""
+Offline Re-parse
+Streams archived pages for a source and date range through the current
+parser, fanned out over a process pool, and bulk-upserts the corrected
+leads with a field-level diff report. Nothing is fetched, so target sites'
+rate limits are never touched.
+
+A lead's id is derived from its address and sale date, so a parser fix to
+either field gives the lead a new id. Such re-keyed leads (matched to the
+stored lead by source and case number or parcel id) are reported
+separately and not written, since upserting them would duplicate the lead.
+
+Usage:
+    python -m scraper.workers.job_worker reparse --source RealAuctionScraper \
+        --since 2026-01-01 [--until 2026-04-01] [--dry-run]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Optional
+
+import asyncpg
+import structlog
+
+from ..config import config
+from ..scrapers.base import parse_json_page_job, parse_page_job
+from ..scrapers.leads import LeadBatch
+from ..utils.page_archive import SegmentStore, decompress
+from .job_worker import DEFAULT_SCRAPER, LEAD_COLUMNS, SCRAPERS, upsert_leads
+
+logger = structlog.get_logger()
+
+
+# Columns a parser fix may correct on an existing lead. Identity, provenance
+# and skip-trace columns (owner_name) are never rewritten by a re-parse.
+REPARSE_COLUMNS = (
+    "city", "state", "zip_code", "parcel_id", "case_number",
+    "sale_date", "sale_amount", "lender_name", "trustee_name", "foreclosure_type",
+)
+
+_REPARSE_SET_SQL = ",\n            ".join(
+    f"{column} = COALESCE(EXCLUDED.{column}, foreclosure_leads.{column})" for column in REPARSE_COLUMNS
+)
+
+REPARSE_UPSERT_LEADS_SQL = f"""
+    WITH upserted AS (
+        INSERT INTO foreclosure_leads ({", ".join(LEAD_COLUMNS)}, scraped_at)
+        SELECT {", ".join(LEAD_COLUMNS)}, NOW() FROM foreclosure_leads_stage
+        ON CONFLICT (id) DO UPDATE SET
+            {_REPARSE_SET_SQL},
+            last_updated = NOW()
+        RETURNING (xmax = 0) AS inserted
+    )
+    SELECT
+        COUNT(*) FILTER (WHERE inserted) AS new_count,
+        COUNT(*) FILTER (WHERE NOT inserted) AS updated_count
+    FROM upserted
+"""
+
+# Latest fetch of each distinct archived HTML/JSON body for a scraper class.
+# The class is resolved the way the worker picks it: the page's (or its
+# job's) source, falling back to DEFAULT_SCRAPER for county jobs and
+# sources without an implemented scraper.
+ARCHIVED_PAGES_SQL = """
+    SELECT DISTINCT ON (r.content_sha256)
+        r.content_sha256, r.content_type, r.page_url,
+        COALESCE(j.state_abbr, co.state_abbr) AS state_abbr, j.county_id,
+        b.storage, b.data, b.segment, b.segment_offset, b.compressed_bytes
+    FROM raw_scraped_data r
+    JOIN raw_page_blobs b ON b.content_sha256 = r.content_sha256
+    LEFT JOIN scrape_jobs j ON j.id = r.job_id
+    LEFT JOIN counties co ON co.id = j.county_id
+    LEFT JOIN scrape_sources s ON s.id = COALESCE(r.source_id, j.source_id)
+    WHERE CASE WHEN s.scraper_class = ANY($4::text[]) THEN s.scraper_class ELSE $5 END = $1
+      AND r.content_type IN ('html', 'json')
+      AND r.created_at >= $2
+      AND r.created_at < $3
+    ORDER BY r.content_sha256, r.created_at DESC
+"""
+
+# Stored leads a re-parsed lead may have been saved as under its old id
+REKEYED_LEADS_SQL = """
+    SELECT id, source, case_number, parcel_id
+    FROM foreclosure_leads
+    WHERE source = ANY($1::text[])
+      AND (case_number = ANY($2::text[]) OR parcel_id = ANY($3::text[]))
+      AND NOT (id = ANY($4::text[]))
+"""
+
+
+def reparse_page_job(
+    scraper_class: type,
+    scraper_kwargs: dict,
+    backend: str,
+    blob: bytes,
+    content_type: str = "html",
+) -> tuple[LeadBatch, Optional[str], dict[str, int]]:
+    """Process-pool entry point: decompress an archived page and parse it."""
+    body = decompress(blob).decode("utf-8", errors="replace")
+    if content_type == "json":
+        return parse_json_page_job(scraper_class, scraper_kwargs, body)
+    return parse_page_job(scraper_class, scraper_kwargs, backend, body)
+
+
+def match_keys(source: Any, case_number: Any, parcel_id: Any) -> list[tuple]:
+    """Keys identifying the same listing across ids (case number, then parcel)."""
+    keys = []
+    if case_number:
+        keys.append((source, "case", case_number))
+    if parcel_id:
+        keys.append((source, "parcel", parcel_id))
+    return keys
+
+
+def comparable(value: Any) -> Any:
+    """Normalize DB and model values so equal fields compare equal."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float, Decimal)):
+        return round(float(value), 2)
+    return str(value)
+
+
+class ReparseReport:
+    """Counts and sample field-level diffs for one re-parse run."""
+
+    SAMPLE_DIFFS = 20
+
+    def __init__(self):
+        self.pages = 0
+        self.failed_pages = 0
+        self.leads = 0
+        self.new_leads = 0
+        self.rekeyed_leads = 0
+        self.changed_leads = 0
+        self.field_changes: Counter = Counter()
+        self.unparseable_dates: Counter = Counter()
+        self.samples: list[tuple[str, str, Any, Any]] = []
+        self.rekeyed_samples: list[tuple[str, str]] = []
+
+    def record(self, existing: dict[str, asyncpg.Record], leads: LeadBatch, rekeyed: dict[str, str]):
+        for lead in leads:
+            row = existing.get(lead.id)
+            if row is None:
+                if lead.id in rekeyed:
+                    self.rekeyed_leads += 1
+                    if len(self.rekeyed_samples) < self.SAMPLE_DIFFS:
+                        self.rekeyed_samples.append((rekeyed[lead.id], lead.id))
+                else:
+                    self.new_leads += 1
+                continue
+
+            changed = False
+            for column in REPARSE_COLUMNS:
+                new = comparable(getattr(lead, column))
+                old = comparable(row[column])
+                if new is not None and new != old:
+                    changed = True
+                    self.field_changes[column] += 1
+                    if len(self.samples) < self.SAMPLE_DIFFS:
+                        self.samples.append((lead.id, column, row[column], getattr(lead, column)))
+            self.changed_leads += changed
+
+    def print(self):
+        print(f"\nPages re-parsed: {self.pages} ({self.failed_pages} failed)")
+        print(f"Leads parsed:    {self.leads}")
+        print(f"New lead ids:    {self.new_leads}")
+        print(f"Re-keyed leads:  {self.rekeyed_leads} (not written)")
+        print(f"Leads changed:   {self.changed_leads}")
+        print(f"Bad sale dates:  {sum(self.unparseable_dates.values())}")
+        if self.field_changes:
+            print("\nChanges by field:")
+            for column, count in self.field_changes.most_common():
+                print(f"  {column:<18}{count:>8}")
+        if self.samples:
+            print("\nSample diffs:")
+            for lead_id, column, old, new in self.samples:
+                print(f"  {lead_id} {column}: {old!r} -> {new!r}")
+        if self.rekeyed_samples:
+            print("\nRe-keyed leads (stored id -> re-parsed id):")
+            for old_id, new_id in self.rekeyed_samples:
+                print(f"  {old_id} -> {new_id}")
+        if self.unparseable_dates:
+            print("\nUnparseable sale dates:")
+            for value, count in self.unparseable_dates.most_common(self.SAMPLE_DIFFS):
+                print(f"  {count:>6}  {value!r}")
+
+
+class Reparser:
+    """Re-parses archived pages of one scraper class and writes corrected leads."""
+
+    def __init__(
+        self,
+        scraper_class_name: str,
+        since: datetime,
+        until: datetime,
+        workers: Optional[int] = None,
+        batch_size: int = 1000,
+        dry_run: bool = False,
+    ):
+        if scraper_class_name not in SCRAPERS:
+            raise ValueError(f"Unknown scraper class: {scraper_class_name}")
+        self.scraper_class_name = scraper_class_name
+        self.scraper_class = SCRAPERS[scraper_class_name]
+        self.since = since
+        self.until = until
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.batch_id = f"reparse_{datetime.utcnow():%Y%m%d_%H%M%S}"
+        self.report = ReparseReport()
+        self.segments = SegmentStore()
+        self.logger = logger.bind(component="reparse", scraper=scraper_class_name)
+
+    async def run(self) -> ReparseReport:
+        db_pool = await asyncpg.create_pool(config.database.connection_string, min_size=2, max_size=4)
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+        self.logger.info("Starting re-parse", since=str(self.since), until=str(self.until), workers=self.workers)
+
+        try:
+            await self.reparse_pages(db_pool, executor)
+        finally:
+            executor.shutdown(cancel_futures=True)
+            await db_pool.close()
+
+        self.logger.info(
+            "Re-parse complete",
+            pages=self.report.pages,
+            leads=self.report.leads,
+            changed=self.report.changed_leads,
+            new=self.report.new_leads,
+            rekeyed=self.report.rekeyed_leads,
+        )
+        return self.report
+
+    async def reparse_pages(self, db_pool: asyncpg.Pool, executor: ProcessPoolExecutor):
+        loop = asyncio.get_running_loop()
+        in_flight: set[asyncio.Future] = set()
+        pending = LeadBatch()
+        backend = config.scraper.parser_backend
+
+        async def collect(done: set[asyncio.Future]):
+            nonlocal pending
+            for future in done:
+                try:
+                    leads, _, unparseable_dates = future.result()
+                except Exception as e:
+                    self.report.failed_pages += 1
+                    self.logger.warning("Archived page failed to parse", error=str(e))
+                    continue
+                pending.extend(leads)
+                self.report.unparseable_dates.update(unparseable_dates)
+            if len(pending) >= self.batch_size:
+                await self.flush(db_pool, pending)
+                pending = LeadBatch()
+
+        # Pages stream from a server-side cursor; at most 2x workers pages are in flight
+        async with db_pool.acquire() as conn:
+            async with conn.transaction():
+                async for page in conn.cursor(
+                    ARCHIVED_PAGES_SQL, self.scraper_class_name, self.since, self.until,
+                    list(SCRAPERS), DEFAULT_SCRAPER,
+                ):
+                    blob = await self.read_blob(page)
+                    if blob is None:
+                        self.report.failed_pages += 1
+                        continue
+
+                    kwargs = {
+                        "state_abbr": page["state_abbr"],
+                        "county_id": page["county_id"],
+                        "batch_id": self.batch_id,
+                        **self.scraper_class.archived_page_kwargs(page["page_url"]),
+                    }
+                    in_flight.add(loop.run_in_executor(
+                        executor, reparse_page_job, self.scraper_class, kwargs, backend, blob,
+                        page["content_type"],
+                    ))
+                    self.report.pages += 1
+
+                    if len(in_flight) >= self.workers * 2:
+                        done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                        await collect(done)
+
+        if in_flight:
+            done, _ = await asyncio.wait(in_flight)
+            await collect(done)
+        if len(pending):
+            await self.flush(db_pool, pending)
+
+    async def read_blob(self, page: asyncpg.Record) -> Optional[bytes]:
+        if page["storage"] == "db":
+            return page["data"]
+        try:
+            return await asyncio.to_thread(
+                self.segments.read, page["segment"], page["segment_offset"], page["compressed_bytes"]
+            )
+        except OSError as e:
+            self.logger.warning("Archived segment unreadable", segment=page["segment"], error=str(e))
+            return None
+
+    async def flush(self, db_pool: asyncpg.Pool, leads: LeadBatch):
+        """Diff a batch against the stored leads, then upsert it (unless dry-run)."""
+        leads = leads.dedup()
+        self.report.leads += len(leads)
+
+        async with db_pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"SELECT id, {', '.join(REPARSE_COLUMNS)} FROM foreclosure_leads WHERE id = ANY($1::text[])",
+                leads.columns["id"],
+            )
+            existing = {row["id"]: row for row in rows}
+            rekeyed = await self.find_rekeyed(conn, leads, existing)
+            self.report.record(existing, leads, rekeyed)
+
+            if not self.dry_run:
+                if rekeyed:
+                    kept = LeadBatch()
+                    for lead in leads:
+                        if lead.id not in rekeyed:
+                            kept.append(lead)
+                    leads = kept
+                await upsert_leads(conn, leads, REPARSE_UPSERT_LEADS_SQL)
+
+    async def find_rekeyed(
+        self, conn: asyncpg.Connection, leads: LeadBatch, existing: dict[str, asyncpg.Record]
+    ) -> dict[str, str]:
+        """Re-parsed lead id -> stored id, for unknown ids matching a stored lead by case/parcel."""
+        unknown = [lead for lead in leads if lead.id not in existing]
+        if not unknown:
+            return {}
+
+        rows = await conn.fetch(
+            REKEYED_LEADS_SQL,
+            list({lead.source for lead in unknown}),
+            [lead.case_number for lead in unknown if lead.case_number],
+            [lead.parcel_id for lead in unknown if lead.parcel_id],
+            [lead.id for lead in unknown],
+        )
+        stored = {}
+        for row in rows:
+            for key in match_keys(row["source"], row["case_number"], row["parcel_id"]):
+                stored.setdefault(key, row["id"])
+
+        rekeyed = {}
+        for lead in unknown:
+            for key in match_keys(lead.source, lead.case_number, lead.parcel_id):
+                if key in stored:
+                    rekeyed[lead.id] = stored[key]
+                    break
+        return rekeyed
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="reparse", description="Re-parse archived pages with the current parser")
+    parser.add_argument("--source", required=True, choices=sorted(SCRAPERS), help="Scraper class to re-run")
+    parser.add_argument("--since", type=datetime.fromisoformat, default=None, help="Start date (default: 30 days ago)")
+    parser.add_argument("--until", type=datetime.fromisoformat, default=None, help="End date, exclusive (default: now)")
+    parser.add_argument("--workers", type=int, default=None, help="Parse processes (default: CPU cores)")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true", help="Report diffs without writing")
+    return parser.parse_args(argv)
+
+
+async def run_reparse(argv: list[str]):
+    """Entry point for the reparse command."""
+    args = parse_args(argv)
+    until = args.until or datetime.utcnow()
+    since = args.since or until - timedelta(days=30)
+
+    reparser = Reparser(
+        args.source,
+        since=since,
+        until=until,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        dry_run=args.dry_run,
+    )
+    report = await reparser.run()
+    report.print()